@@ -2,20 +2,15 @@ from __future__ import annotations
 import asyncio
 import base64
 from copy import copy
-from functools import reduce
 import logging
 from time import time, sleep
 from typing import (
-    cast,
     List,
     Dict,
     Any,
     Optional,
     Set,
-    Sequence,
     Tuple,
-    TypeVar,
-    Iterator,
 )
 from typing_extensions import Final
 from uuid import uuid4
@@ -373,7 +368,7 @@ class Session(RobotBusy):
 
         stack: List[command_types.CommandMessage] = []
         res: List[CommandShortId] = []
-        commands: List[command_types.CommandPayload] = []
+        referents = _ReferentCollector()
 
         self._containers.clear()
         self._instruments.clear()
@@ -388,7 +383,7 @@ class Session(RobotBusy):
                 level = len(stack)
 
                 stack.append(message)
-                commands.append(payload)
+                referents.add(payload)
 
                 res.append({"level": level, "description": description, "id": len(res)})
             else:
@@ -434,26 +429,12 @@ class Session(RobotBusy):
         finally:
             unsubscribe()
 
-            instruments, containers, modules, interactions = _accumulate(
-                [_get_labware(command) for command in commands]
-            )
+            referents.add_loaded(self._simulating_ctx)
 
-            self._containers.extend(_dedupe(containers))
-            self._instruments.extend(
-                _dedupe(
-                    instruments + list(self._simulating_ctx.loaded_instruments.values())
-                )
-            )
-            self._modules.extend(
-                _dedupe(
-                    modules
-                    + [
-                        m._geometry
-                        for m in self._simulating_ctx.loaded_modules.values()
-                    ]
-                )
-            )
-            self._interactions.extend(_dedupe(interactions))
+            self._containers.extend(referents.containers)
+            self._instruments.extend(referents.instruments)
+            self._modules.extend(referents.modules)
+            self._interactions.extend(referents.interactions)
 
             # Labware calibration happens after simulation and before run, so
             # we have to clear the tips if they are left on after simulation
@@ -736,49 +717,44 @@ class Session(RobotBusy):
         self._hw_iface().home_z()
 
 
-CommandReferents = Tuple[
-    List[InstrumentContext],
-    List[labware.Labware],
-    List[module_geometry.ModuleGeometry],
-    List[Tuple[InstrumentContext, labware.Labware]],
-]
-
-
-def _accumulate(iterable: Sequence[CommandReferents]) -> CommandReferents:
-    def _reducer(acc: CommandReferents, item: CommandReferents) -> CommandReferents:
-        return (acc[0] + item[0], acc[1] + item[1], acc[2] + item[2], acc[3] + item[3])
-
-    return reduce(_reducer, iterable, cast(CommandReferents, ([], [], [], [])))
-
+class _ReferentCollector:
+    """Collect the objects that simulated commands refer to.
 
-It = TypeVar("It")
+    Referents are deduped into insertion-ordered dicts as each command is
+    published, so collecting them is linear in the number of commands.
+    """
 
+    def __init__(self) -> None:
+        self.instruments: Dict[InstrumentContext, None] = {}
+        self.containers: Dict[labware.Labware, None] = {}
+        self.modules: Dict[module_geometry.ModuleGeometry, None] = {}
+        self.interactions: Dict[Tuple[InstrumentContext, labware.Labware], None] = {}
 
-def _dedupe(iterable: Sequence[It]) -> Iterator[It]:
-    acc: Set[It] = set()
+    def add(self, command: command_types.CommandPayload) -> None:
+        """Collect the referents of a single command."""
+        try:
+            instruments, containers, modules = introspection.get_referred_objects(
+                command
+            )
+        except ValueError:
+            log.exception(f"Cant handle location in command {command!r}")
+            return
 
-    for item in iterable:
-        if item not in acc:
-            acc.add(item)
-            yield item
+        self.instruments.update(dict.fromkeys(instruments))
+        self.containers.update(dict.fromkeys(containers))
+        self.modules.update(dict.fromkeys(modules))
+        for instrument in instruments:
+            for container in containers:
+                self.interactions.setdefault((instrument, container))
+
+    def add_loaded(self, ctx: ProtocolContext) -> None:
+        """Collect the instruments and modules loaded in a context, whether or
+        not any command referred to them."""
+        self.instruments.update(dict.fromkeys(ctx.loaded_instruments.values()))
+        self.modules.update(
+            dict.fromkeys(m._geometry for m in ctx.loaded_modules.values())
+        )
 
 
 def now() -> int:
     return int(time() * 1000)
-
-
-def _get_labware(command: command_types.CommandPayload) -> CommandReferents:
-    interactions: List[Tuple[InstrumentContext, labware.Labware]] = []
-
-    try:
-        instruments, containers, modules = introspection.get_referred_objects(command)
-    except ValueError:
-        log.exception(f"Cant handle location in command {command!r}")
-        instruments = []
-        containers = []
-        modules = []
-
-    for instrument in instruments:
-        interactions.extend([(instrument, container) for container in containers])
-
-    return instruments, containers, modules, interactions
@@ -124,5 +124,12 @@ class Broker:
     def publish(self, topic, message):
         [handler(message) for handler in self.subscriptions.get(topic, [])]
 
+    def has_subscribers(self, topic: str) -> bool:
+        """Check whether anything is subscribed to a topic.
+
+        Publishers can use this to skip building messages nobody will receive.
+        """
+        return bool(self.subscriptions.get(topic))
+
     def set_logger(self, logger):
         self.logger = logger
@@ -5,8 +5,12 @@ These methods should only be imported inside the calibration_storage
 module, except in the special case of v2 labware support in
 the v1 API.
 """
+import contextlib
+import copy
 import json
 import datetime
+import os
+import threading
 import typing
 
 from .types import StrPath
@@ -16,6 +20,27 @@ from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
 
+# The device, inode, modification time and size of a file, which change
+# whenever it is written
+_FileVersion = typing.Tuple[int, int, int, int]
+
+_lock = threading.Lock()
+# Calibration files read with the default decoder, by path, along with the
+# version of the file they were read from
+_read_cache: typing.Dict[str, typing.Tuple[_FileVersion, typing.Dict]] = {}
+# The serialized files waiting to be written, by path, of each thread that
+# is batching writes
+_batches = threading.local()
+
+
+def _pending_writes() -> typing.Optional[typing.Dict[str, str]]:
+    return getattr(_batches, "pending_writes", None)
+
+
+def _file_version(path: str) -> _FileVersion:
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
 
 def read_cal_file(
     filepath: StrPath, decoder: DecoderType = DateTimeDecoder
@@ -34,8 +59,38 @@ def read_cal_file(
     # This can be done when the labware endpoints
     # are refactored to grab tip length calibration
     # from the correct locations.
+    if decoder is not DateTimeDecoder:
+        return _load(filepath, decoder)
+
+    path = os.fspath(filepath)
+    pending_writes = _pending_writes()
+    if pending_writes is not None and path in pending_writes:
+        return _load_str(pending_writes[path], decoder)
+
+    try:
+        version = _file_version(path)
+    except FileNotFoundError:
+        with _lock:
+            _read_cache.pop(path, None)
+        raise
+
+    with _lock:
+        cached = _read_cache.get(path)
+    if cached is None or cached[0] != version:
+        cached = version, _load(path, decoder)
+        with _lock:
+            _read_cache[path] = cached
+    # Callers are free to modify what they read
+    return copy.deepcopy(cached[1])
+
+
+def _load(filepath: StrPath, decoder: DecoderType) -> typing.Dict:
     with open(filepath, "r") as f:
-        calibration_data = json.load(f, cls=decoder)
+        return _load_str(f.read(), decoder)
+
+
+def _load_str(serialized: str, decoder: DecoderType) -> typing.Dict:
+    calibration_data = json.loads(serialized, cls=decoder)
     if isinstance(calibration_data.values(), dict):
         for value in calibration_data.values():
             if value.get("lastModified"):
@@ -58,5 +113,56 @@ def save_to_file(
     :param encoder: if there is any specialized encoder needed.
     The default encoder is the date time encoder.
     """
-    with open(filepath, "w") as f:
-        json.dump(data, f, cls=encoder)
+    path = os.fspath(filepath)
+    serialized = json.dumps(data, cls=encoder)
+    pending_writes = _pending_writes()
+    if pending_writes is not None:
+        pending_writes[path] = serialized
+    else:
+        _write(path, serialized)
+
+
+def _write(path: str, serialized: str):
+    # Write a temporary file next to the file and move it into place, so a
+    # reader never sees a partly written file
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            f.write(serialized)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    finally:
+        with _lock:
+            _read_cache.pop(path, None)
+
+
+@contextlib.contextmanager
+def batch_writes() -> typing.Iterator[None]:
+    """
+    Hold back the files saved within the block, and write each of them once
+    when it exits, however many times it was saved.
+
+    Files read within the block see what was saved to them. If the block
+    raises an exception, nothing saved within it is written.
+
+    Batches are per thread: saves made by other threads meanwhile are
+    written straight away, and they don't see what this thread saved.
+    """
+    if _pending_writes() is not None:
+        # Already batching, the outermost batch writes
+        yield
+        return
+
+    pending: typing.Dict[str, str] = {}
+    _batches.pending_writes = pending
+    try:
+        yield
+    finally:
+        _batches.pending_writes = None
+    for path, serialized in pending.items():
+        _write(path, serialized)
@@ -133,8 +133,8 @@ def get_labware_calibration(
     offset = Point(0, 0, 0)
     labware_path = offset_path / lookup_path
     if labware_path.exists():
+        # Also migrates the index if it needs to be
         modify.add_existing_labware_to_index_file(definition, parent, slot)
-        migration.check_index_version(offset_path / "index.json")
         calibration_data = io.read_cal_file(str(labware_path))
         offset_array = calibration_data["default"]["offset"]
         offset = Point(x=offset_array[0], y=offset_array[1], z=offset_array[2])
@@ -94,9 +94,10 @@ def save_labware_calibration(
     labware_offset_path = offset_path / labware_path
     labware_hash = helpers.hash_labware_def(definition)
     uri = helpers.uri_from_definition(definition)
-    _add_to_index_offset_file(parent, slot, uri, labware_hash)
-    calibration_data = _helper_offset_data_format(str(labware_offset_path), delta)
-    io.save_to_file(labware_offset_path, calibration_data)
+    with io.batch_writes():
+        _add_to_index_offset_file(parent, slot, uri, labware_hash)
+        calibration_data = _helper_offset_data_format(str(labware_offset_path), delta)
+        io.save_to_file(labware_offset_path, calibration_data)
 
 
 def create_tip_length_data(
@@ -187,17 +188,18 @@ def save_tip_length_calibration(pip_id: str, tip_length_cal: "PipTipLengthCalibr
     tip_length_dir_path.mkdir(parents=True, exist_ok=True)
     pip_tip_length_path = tip_length_dir_path / f"{pip_id}.json"
 
-    for lw_hash in tip_length_cal.keys():
-        _append_to_index_tip_length_file(pip_id, lw_hash)
+    with io.batch_writes():
+        for lw_hash in tip_length_cal.keys():
+            _append_to_index_tip_length_file(pip_id, lw_hash)
 
-    try:
-        tip_length_data = io.read_cal_file(str(pip_tip_length_path))
-    except FileNotFoundError:
-        tip_length_data = {}
+        try:
+            tip_length_data = io.read_cal_file(str(pip_tip_length_path))
+        except FileNotFoundError:
+            tip_length_data = {}
 
-    tip_length_data.update(tip_length_cal)
+        tip_length_data.update(tip_length_cal)
 
-    io.save_to_file(pip_tip_length_path, tip_length_data)
+        io.save_to_file(pip_tip_length_path, tip_length_data)
 
 
 def save_robot_deck_attitude(
@@ -271,8 +273,9 @@ def save_pipette_calibration(
         "source": local_types.SourceType.user,
         "status": status_dict,
     }
-    io.save_to_file(offset_path, offset_dict)
-    _add_to_pipette_offset_index_file(pip_id, mount)
+    with io.batch_writes():
+        io.save_to_file(offset_path, offset_dict)
+        _add_to_pipette_offset_index_file(pip_id, mount)
 
 
 @typing.overload
@@ -1,5 +1,6 @@
 import functools
 import inspect
+import logging
 from typing import Any, Callable, cast, Dict, Tuple, Mapping, Generic, TypeVar
 from opentrons.broker import Broker
 from . import types as command_types
@@ -54,14 +55,22 @@ def do_publish(
     **kwargs: Any
 ) -> None:
     """Implement the publish so it can be called outside the decorator"""
-    publish_command = functools.partial(broker.publish, topic=command_types.COMMAND)
+    should_log = when == "before" and broker.logger.isEnabledFor(logging.INFO)
+    should_publish = broker.has_subscribers(command_types.COMMAND)
+    if not (should_log or should_publish):
+        return
+
     call_args = _get_args(f, args, kwargs)
-    if when == "before":
+    if should_log:
         broker.logger.info(
             "{}: {}".format(
                 f.__qualname__, {k: v for k, v in call_args.items() if str(k) != "self"}
             )
         )
+    if not should_publish:
+        return
+
+    publish_command = functools.partial(broker.publish, topic=command_types.COMMAND)
     getfullargspec = getfullargspec_cache.get(cmd)
     command_args = dict(
         zip(reversed(getfullargspec.args), reversed(getfullargspec.defaults or []))
@@ -102,6 +111,9 @@ def publish_paired(
     """Implement a second publisher outside of the decorator that
     relies on the method providing all of the arguments required
     rather than binding defaults to the signature"""
+    if not broker.has_subscribers(command_types.COMMAND):
+        return
+
     publish_command = functools.partial(broker.publish, topic=command_types.COMMAND)
 
     payload = cmd(*args, pub_type)
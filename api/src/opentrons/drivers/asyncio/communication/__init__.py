@@ -6,10 +6,12 @@ from opentrons.drivers.asyncio.communication.errors import (
     ErrorResponse,
 )
 from .async_serial import AsyncSerial
+from .selector_serial import SelectorSerial
 
 __all__ = [
     "SerialConnection",
     "AsyncSerial",
+    "SelectorSerial",
     "SerialException",
     "NoResponse",
     "AlarmResponse",
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+from serial import Serial, SerialTimeoutException  # type: ignore
+
+log = logging.getLogger(__name__)
+
+SOCKET_URL_SCHEME = "socket"
+READ_CHUNK_SIZE = 4096
+
+
+class SelectorSerial:
+    """Async serial port driven by the event loop's file descriptor readiness.
+
+    Unlike :py:class:`AsyncSerial`, which hands each blocking pyserial call
+    to an executor thread, this reads whatever arrives on the port as soon as
+    the event loop sees that it is readable and writes without blocking, so
+    no threads or context switches are involved.
+
+    Local serial devices (on POSIX) and ``socket://host:port`` URLs, as used
+    to reach the hardware emulators, are supported.
+    """
+
+    @classmethod
+    def supports(cls, port: str, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Check whether a port can be used with this transport.
+
+        Args:
+            port: url or port name
+            loop: the event loop that will drive the port
+
+        Returns:
+            True if the port is a socket URL or a local device on POSIX, and
+            the event loop supports file descriptor readiness callbacks.
+        """
+        proactor = getattr(asyncio, "ProactorEventLoop", ())
+        if isinstance(loop, proactor):
+            return False
+
+        scheme = urlparse(port).scheme
+        if scheme == SOCKET_URL_SCHEME:
+            return True
+        return "://" not in port and os.name == "posix"
+
+    @classmethod
+    async def create(
+        cls,
+        port: str,
+        baud_rate: int,
+        timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> SelectorSerial:
+        """
+        Create and open a SelectorSerial instance.
+
+        Args:
+            port: url or port name
+            baud_rate: the baud rate
+            timeout: optional timeout in seconds
+            write_timeout: optional write timeout in seconds
+            loop: optional event loop. if None get_running_loop will be used
+        """
+        loop = loop or asyncio.get_running_loop()
+        serial = cls(
+            port=port,
+            baud_rate=baud_rate,
+            timeout=timeout,
+            write_timeout=write_timeout,
+            loop=loop,
+        )
+        await serial.open()
+        return serial
+
+    def __init__(
+        self,
+        port: str,
+        baud_rate: int,
+        timeout: Optional[float],
+        write_timeout: Optional[float],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            port: url or port name
+            baud_rate: the baud rate
+            timeout: timeout in seconds, or None to wait forever
+            write_timeout: write timeout in seconds, or None to wait forever
+            loop: event loop
+        """
+        self._port = port
+        self._baud_rate = baud_rate
+        self._timeout = timeout
+        self._write_timeout = write_timeout
+        self._loop = loop
+        self._serial: Optional[Serial] = None
+        self._socket: Optional[socket.socket] = None
+        self._fd: Optional[int] = None
+        self._buffer = bytearray()
+        self._eof = False
+        self._read_waiter: Optional["asyncio.Future[None]"] = None
+
+    async def read_until(self, match: bytes, timeout: Optional[float] = None) -> bytes:
+        """
+        Read data until match.
+
+        Args:
+            match: a sequence of bytes to match
+            timeout: optional timeout in seconds. this is a temporary override
+                of parameter supplied to `create`
+
+        Returns:
+            read data, up to and including the match. If the match isn't
+            found before the timeout, whatever data was read.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        deadline = None if timeout is None else self._loop.time() + timeout
+
+        while True:
+            index = self._buffer.find(match)
+            if index >= 0:
+                return self._take(index + len(match))
+
+            remaining = None if deadline is None else deadline - self._loop.time()
+            if self._eof or (remaining is not None and remaining <= 0):
+                break
+            if not await self._wait_readable(remaining):
+                break
+
+        return self._take(len(self._buffer))
+
+    async def write(self, data: bytes, timeout: Optional[float] = None) -> None:
+        """
+        Write data
+
+        Any data received but not yet read is discarded first.
+
+        Args:
+            data: data to write.
+            timeout: optional timeout in seconds. this is a temporary override
+                of parameter supplied to create
+
+        Returns:
+            None
+
+        Raises:
+            SerialTimeoutException: the data could not be written in time
+        """
+        assert self._fd is not None, f"{self._port} is not open"
+        timeout = self._write_timeout if timeout is None else timeout
+        deadline = None if timeout is None else self._loop.time() + timeout
+
+        self._reset_input_buffer()
+
+        pending = memoryview(data)
+        while pending:
+            try:
+                pending = pending[self._write_some(pending) :]
+            except BlockingIOError:
+                pass
+
+            if pending:
+                remaining = None if deadline is None else deadline - self._loop.time()
+                if not await self._wait_writable(remaining):
+                    raise SerialTimeoutException("Write timeout")
+
+    async def open(self) -> None:
+        """
+        Open the connection.
+
+        Returns: None
+        """
+        if self._fd is not None:
+            return
+
+        if urlparse(self._port).scheme == SOCKET_URL_SCHEME:
+            self._socket = await self._connect_socket()
+            self._fd = self._socket.fileno()
+        else:
+            serial = await self._loop.run_in_executor(
+                None,
+                lambda: Serial(port=self._port, baudrate=self._baud_rate, timeout=0),
+            )
+            self._serial = serial
+            self._fd = serial.fileno()
+
+        self._buffer.clear()
+        self._eof = False
+        self._loop.add_reader(self._fd, self._on_readable)
+
+    async def close(self) -> None:
+        """
+        Close the connection
+
+        Returns: None
+        """
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        if self._serial is not None:
+            self._serial.close()
+            self._serial = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+        self._eof = True
+        self._wake_reader()
+
+    async def is_open(self) -> bool:
+        """
+        Check if connection is open.
+
+        Returns: boolean
+        """
+        return self._fd is not None
+
+    async def _connect_socket(self) -> socket.socket:
+        url = urlparse(self._port)
+        family, kind, proto, _, address = (
+            await self._loop.getaddrinfo(
+                url.hostname, url.port, type=socket.SOCK_STREAM
+            )
+        )[0]
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            await self._loop.sock_connect(sock, address)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _read_some(self) -> bytes:
+        assert self._fd is not None
+        if self._socket is not None:
+            return self._socket.recv(READ_CHUNK_SIZE)
+        return os.read(self._fd, READ_CHUNK_SIZE)
+
+    def _write_some(self, data: Union[bytes, memoryview]) -> int:
+        assert self._fd is not None
+        if self._socket is not None:
+            return self._socket.send(data)
+        return os.write(self._fd, data)
+
+    def _on_readable(self) -> None:
+        """Move everything available on the port into the read buffer."""
+        try:
+            data = self._read_some()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            log.warning(f"{self._port}: read failed: {e}")
+            data = b""
+
+        if data:
+            self._buffer += data
+        else:
+            # The other end is gone; stop watching the port until reopened
+            assert self._fd is not None
+            self._loop.remove_reader(self._fd)
+            self._eof = True
+
+        self._wake_reader()
+
+    def _wake_reader(self) -> None:
+        if self._read_waiter is not None and not self._read_waiter.done():
+            self._read_waiter.set_result(None)
+
+    async def _wait_readable(self, timeout: Optional[float]) -> bool:
+        """Wait for more data to arrive. Returns False on timeout."""
+        self._read_waiter = self._loop.create_future()
+        try:
+            await asyncio.wait_for(self._read_waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._read_waiter = None
+
+    async def _wait_writable(self, timeout: Optional[float]) -> bool:
+        """Wait until the port can take more data. Returns False on timeout."""
+        assert self._fd is not None
+        fd = self._fd
+        waiter: "asyncio.Future[None]" = self._loop.create_future()
+
+        def _on_writable() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._loop.add_writer(fd, _on_writable)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._loop.remove_writer(fd)
+
+    def _reset_input_buffer(self) -> None:
+        self._buffer.clear()
+        if self._serial is not None:
+            self._serial.reset_input_buffer()
+
+    def _take(self, size: int) -> bytes:
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
 from opentrons.drivers.command_builder import CommandBuilder
 
 from .errors import NoResponse, AlarmResponse, ErrorResponse
 from .async_serial import AsyncSerial
+from .selector_serial import SelectorSerial
 
 log = logging.getLogger(__name__)
 
@@ -38,9 +39,16 @@ class SerialConnection:
 
         Returns: SerialConnection
         """
-        serial = await AsyncSerial.create(
-            port=port, baud_rate=baud_rate, timeout=timeout, loop=loop
-        )
+        loop = loop or asyncio.get_running_loop()
+        serial: Union[AsyncSerial, SelectorSerial]
+        if SelectorSerial.supports(port=port, loop=loop):
+            serial = await SelectorSerial.create(
+                port=port, baud_rate=baud_rate, timeout=timeout, loop=loop
+            )
+        else:
+            serial = await AsyncSerial.create(
+                port=port, baud_rate=baud_rate, timeout=timeout, loop=loop
+            )
         name = name or port
         return cls(
             serial=serial,
@@ -52,7 +60,7 @@ class SerialConnection:
 
     def __init__(
         self,
-        serial: AsyncSerial,
+        serial: Union[AsyncSerial, SelectorSerial],
         port: str,
         name: str,
         ack: str,
@@ -62,7 +70,7 @@ class SerialConnection:
         Constructor
 
         Args:
-            serial: AsyncSerial object
+            serial: AsyncSerial or SelectorSerial object
             port: url or port to connect to
             ack: the command response ack
             name: the connection name
@@ -94,6 +102,32 @@ class SerialConnection:
             data=command.build(), retries=retries, timeout=timeout
         )
 
+    async def send_commands(
+        self, commands: Sequence[CommandBuilder], timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Send several commands in a single write and return their responses.
+
+        The commands are written back to back without waiting for each one
+        to be acknowledged, and then one ack is read per command, so the
+        serial round trip is paid once for the whole batch. A batch is never
+        retried, because it is unknown which of its commands were received
+        once an ack goes missing.
+
+        Args:
+            commands: The command builders to send, in order.
+            timeout: optional override of default timeout in seconds, for
+                each ack
+
+        Returns: The response to each command, in order
+
+        Raises: SerialException
+        """
+        async with self._send_data_lock:
+            return await self._send_data_batch(
+                data=[command.build() for command in commands], timeout=timeout
+            )
+
     async def send_data(
         self, data: str, retries: int = 0, timeout: Optional[float] = None
     ) -> str:
@@ -137,13 +171,7 @@ class SerialConnection:
             log.debug(f"{self.name}: Read <- {response!r}")
 
             if self._ack in response:
-                # Remove ack from response
-                response = response.replace(self._ack, b"")
-                str_response = self.process_raw_response(
-                    command=data, response=response.decode()
-                )
-                self.raise_on_error(response=str_response)
-                return str_response
+                return self._parse_response(data=data, response=response)
 
             log.info(f"{self.name}: retry number {retry}/{retries}")
 
@@ -151,6 +179,48 @@ class SerialConnection:
 
         raise NoResponse(port=self._port, command=data)
 
+    async def _send_data_batch(
+        self, data: Sequence[str], timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Send several pieces of data in one write and return their responses.
+
+        Args:
+            data: The data to send, one entry per expected ack.
+            timeout: optional override of default timeout in seconds
+
+        Returns: The response to each entry
+
+        Raises: SerialException
+        """
+        data_encode = "".join(data).encode()
+        log.debug(f"{self.name}: Write -> {data_encode!r}")
+        # Any acks left unread after an error are discarded by the next
+        # write, which resets the input buffer
+        await self._serial.write(data=data_encode)
+
+        responses = []
+        for entry in data:
+            response = await self._serial.read_until(match=self._ack, timeout=timeout)
+            log.debug(f"{self.name}: Read <- {response!r}")
+
+            if self._ack not in response:
+                raise NoResponse(port=self._port, command=entry)
+
+            responses.append(self._parse_response(data=entry, response=response))
+
+        return responses
+
+    def _parse_response(self, data: str, response: bytes) -> str:
+        """Strip the ack from a response, process it and check for errors."""
+        # Remove ack from response
+        response = response.replace(self._ack, b"")
+        str_response = self.process_raw_response(
+            command=data, response=response.decode()
+        )
+        self.raise_on_error(response=str_response)
+        return str_response
+
     async def open(self) -> None:
         """Open the connection."""
         await self._serial.open()
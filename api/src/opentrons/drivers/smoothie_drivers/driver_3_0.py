@@ -13,7 +13,7 @@ import contextlib
 import logging
 from os import environ
 from time import time
-from typing import Any, Dict, Optional, Union, List, Tuple
+from typing import Any, Dict, Optional, Union, List, Sequence, Tuple
 
 from math import isclose
 
@@ -860,23 +860,88 @@ class SmoothieDriver:
                 command, ack_timeout, timeout
             )
         except SmoothieError as se:
-            # XXX: This is a reentrancy error because another command could
-            # swoop in here. We're already resetting though and errors (should
-            # be) rare so it's probably fine, but the actual solution to this
-            # is locking at a higher level like in APIv2.
-            await self._reset_from_error()
-            error_axis = se.ret_code.strip()[-1]
-            if not suppress_error_msg:
-                log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
-            if (
-                GCODE.MOVE in command or GCODE.PROBE in command
-            ) and not suppress_home_after_error:
-                if error_axis not in "XYZABC":
-                    error_axis = AXES
-                log.info("Homing after alarm/error")
-                await self.home(error_axis)
+            await self._recover_from_error(
+                se, command, suppress_error_msg, suppress_home_after_error
+            )
+            raise SmoothieError(se.ret_code, str(command))
+
+    async def _send_commands(
+        self,
+        commands: Sequence[CommandBuilder],
+        timeout: float = DEFAULT_EXECUTE_TIMEOUT,
+        suppress_error_msg: bool = False,
+        suppress_home_after_error: bool = False,
+    ) -> None:
+        """
+        Stream several GCODE commands to the robot in a single write,
+        followed by M400 to block until they are all done.
+
+        Rather than waiting for each command's ack (and an M400 ack) before
+        sending the next, the commands are written at once and their acks are
+        counted, so a sequence of commands costs a single serial round trip.
+
+        Smoothieware queues moves in its planner but applies some settings,
+        like currents (M907) and microstepping, as soon as it reads them.
+        Callers must place an M400 (see :py:meth:`_build_wait_command`)
+        between a move and any following command that must not take effect
+        until that move is done.
+
+        Errors are handled the same way as in :py:meth:`_send_command`.
+
+        :param commands: the GCODE commands to submit to the robot, in order
+        :param timeout: the time to wait for each ack, including the final
+            M400, so it should be long enough to allow all of the commands
+            to execute
+        :param suppress_error_msg: flag for indicating that smoothie errors
+            should not be logged
+        :param suppress_home_after_error: flag for indicating that the robot
+            should not home after an error during a move
+        """
+        if self.simulating:
+            return
+        assert self._connection, "There is no connection."
+        try:
+            try:
+                await self._connection.send_commands(
+                    commands=[*commands, self._build_wait_command()], timeout=timeout
+                )
+            except AlarmResponse as e:
+                self._handle_return(ret_code=e.response, is_alarm=True)
+            except ErrorResponse as e:
+                self._handle_return(ret_code=e.response, is_error=True)
+        except SmoothieError as se:
+            command = _command_builder()
+            for c in commands:
+                command.add_builder(builder=c)
+            await self._recover_from_error(
+                se, command, suppress_error_msg, suppress_home_after_error
+            )
             raise SmoothieError(se.ret_code, str(command))
 
+    async def _recover_from_error(
+        self,
+        error: SmoothieError,
+        command: CommandBuilder,
+        suppress_error_msg: bool,
+        suppress_home_after_error: bool,
+    ) -> None:
+        """Reset after an alarm or error, homing the failed axis after a move."""
+        # XXX: This is a reentrancy error because another command could
+        # swoop in here. We're already resetting though and errors (should
+        # be) rare so it's probably fine, but the actual solution to this
+        # is locking at a higher level like in APIv2.
+        await self._reset_from_error()
+        error_axis = error.ret_code.strip()[-1]
+        if not suppress_error_msg:
+            log.warning(f"alarm/error: command={command}, resp={error.ret_code}")
+        if (
+            GCODE.MOVE in command or GCODE.PROBE in command
+        ) and not suppress_home_after_error:
+            if error_axis not in "XYZABC":
+                error_axis = AXES
+            log.info("Homing after alarm/error")
+            await self.home(error_axis)
+
     async def _send_command_unsynchronized(
         self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
     ) -> str:
@@ -886,11 +951,8 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
             await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
+                command=self._build_wait_command(), retries=0, timeout=execute_timeout
             )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
@@ -898,6 +960,11 @@ class SmoothieDriver:
             self._handle_return(ret_code=e.response, is_error=True)
         return command_result
 
+    @staticmethod
+    def _build_wait_command() -> CommandBuilder:
+        """Build an M400, which blocks until all queued moves are done."""
+        return _command_builder().add_gcode(gcode=GCODE.WAIT)
+
     def _handle_return(
         self, ret_code: str, is_alarm: bool = False, is_error: bool = False
     ) -> None:
@@ -1372,26 +1439,37 @@ class SmoothieDriver:
         if home_flagged_axes:
             await self.home_flagged_axes("".join(list(target.keys())))
 
-        async def _do_split():
-            try:
-                for sc in (c for c in (split_prefix, split_command) if c):
-                    await self._send_command(sc)
-            finally:
-                if split_postfix:
-                    await self._send_command(split_postfix)
+        # The split move, the move and the plunger dwell current are streamed
+        # together, only waiting for motion to finish where a following
+        # command changes microstepping or currents, which take effect
+        # immediately rather than in the planner's order
+        stream: List[CommandBuilder] = []
+        if split_command:
+            stream += [split_prefix, split_command, self._build_wait_command()]
+            if split_postfix:
+                stream.append(split_postfix)
+        stream.append(command)
+
+        # dwell pipette motors because they get hot
+        plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+        if plunger_axis_moved:
+            self.dwell_axes(plunger_axis_moved)
+            stream += [self._build_wait_command(), self._generate_current_command()]
 
         try:
             log.debug(f"move: {command}")
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
-            await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
-        finally:
-            # dwell pipette motors because they get hot
-            plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+            await self._send_commands(stream, timeout=DEFAULT_EXECUTE_TIMEOUT)
+        except BaseException:
+            # it is unknown how much of the stream ran, so make sure the
+            # plungers are back to microstepping and their dwell current
+            if split_postfix:
+                await self._send_command(split_postfix)
             if plunger_axis_moved:
-                self.dwell_axes(plunger_axis_moved)
                 await self._set_saved_current()
+            raise
+        finally:
             self._axes_moved_at.mark_moved(moving_axes)
 
         self._update_position(target)
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict
 
-from opentrons.drivers.types import Temperature, ThermocyclerLidStatus, PlateTemperature
+from opentrons.drivers.types import (
+    Temperature,
+    ThermocyclerLidStatus,
+    PlateTemperature,
+    ThermocyclerStatus,
+)
 
 
 class AbstractThermocyclerDriver(ABC):
@@ -60,6 +65,11 @@ class AbstractThermocyclerDriver(ABC):
         """Send a get plate temperature command."""
         ...
 
+    @abstractmethod
+    async def get_status(self) -> ThermocyclerStatus:
+        """Get the lid status, lid temperature and plate temperature at once."""
+        ...
+
     @abstractmethod
     async def set_ramp_rate(self, ramp_rate: float) -> None:
         """Send a set ramp rate command"""
@@ -7,9 +7,18 @@ from typing import Optional, Dict
 
 from opentrons.drivers import utils
 from opentrons.drivers.command_builder import CommandBuilder
-from opentrons.drivers.asyncio.communication import SerialConnection, AsyncSerial
+from opentrons.drivers.asyncio.communication import (
+    SerialConnection,
+    AsyncSerial,
+    NoResponse,
+)
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
-from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
+from opentrons.drivers.types import (
+    Temperature,
+    PlateTemperature,
+    ThermocyclerLidStatus,
+    ThermocyclerStatus,
+)
 
 log = logging.getLogger(__name__)
 
@@ -182,6 +191,46 @@ class ThermocyclerDriver(AbstractThermocyclerDriver):
             temperature_string=response, rounding_val=utils.TC_GCODE_ROUNDING_PRECISION
         )
 
+    async def get_status(self) -> ThermocyclerStatus:
+        """
+        Get the lid status, lid temperature and plate temperature in a single
+        serial transaction.
+
+        These are all reads, so the whole batch is resent if an ack is missing.
+        """
+        commands = [
+            CommandBuilder(terminator=TC_COMMAND_TERMINATOR).add_gcode(gcode=gcode)
+            for gcode in (
+                GCODE.GET_LID_STATUS,
+                GCODE.GET_LID_TEMP,
+                GCODE.GET_PLATE_TEMP,
+            )
+        ]
+        for retry in range(DEFAULT_COMMAND_RETRIES + 1):
+            try:
+                lid_status, lid_temp, plate_temp = await self._connection.send_commands(
+                    commands=commands
+                )
+                break
+            except NoResponse:
+                if retry == DEFAULT_COMMAND_RETRIES:
+                    raise
+                await self._connection.on_retry()
+
+        return ThermocyclerStatus(
+            lid_status=ThermocyclerLidStatus(
+                utils.parse_key_values(value=lid_status)["Lid"]
+            ),
+            lid_temperature=utils.parse_temperature_response(
+                temperature_string=lid_temp,
+                rounding_val=utils.TC_GCODE_ROUNDING_PRECISION,
+            ),
+            plate_temperature=utils.parse_plate_temperature_response(
+                temperature_string=plate_temp,
+                rounding_val=utils.TC_GCODE_ROUNDING_PRECISION,
+            ),
+        )
+
     async def set_ramp_rate(self, ramp_rate: float) -> None:
         """Send a set ramp rate command"""
         c = (
@@ -1,7 +1,12 @@
 from typing import Optional
 
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
-from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
+from opentrons.drivers.types import (
+    Temperature,
+    PlateTemperature,
+    ThermocyclerLidStatus,
+    ThermocyclerStatus,
+)
 
 
 class SimulatingDriver(AbstractThermocyclerDriver):
@@ -49,6 +54,13 @@ class SimulatingDriver(AbstractThermocyclerDriver):
     async def get_plate_temperature(self) -> PlateTemperature:
         return self._plate_temperature
 
+    async def get_status(self) -> ThermocyclerStatus:
+        return ThermocyclerStatus(
+            lid_status=self._lid_status,
+            lid_temperature=self._lid_temperature,
+            plate_temperature=self._plate_temperature,
+        )
+
     async def set_ramp_rate(self, ramp_rate: float) -> None:
         self._ramp_rate = ramp_rate
 
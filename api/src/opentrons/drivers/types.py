@@ -39,3 +39,12 @@ class ThermocyclerLidStatus(str, Enum):
     IN_BETWEEN = "in_between"
     OPEN = "open"
     MAX = "max"
+
+
+@dataclass
+class ThermocyclerStatus:
+    """Thermocycler lid status and temperatures, read together."""
+
+    lid_status: ThermocyclerLidStatus
+    lid_temperature: Temperature
+    plate_temperature: PlateTemperature
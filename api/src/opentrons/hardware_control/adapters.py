@@ -1,8 +1,9 @@
 """ Adapters for the :py:class:`.hardware_control.API` instances.
 """
 import asyncio
+import contextlib
 import functools
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple
 
 from .types import HardwareAPILike
 
@@ -10,6 +11,20 @@ if TYPE_CHECKING:
     from .dev_types import HasLoop
 
 
+def _unwrap(attr: Any) -> Any:
+    """The function to check for being a coroutine function in place of attr"""
+    check = attr
+    if isinstance(attr, functools.partial):
+        # if partial func check passed in func
+        check = attr.func
+    try:
+        # if decorated func check wrapped func
+        check = check.__wrapped__
+    except AttributeError:
+        pass
+    return check
+
+
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
 # instance and setattr on the outer instance with the proper async resolution
@@ -46,6 +61,9 @@ class SynchronousAdapter(HardwareAPILike):
         :param asynchronous_instance: The asynchronous class instance to wrap
         """
         self._obj_to_adapt = asynchronous_instance
+        # Resolved methods by name, along with the function and instance
+        # they were resolved from
+        self._wrappers: Dict[str, Tuple[Any, Any, Any]] = {}
 
     def __repr__(self):
         return "<SynchronousAdapter>"
@@ -55,6 +73,28 @@ class SynchronousAdapter(HardwareAPILike):
         fut = asyncio.run_coroutine_threadsafe(to_call(*args, **kwargs), loop)
         return fut.result()
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["CallBatch"]:
+        """Make a sequence of calls in the adapted object's loop at once.
+
+        Calls made on the yielded batch are only recorded. When the block
+        exits, they are all made, in order, in a single trip to the adapted
+        object's thread, rather than one trip each. Calls return nothing, and
+        the first one to raise an exception stops the rest, which re-raises
+        it here.
+
+        Example
+        -------
+        .. code-block::
+        >>> with sync_api.batch() as batch:
+        ...     batch.move_to(Mount.LEFT, Point(10, 10, 50))
+        ...     batch.move_to(Mount.LEFT, Point(10, 10, 10))
+        """
+        obj_to_adapt = object.__getattribute__(self, "_obj_to_adapt")
+        batch = CallBatch(obj_to_adapt)
+        yield batch
+        batch.run(obj_to_adapt._loop)
+
     def __getattribute__(self, attr_name):
         """Retrieve attributes from our API and wrap coroutines"""
         # Almost every attribute retrieved from us will be for people actually
@@ -66,18 +106,22 @@ class SynchronousAdapter(HardwareAPILike):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
-        check = inner_attr
-        if isinstance(inner_attr, functools.partial):
-            # if partial func check passed in func
-            check = inner_attr.func
-        try:
-            # if decorated func check wrapped func
-            check = check.__wrapped__
-        except AttributeError:
-            pass
+        # A method resolves the same way until it is replaced
+        func = getattr(inner_attr, "__func__", None)
+        if func is not None:
+            wrappers = object.__getattribute__(self, "_wrappers")
+            cached = wrappers.get(attr_name)
+            if (
+                cached is not None
+                and cached[0] is func
+                and cached[1] is inner_attr.__self__
+            ):
+                return cached[2]
+
+        check = _unwrap(inner_attr)
         if asyncio.iscoroutinefunction(check):
             # Return a synchronized version of the coroutine
-            return functools.partial(
+            resolved = functools.partial(
                 object.__getattribute__(self, "call_coroutine_sync"),
                 obj_to_adapt._loop,
                 inner_attr,
@@ -86,5 +130,40 @@ class SynchronousAdapter(HardwareAPILike):
             # Catch awaitable properties and reify the future before returning
             fut = asyncio.run_coroutine_threadsafe(check, obj_to_adapt._loop)
             return fut.result()
+        else:
+            resolved = inner_attr
 
-        return inner_attr
+        if func is not None:
+            wrappers[attr_name] = (func, inner_attr.__self__, resolved)
+        return resolved
+
+
+class CallBatch:
+    """Calls recorded by :py:meth:`SynchronousAdapter.batch`."""
+
+    def __init__(self, obj_to_adapt: Any) -> None:
+        self._obj_to_adapt = obj_to_adapt
+        self._calls: List[Tuple[Callable, tuple, dict]] = []
+
+    def __getattr__(self, attr_name: str) -> Callable[..., None]:
+        attr = getattr(self._obj_to_adapt, attr_name)
+        if not callable(attr):
+            raise TypeError(f"Only calls can be batched, not {attr_name}")
+
+        def record(*args, **kwargs) -> None:
+            self._calls.append((attr, args, kwargs))
+
+        return record
+
+    def run(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Make the recorded calls in the loop, and wait for them."""
+        calls, self._calls = self._calls, []
+        if calls:
+            asyncio.run_coroutine_threadsafe(self._call_all(calls), loop).result()
+
+    @staticmethod
+    async def _call_all(calls: List[Tuple[Callable, tuple, dict]]) -> None:
+        for to_call, args, kwargs in calls:
+            result = to_call(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                await result
@@ -28,6 +28,7 @@ from .util import use_or_initialize_loop, DeckTransformState, check_motion_bound
 from .pipette import Pipette, generate_hardware_configs, load_from_config_and_check_skip
 from .controller import Controller
 from .simulator import Simulator
+from .time_estimator import TimeEstimator
 from .constants import (
     SHAKE_OFF_TIPS_SPEED,
     SHAKE_OFF_TIPS_DROP_DISTANCE,
@@ -36,6 +37,7 @@ from .constants import (
 )
 from .execution_manager import ExecutionManager
 from .pause_manager import PauseManager
+from .poller import PollScheduler
 from .module_control import AttachedModulesControl
 from .types import (
     Axis,
@@ -105,6 +107,11 @@ class API(HardwareAPILike):
             top_types.Mount.LEFT: None,
             top_types.Mount.RIGHT: None,
         }
+        # The last pipette dict built for each mount, along with the pipette
+        # and its version at the time
+        self._pipette_dicts: Dict[
+            top_types.Mount, Tuple[Pipette, int, "PipetteDict"]
+        ] = {}
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
         # involved in motion. This fixes issue where for instance a move()
@@ -273,6 +280,14 @@ class API(HardwareAPILike):
         """`True` if this is a simulator; `False` otherwise."""
         return isinstance(self._backend, Simulator)
 
+    @property
+    def time_estimator(self) -> Optional[TimeEstimator]:
+        """An estimate of how long the simulated actions would take on a
+        robot, or `None` if this is not a simulator."""
+        if isinstance(self._backend, Simulator):
+            return self._backend.time_estimator
+        return None
+
     def validate_calibration(self) -> DeckTransformState:
         """
         The lru cache decorator is currently not supported by the
@@ -369,6 +384,8 @@ class API(HardwareAPILike):
 
                 delay_task = self._loop.create_task(sleep_for_seconds(duration_s))
                 await self._execution_manager.register_cancellable_task(delay_task)
+            elif self.time_estimator:
+                self.time_estimator.wait(duration_s)
         finally:
             self.resume(PauseType.DELAY)
 
@@ -480,60 +497,74 @@ class API(HardwareAPILike):
         }
 
     def get_attached_instrument(self, mount: top_types.Mount) -> "PipetteDict":
+        """Get the status dict of the cached instrument on a mount.
+
+        The dict is only built again once the pipette changed, so it is
+        shared between callers and must not be modified.
+        """
         instr = self._attached_instruments[mount]
+        if not instr:
+            return cast("PipetteDict", {})
+
+        cached = self._pipette_dicts.get(mount)
+        if cached is None or cached[0] is not instr or cached[1] != instr.version:
+            cached = (instr, instr.version, self._build_pipette_dict(instr))
+            self._pipette_dicts[mount] = cached
+        return cached[2]
+
+    def _build_pipette_dict(self, instr: Pipette) -> "PipetteDict":
         result: Dict[str, Any] = {}
-        if instr:
-            configs = [
-                "name",
-                "min_volume",
-                "max_volume",
-                "channels",
-                "aspirate_flow_rate",
-                "dispense_flow_rate",
-                "pipette_id",
-                "current_volume",
-                "display_name",
-                "tip_length",
-                "model",
-                "blow_out_flow_rate",
-                "working_volume",
-                "tip_overlap",
-                "available_volume",
-                "return_tip_height",
-                "default_aspirate_flow_rates",
-                "default_blow_out_flow_rates",
-                "default_dispense_flow_rates",
-            ]
-
-            instr_dict = instr.as_dict()
-            # TODO (spp, 2021-08-27): Revisit this logic. Why do we need to build
-            #  this dict newly every time? Any why only a few items are being updated?
-            for key in configs:
-                result[key] = instr_dict[key]
-            result["has_tip"] = instr.has_tip
-            result["tip_length"] = instr.current_tip_length
-            result["aspirate_speed"] = self._plunger_speed(
-                instr, instr.aspirate_flow_rate, "aspirate"
-            )
-            result["dispense_speed"] = self._plunger_speed(
-                instr, instr.dispense_flow_rate, "dispense"
-            )
-            result["blow_out_speed"] = self._plunger_speed(
-                instr, instr.blow_out_flow_rate, "dispense"
-            )
-            result["ready_to_aspirate"] = instr.ready_to_aspirate
-            result["default_blow_out_speeds"] = {
-                alvl: self._plunger_speed(instr, fr, "dispense")
-                for alvl, fr in instr.config.default_aspirate_flow_rates.items()
-            }
-            result["default_dispense_speeds"] = {
-                alvl: self._plunger_speed(instr, fr, "dispense")
-                for alvl, fr in instr.config.default_dispense_flow_rates.items()
-            }
-            result["default_aspirate_speeds"] = {
-                alvl: self._plunger_speed(instr, fr, "aspirate")
-                for alvl, fr in instr.config.default_aspirate_flow_rates.items()
-            }
+        configs = [
+            "name",
+            "min_volume",
+            "max_volume",
+            "channels",
+            "aspirate_flow_rate",
+            "dispense_flow_rate",
+            "pipette_id",
+            "current_volume",
+            "display_name",
+            "tip_length",
+            "model",
+            "blow_out_flow_rate",
+            "working_volume",
+            "tip_overlap",
+            "available_volume",
+            "return_tip_height",
+            "default_aspirate_flow_rates",
+            "default_blow_out_flow_rates",
+            "default_dispense_flow_rates",
+        ]
+
+        instr_dict = instr.as_dict()
+        # TODO (spp, 2021-08-27): Revisit this logic. Why are only a few items
+        #  being updated?
+        for key in configs:
+            result[key] = instr_dict[key]
+        result["has_tip"] = instr.has_tip
+        result["tip_length"] = instr.current_tip_length
+        result["aspirate_speed"] = self._plunger_speed(
+            instr, instr.aspirate_flow_rate, "aspirate"
+        )
+        result["dispense_speed"] = self._plunger_speed(
+            instr, instr.dispense_flow_rate, "dispense"
+        )
+        result["blow_out_speed"] = self._plunger_speed(
+            instr, instr.blow_out_flow_rate, "dispense"
+        )
+        result["ready_to_aspirate"] = instr.ready_to_aspirate
+        result["default_blow_out_speeds"] = {
+            alvl: self._plunger_speed(instr, fr, "dispense")
+            for alvl, fr in instr.config.default_aspirate_flow_rates.items()
+        }
+        result["default_dispense_speeds"] = {
+            alvl: self._plunger_speed(instr, fr, "dispense")
+            for alvl, fr in instr.config.default_dispense_flow_rates.items()
+        }
+        result["default_aspirate_speeds"] = {
+            alvl: self._plunger_speed(instr, fr, "aspirate")
+            for alvl, fr in instr.config.default_aspirate_flow_rates.items()
+        }
         return cast("PipetteDict", result)
 
     @property
@@ -1885,4 +1916,6 @@ class API(HardwareAPILike):
 
     def clean_up(self):
         """Get the API ready to stop cleanly."""
+        self._backend.module_controls.clean_up()
+        PollScheduler.close_loop(self._loop)
         self._backend.clean_up()
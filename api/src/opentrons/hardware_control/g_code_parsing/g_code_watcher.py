@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Sequence
+from opentrons.drivers.command_builder import CommandBuilder
 from opentrons.drivers.asyncio.communication import SerialConnection
 from dataclasses import dataclass
 from opentrons.hardware_control.emulation.app import (
@@ -33,6 +34,7 @@ class GCodeWatcher:
     def __init__(self) -> None:
         self._command_list: List[WatcherData] = []
         self._original_send_data = SerialConnection.send_data
+        self._original_send_commands = SerialConnection.send_commands
 
     def __enter__(self) -> GCodeWatcher:
         """Patch the send command function"""
@@ -64,14 +66,44 @@ class GCodeWatcher:
             )
             return response
 
+        async def _patch_batch(
+            _self: SerialConnection,
+            commands: Sequence[CommandBuilder],
+            timeout: Optional[float] = None,
+        ) -> List[str]:
+            """
+            Side-effect function that gathers the commands passed to
+            SerialConnection.send_commands and stores them internally, one
+            entry per command.
+
+            Args:
+                _self: the SerialConnection instance
+                commands: the sent commands
+                timeout: optional timeout
+
+            Returns:
+                the responses
+            """
+            responses = await self._original_send_commands(_self, commands, timeout)
+            device = self._parse_device(_self)
+            for command, response in zip(commands, responses):
+                self._command_list.append(
+                    WatcherData(
+                        raw_g_code=command.build(), device=device, response=response
+                    )
+                )
+            return responses
+
         # mypy error "Cannot assign to a method" is ignored
         SerialConnection.send_data = _patch  # type: ignore
+        SerialConnection.send_commands = _patch_batch  # type: ignore
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Reset the the patch"""
         # mypy error "Cannot assign to a method" is ignored
         SerialConnection.send_data = self._original_send_data  # type: ignore
+        SerialConnection.send_commands = self._original_send_commands  # type: ignore
 
     @classmethod
     def _parse_device(cls, serial_connection: SerialConnection):
@@ -2,7 +2,7 @@ import logging
 import asyncio
 import os
 import re
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 from glob import glob
 
 from opentrons.config import IS_ROBOT, IS_LINUX
@@ -17,6 +17,7 @@ from . import modules
 log = logging.getLogger(__name__)
 
 MODULE_PORT_REGEX = re.compile("|".join(modules.MODULE_HW_BY_NAME.keys()), re.I)
+MODULE_BUILD_TIMEOUT_SEC = 30.0
 
 
 class AttachedModulesControl:
@@ -28,6 +29,9 @@ class AttachedModulesControl:
     def __init__(self, api):
         self._available_modules: List[modules.AbstractModule] = []
         self._api = api
+        # Cleanups of modules whose builds timed out, kept until they're done
+        # so that they aren't garbage collected while they wait
+        self._abandoned_builds: Set["asyncio.Future[None]"] = set()
 
     @classmethod
     async def build(cls, api_instance):
@@ -52,7 +56,7 @@ class AttachedModulesControl:
         loop: asyncio.AbstractEventLoop,
         sim_model: str = None,
     ) -> modules.AbstractModule:
-        return await modules.build(
+        module = await modules.build(
             port=port,
             usb_port=usb_port,
             which=model,
@@ -62,6 +66,8 @@ class AttachedModulesControl:
             execution_manager=self.api._execution_manager,
             sim_model=sim_model,
         )
+        module.set_time_estimator(self.api.time_estimator)
+        return module
 
     async def unregister_modules(
         self, mods_at_ports: List[modules.ModuleAtPort]
@@ -100,6 +106,12 @@ class AttachedModulesControl:
         Upon system recognition of a module being plugged in, we should
         register that module and de-register any modules that are
         no longer found on the system.
+
+        New modules are built concurrently, each with a timeout. Each one
+        becomes available as soon as it is built, in port order, so a module
+        that is slow or fails to connect doesn't hold up the others. Once
+        every build is done, the error of the first module that could not
+        be built, if any, is raised.
         """
         if new_mods_at_ports is None:
             new_mods_at_ports = []
@@ -113,15 +125,92 @@ class AttachedModulesControl:
         )
 
         # build new mods
-        for mod in sorted_mods_at_port:
-            new_instance = await self.build_module(
-                port=mod.port, usb_port=mod.usb_port, model=mod.name, loop=self.api.loop
+        attached: Dict[int, modules.AbstractModule] = {}
+        results = await asyncio.gather(
+            *(
+                self._build_and_attach(mod, index, attached)
+                for index, mod in enumerate(sorted_mods_at_port)
+            ),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            log.error(
+                f"Failed to attach {len(errors)} of {len(sorted_mods_at_port)}"
+                " new modules"
             )
-            self._available_modules.append(new_instance)
-            log.info(
-                f"Module {mod.name} discovered and attached"
-                f" at port {mod.port}, new_instance: {new_instance}"
+            raise errors[0]
+
+    async def _build_and_attach(
+        self,
+        mod: modules.ModuleAtPort,
+        index: int,
+        attached: Dict[int, modules.AbstractModule],
+    ) -> None:
+        """
+        Build a module and make it available, keeping the modules built
+        alongside it in order.
+
+        If the build times out, it is left to finish in the background and
+        the module is cleaned up then, so that its connection isn't leaked.
+        """
+        build = asyncio.ensure_future(
+            self.build_module(
+                port=mod.port,
+                usb_port=mod.usb_port,
+                model=mod.name,
+                loop=self.api.loop,
             )
+        )
+        try:
+            new_instance = await asyncio.wait_for(
+                asyncio.shield(build), timeout=MODULE_BUILD_TIMEOUT_SEC
+            )
+        except asyncio.TimeoutError:
+            log.error(f"Timed out building module {mod.name} at port {mod.port}")
+            cleanup = asyncio.ensure_future(self._cleanup_when_built(build))
+            self._abandoned_builds.add(cleanup)
+            cleanup.add_done_callback(self._abandoned_builds.discard)
+            raise
+        except Exception:
+            log.exception(f"Failed to build module {mod.name} at port {mod.port}")
+            raise
+
+        later = [
+            module
+            for i, module in sorted(attached.items())
+            if i > index and module in self._available_modules
+        ]
+        if later:
+            position = self._available_modules.index(later[0])
+            self._available_modules.insert(position, new_instance)
+        else:
+            self._available_modules.append(new_instance)
+        attached[index] = new_instance
+        log.info(
+            f"Module {mod.name} discovered and attached"
+            f" at port {mod.port}, new_instance: {new_instance}"
+        )
+
+    @staticmethod
+    async def _cleanup_when_built(
+        build: "asyncio.Future[modules.AbstractModule]",
+    ) -> None:
+        """Clean up a module that was abandoned before it was built."""
+        try:
+            module = await build
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Failed to build abandoned module")
+            return
+        log.info(f"Cleaning up abandoned module at port {module.port}")
+        await module.cleanup()
+
+    def clean_up(self) -> None:
+        """Stop waiting for modules that were abandoned before they were built."""
+        for cleanup in list(self._abandoned_builds):
+            cleanup.cancel()
 
     async def parse_modules(
         self,
@@ -161,6 +250,7 @@ class AttachedModulesControl:
                     execution_manager=ExecutionManager(loop=self.api.loop),
                     sim_model=by_model.value,
                 )
+                simulating_module.set_time_estimator(self.api.time_estimator)
                 simulated_module = simulating_module
         return matching_modules, simulated_module
 
@@ -8,6 +8,7 @@ from opentrons.config import IS_ROBOT, ROBOT_FIRMWARE_DIR
 from opentrons.hardware_control.util import use_or_initialize_loop
 from opentrons.drivers.rpi_drivers.types import USBPort
 from ..execution_manager import ExecutionManager
+from ..time_estimator import TimeEstimator
 from .types import BundledFirmware, UploadFunction, InterruptCallback, LiveData
 
 mod_log = logging.getLogger(__name__)
@@ -50,6 +51,12 @@ class AbstractModule(abc.ABC):
         self._loop = use_or_initialize_loop(loop)
         self._execution_manager = execution_manager
         self._bundled_fw: Optional[BundledFirmware] = self.get_bundled_fw()
+        self._time_estimator: Optional[TimeEstimator] = None
+
+    def set_time_estimator(self, time_estimator: Optional[TimeEstimator]) -> None:
+        """Charge the estimated duration of this (simulated) module's actions
+        to a hardware simulator's time estimate."""
+        self._time_estimator = time_estimator
 
     def get_bundled_fw(self) -> Optional[BundledFirmware]:
         """Get absolute path to bundled version of module fw if available."""
@@ -3,7 +3,12 @@ import logging
 from typing import Mapping, Optional
 
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    IDLE_INTERVAL_MULTIPLIER,
+)
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -14,6 +19,7 @@ from opentrons.drivers.temp_deck import (
 from opentrons.drivers.rpi_drivers.types import USBPort
 from opentrons.hardware_control.execution_manager import ExecutionManager
 from opentrons.hardware_control.modules import update, mod_abc, types
+from opentrons.hardware_control.time_estimator import TEMPDECK_RAMP_RATE
 
 log = logging.getLogger(__name__)
 
@@ -76,6 +82,7 @@ class TempDeck(mod_abc.AbstractModule):
             loop=loop,
             polling_frequency=polling_frequency,
         )
+        await mod._poller.wait_first_poll()
         return mod
 
     def __init__(
@@ -95,11 +102,13 @@ class TempDeck(mod_abc.AbstractModule):
         self._device_info = device_info
         self._driver = driver
         self._listener = TempdeckListener(loop=loop)
+        self._ramp_done_at = 0.0
         self._poller = Poller(
             reader=PollerReader(driver=self._driver),
             interval_seconds=polling_frequency,
             listener=self._listener,
             loop=loop,
+            idle_interval_seconds=polling_frequency * IDLE_INTERVAL_MULTIPLIER,
         )
 
     async def cleanup(self) -> None:
@@ -130,10 +139,14 @@ class TempDeck(mod_abc.AbstractModule):
         to the nearest limit
         """
         await self.wait_for_is_running()
+        self._estimate_ramp(celsius)
         await self._driver.set_temperature(celsius=celsius)
+        # Don't check the status until a poll has seen the new target
+        await self.wait_next_poll()
         # Wait until we reach the target temperature.
         while self.status != TemperatureStatus.HOLDING:
             await self.wait_next_poll()
+        self._estimate_ramp_wait()
 
     async def start_set_temperature(self, celsius) -> None:
         """
@@ -144,7 +157,10 @@ class TempDeck(mod_abc.AbstractModule):
         to the nearest limit
         """
         await self.wait_for_is_running()
+        self._estimate_ramp(celsius)
         await self._driver.set_temperature(celsius)
+        # The poller may be idle, so get the status for the new target now
+        await self.wait_next_poll()
 
     async def await_temperature(self, awaiting_temperature: float):
         """
@@ -153,6 +169,7 @@ class TempDeck(mod_abc.AbstractModule):
         the specified temperature is reached
         """
         if self.is_simulated:
+            self._estimate_ramp_wait()
             return
 
         await self.wait_for_is_running()
@@ -166,6 +183,18 @@ class TempDeck(mod_abc.AbstractModule):
 
         return
 
+    def _estimate_ramp(self, celsius: float) -> None:
+        """Note when a simulated ramp to a new target would finish."""
+        if self._time_estimator:
+            self._ramp_done_at = self._time_estimator.elapsed + (
+                TEMPDECK_RAMP_RATE.seconds(self.temperature, celsius)
+            )
+
+    def _estimate_ramp_wait(self) -> None:
+        """Charge the wait for a simulated ramp to finish."""
+        if self._time_estimator:
+            self._time_estimator.wait_until(self._ramp_done_at)
+
     async def deactivate(self):
         """Stop heating/cooling and turn off the fan"""
         await self.wait_for_is_running()
@@ -297,6 +326,13 @@ class TempdeckListener(WaitableListener[Temperature]):
         self._polled_data = result
         return super().on_poll(result)
 
+    def wants_fast_poll(self) -> bool:
+        """Poll quickly while the temperature is changing."""
+        return super().wants_fast_poll() or TempDeck._get_status(self._polled_data) in (
+            TemperatureStatus.HEATING,
+            TemperatureStatus.COOLING,
+        )
+
     def on_error(self, exc: Exception) -> None:
         """On error."""
         if self._callback:
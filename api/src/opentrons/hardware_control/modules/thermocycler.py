@@ -1,15 +1,24 @@
 import asyncio
 import logging
 from typing import Optional, List, Dict, Mapping
-from dataclasses import dataclass
 from opentrons.drivers.rpi_drivers.types import USBPort
-from opentrons.drivers.types import ThermocyclerLidStatus, Temperature, PlateTemperature
+from opentrons.drivers.types import ThermocyclerLidStatus, ThermocyclerStatus
 from opentrons.hardware_control.modules.lid_temp_status import LidTemperatureStatus
 from opentrons.hardware_control.modules.plate_temp_status import PlateTemperatureStatus
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    IDLE_INTERVAL_MULTIPLIER,
+)
 
 from ..execution_manager import ExecutionManager
+from ..time_estimator import (
+    THERMOCYCLER_BLOCK_RAMP_RATE,
+    THERMOCYCLER_LID_MOTION_SEC,
+    THERMOCYCLER_LID_RAMP_RATE,
+)
 from . import types, update, mod_abc
 from opentrons.drivers.thermocycler import (
     AbstractThermocyclerDriver,
@@ -84,6 +93,7 @@ class Thermocycler(mod_abc.AbstractModule):
             execution_manager=execution_manager,
             polling_interval_sec=polling_frequency,
         )
+        await mod._poller.wait_first_poll()
         return mod
 
     def __init__(
@@ -123,6 +133,7 @@ class Thermocycler(mod_abc.AbstractModule):
             listener=self._listener,
             reader=PollerReader(driver=self._driver),
             loop=loop,
+            idle_interval_seconds=polling_interval_sec * IDLE_INTERVAL_MULTIPLIER,
         )
         self._hold_time_fuzzy_seconds = polling_interval_sec * 5
         self._interrupt_cb = interrupt_callback
@@ -174,6 +185,7 @@ class Thermocycler(mod_abc.AbstractModule):
     async def open(self) -> str:
         """Open the lid if it is closed"""
         await self.wait_for_is_running()
+        self._estimate_lid_motion(ThermocyclerLidStatus.OPEN)
         await self._driver.open_lid()
         await self._wait_for_lid_status(ThermocyclerLidStatus.OPEN)
         return ThermocyclerLidStatus.OPEN
@@ -181,10 +193,16 @@ class Thermocycler(mod_abc.AbstractModule):
     async def close(self) -> str:
         """Close the lid if it is open"""
         await self.wait_for_is_running()
+        self._estimate_lid_motion(ThermocyclerLidStatus.CLOSED)
         await self._driver.close_lid()
         await self._wait_for_lid_status(ThermocyclerLidStatus.CLOSED)
         return ThermocyclerLidStatus.CLOSED
 
+    def _estimate_lid_motion(self, status: ThermocyclerLidStatus) -> None:
+        """Charge a simulated lid motion, if the lid is not there already."""
+        if self._time_estimator and self.lid_status != status:
+            self._time_estimator.wait(THERMOCYCLER_LID_MOTION_SEC)
+
     def hold_time_probably_set(self, new_hold_time: Optional[float]) -> bool:
         """
         Since we can only get hold time *remaining* from TC, by the time we
@@ -234,6 +252,13 @@ class Thermocycler(mod_abc.AbstractModule):
         hold_time = total_seconds if total_seconds > 0 else 0
         if ramp_rate is not None:
             await self._driver.set_ramp_rate(ramp_rate=ramp_rate)
+        if self._time_estimator:
+            self._time_estimator.wait(
+                THERMOCYCLER_BLOCK_RAMP_RATE.seconds(
+                    self.temperature, temperature, ramp_rate
+                )
+                + hold_time
+            )
         await self._driver.set_plate_temperature(
             temp=temperature, hold_time=hold_time, volume=volume
         )
@@ -285,6 +310,10 @@ class Thermocycler(mod_abc.AbstractModule):
     async def set_lid_temperature(self, temperature: float) -> None:
         """Set the lid temperature in deg Celsius"""
         await self.wait_for_is_running()
+        if self._time_estimator:
+            self._time_estimator.wait(
+                THERMOCYCLER_LID_RAMP_RATE.seconds(self.lid_temp, temperature)
+            )
         await self._driver.set_lid_temperature(temp=temperature)
         # Wait for target to be set
         retries = 0
@@ -507,11 +536,7 @@ class Thermocycler(mod_abc.AbstractModule):
                 await self._wait_for_hold()
 
 
-@dataclass
-class PolledData:
-    lid_status: ThermocyclerLidStatus
-    lid_temperature: Temperature
-    plate_temperature: PlateTemperature
+PolledData = ThermocyclerStatus
 
 
 class PollerReader(Reader[PolledData]):
@@ -523,14 +548,7 @@ class PollerReader(Reader[PolledData]):
 
     async def read(self) -> PolledData:
         """Poll the thermocycler."""
-        lid_status = await self._driver.get_lid_status()
-        lid_temperature = await self._driver.get_lid_temperature()
-        plate_temperature = await self._driver.get_plate_temperature()
-        return PolledData(
-            lid_status=lid_status,
-            lid_temperature=lid_temperature,
-            plate_temperature=plate_temperature,
-        )
+        return await self._driver.get_status()
 
 
 class ThermocyclerListener(WaitableListener[PolledData]):
@@ -567,6 +585,19 @@ class ThermocyclerListener(WaitableListener[PolledData]):
         self._lid_temperature_status.update(result.lid_temperature)
         return super().on_poll(result)
 
+    def wants_fast_poll(self) -> bool:
+        """Poll quickly while a temperature is changing, a hold is counting
+        down or the lid is moving."""
+        if super().wants_fast_poll() or self._polled_data is None:
+            return True
+        ramping = (TemperatureStatus.HEATING, TemperatureStatus.COOLING)
+        return (
+            self.plate_status in ramping
+            or self.lid_status in ramping
+            or bool(self._polled_data.plate_temperature.hold)
+            or self._polled_data.lid_status == ThermocyclerLidStatus.IN_BETWEEN
+        )
+
     def on_error(self, exc: Exception) -> None:
         """On error."""
         if self._callback:
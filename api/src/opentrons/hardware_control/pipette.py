@@ -67,8 +67,10 @@ class Pipette:
                 config.model, self._pipette_offset.offset
             )
         )
-        self.ready_to_aspirate = False
-        #: True if ready to aspirate
+        #: Incremented on every change to what :py:meth:`as_dict` or the
+        #: hardware controller's pipette dict report
+        self._version = 0
+        self._ready_to_aspirate = False
         self._aspirate_flow_rate = self._config.default_aspirate_flow_rates["2.0"]
         self._dispense_flow_rate = self._config.default_dispense_flow_rates["2.0"]
         self._blow_out_flow_rate = self._config.default_blow_out_flow_rates["2.0"]
@@ -97,6 +99,22 @@ class Pipette:
     def acting_as(self) -> PipetteName:
         return self._acting_as
 
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever the pipette's state does, so a
+        snapshot of the state can be kept until it changes again"""
+        return self._version
+
+    @property
+    def ready_to_aspirate(self) -> bool:
+        """True if ready to aspirate"""
+        return self._ready_to_aspirate
+
+    @ready_to_aspirate.setter
+    def ready_to_aspirate(self, ready: bool):
+        self._ready_to_aspirate = ready
+        self._version += 1
+
     def update_pipette_offset(self, offset_cal: PipetteOffsetByPipetteMount):
         self._log.info("updating pipette offset to {}".format(offset_cal.offset))
         self._pipette_offset = offset_cal
@@ -114,6 +132,7 @@ class Pipette:
         self._config = replace(self._config, **{elem_name: elem_val})
         # Update the cached dict representation
         self._config_as_dict = asdict(self._config)
+        self._version += 1
 
     @property
     def name(self) -> PipetteName:
@@ -187,6 +206,7 @@ class Pipette:
     @current_tip_length.setter
     def current_tip_length(self, tip_length: float):
         self._current_tip_length = tip_length
+        self._version += 1
 
     @property
     def current_tiprack_diameter(self) -> float:
@@ -206,6 +226,7 @@ class Pipette:
     def aspirate_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._aspirate_flow_rate = new_flow_rate
+        self._version += 1
 
     @property
     def dispense_flow_rate(self) -> float:
@@ -216,6 +237,7 @@ class Pipette:
     def dispense_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._dispense_flow_rate = new_flow_rate
+        self._version += 1
 
     @property
     def blow_out_flow_rate(self) -> float:
@@ -226,6 +248,7 @@ class Pipette:
     def blow_out_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._blow_out_flow_rate = new_flow_rate
+        self._version += 1
 
     @property
     def working_volume(self) -> float:
@@ -236,6 +259,7 @@ class Pipette:
     def working_volume(self, tip_volume: float):
         """The working volume is the current tip max volume"""
         self._working_volume = min(self.config.max_volume, tip_volume)
+        self._version += 1
 
     @property
     def available_volume(self) -> float:
@@ -246,14 +270,17 @@ class Pipette:
         assert new_volume >= 0
         assert new_volume <= self.working_volume
         self._current_volume = new_volume
+        self._version += 1
 
     def add_current_volume(self, volume_incr: float):
         assert self.ok_to_add_volume(volume_incr)
         self._current_volume += volume_incr
+        self._version += 1
 
     def remove_current_volume(self, volume_incr: float):
         assert self._current_volume >= volume_incr
         self._current_volume -= volume_incr
+        self._version += 1
 
     def ok_to_add_volume(self, volume_incr: float) -> bool:
         return self.current_volume + volume_incr <= self.working_volume
@@ -271,6 +298,7 @@ class Pipette:
         assert not self.has_tip
         self._has_tip = True
         self._current_tip_length = tip_length
+        self._version += 1
 
     def remove_tip(self) -> None:
         """
@@ -280,6 +308,7 @@ class Pipette:
         assert self.has_tip
         self._has_tip = False
         self._current_tip_length = 0.0
+        self._version += 1
 
     @property
     def has_tip(self) -> bool:
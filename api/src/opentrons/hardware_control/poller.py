@@ -1,10 +1,26 @@
+from __future__ import annotations
+
 import asyncio
 from abc import abstractmethod, ABC
 from collections import deque
-from typing import TypeVar, Generic, Deque, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+    Generic,
+    Deque,
+    List,
+    Optional,
+    Set,
+)
 
 DataT = TypeVar("DataT")
 
+IDLE_INTERVAL_MULTIPLIER = 5
+"""How many times longer than its interval an idle poller waits between
+polls."""
+
 
 class Reader(ABC, Generic[DataT]):
     """Interface of poller target."""
@@ -55,6 +71,29 @@ class Listener(ABC, Generic[DataT]):
         """
         ...
 
+    def wants_fast_poll(self) -> bool:
+        """
+        Called by poller after each poll to choose when to poll next.
+
+        Returns: True if the listener needs prompt updates, for instance
+            because a temperature is changing or someone is waiting on the
+            next poll. Listeners that don't override this are always polled
+            at the fast rate.
+        """
+        return True
+
+    def set_wake_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Called by poller with a function that makes it poll at the fast rate
+        again if it has slowed down.
+
+        Args:
+            callback: The function to call.
+
+        Returns: None
+        """
+        pass
+
 
 class WaitableListener(Listener[DataT]):
     """A listener that can be waited on."""
@@ -63,6 +102,7 @@ class WaitableListener(Listener[DataT]):
         """Constructor."""
         self._loop = loop or asyncio.get_running_loop()
         self._futures: Deque[asyncio.Future] = deque()
+        self._wake: Optional[Callable[[], None]] = None
 
     async def wait_next_poll(self) -> DataT:
         """
@@ -72,8 +112,18 @@ class WaitableListener(Listener[DataT]):
         """
         f = self._loop.create_future()
         self._futures.append(f)
+        if self._wake:
+            self._wake()
         return await f
 
+    def wants_fast_poll(self) -> bool:
+        """Poll quickly while anyone is waiting for the next poll."""
+        return bool(self._futures)
+
+    def set_wake_callback(self, callback: Callable[[], None]) -> None:
+        """Store the callback to call when someone starts waiting."""
+        self._wake = callback
+
     def on_poll(self, result: DataT) -> None:
         """Handle a new poll"""
         self._notify(result)
@@ -100,7 +150,11 @@ class WaitableListener(Listener[DataT]):
 
 
 class Poller(Generic[DataT]):
-    """Asyncio poller."""
+    """Asyncio poller.
+
+    Pollers don't run their own tasks; every poller on an event loop is
+    driven by that loop's :py:class:`PollScheduler`.
+    """
 
     def __init__(
         self,
@@ -108,6 +162,7 @@ class Poller(Generic[DataT]):
         reader: Reader[DataT],
         listener: Listener[DataT],
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        idle_interval_seconds: Optional[float] = None,
     ) -> None:
         """
         Constructor.
@@ -117,37 +172,193 @@ class Poller(Generic[DataT]):
             reader: The data reader.
             listener: event listener.
             loop: Optional event loop to use
+            idle_interval_seconds: Optional time in between polls while the
+                listener doesn't want fast polls. If None, always poll every
+                interval_seconds.
         """
         loop = loop or asyncio.get_running_loop()
-        self._shutdown_event = asyncio.Event(loop=loop)
         self._interval = interval_seconds
+        self._idle_interval = idle_interval_seconds or interval_seconds
         self._listener = listener
         self._reader = reader
-        self._task = loop.create_task(self._poller())
+        self._last_poll = loop.time()
+        self.next_poll = self._last_poll
+        self.polling = False
+        self.stopping = False
+        self._polled: asyncio.Future = loop.create_future()
+        self._terminated: asyncio.Future = loop.create_future()
+        self._scheduler = PollScheduler.for_loop(loop)
+        listener.set_wake_callback(self._hurry)
+        self._scheduler.add(self)
 
     def stop(self) -> None:
         """Signal poller to stop."""
-        self._shutdown_event.set()
+        self.stopping = True
+        self._scheduler.wake()
 
     async def stop_and_wait(self) -> None:
         """Stop poller and wait for it to terminate."""
         self.stop()
-        await self._task
+        await asyncio.shield(self._terminated)
+
+    async def wait_first_poll(self) -> None:
+        """Wait until the poller has polled once, whether or not it succeeded."""
+        await asyncio.shield(self._polled)
 
-    async def _poller(self) -> None:
-        """Poll task entrypoint."""
-        while True:
+    async def poll(self) -> None:
+        """
+        Poll once, unless stopping, and terminate if stopping.
+
+        A poller always polls at least once, even if stopped straight away.
+        """
+        if not self.stopping or not self._polled.done():
             try:
                 poll = await self._reader.read()
                 self._listener.on_poll(poll)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 self._listener.on_error(e)
+            if not self._polled.done():
+                self._polled.set_result(None)
+
+        loop = self._scheduler.loop
+        self._last_poll = loop.time()
+        if self.stopping:
+            self._listener.on_terminated()
+            self._terminated.set_result(None)
+        elif self._listener.wants_fast_poll():
+            self.next_poll = self._last_poll + self._interval
+        else:
+            self.next_poll = self._last_poll + self._idle_interval
+
+    @property
+    def terminated(self) -> bool:
+        """Whether the poller has terminated."""
+        return self._terminated.done()
+
+    def _hurry(self) -> None:
+        """Bring the next poll forward to the fast rate."""
+        self.next_poll = min(self.next_poll, self._last_poll + self._interval)
+        self._scheduler.wake()
+
+
+class PollScheduler:
+    """Drive all the pollers on an event loop from a single task.
+
+    The task sleeps until the next poller is due (or until woken by a poller
+    being added, stopped or hurried) and then starts the polls that are due.
+    Each poll runs on its own, so a slow device doesn't hold up the others.
+
+    A scheduler is dropped once its last poller terminates, when it is closed
+    along with the hardware, or once its loop is closed, and a new one is
+    created for the loop if a poller is added afterwards.
+    """
+
+    _schedulers: Dict[asyncio.AbstractEventLoop, PollScheduler] = {}
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop) -> PollScheduler:
+        """
+        Get the scheduler for an event loop, creating it if needed.
+
+        Args:
+            loop: The event loop.
+
+        Returns: The scheduler.
+        """
+        for closed_loop in [other for other in cls._schedulers if other.is_closed()]:
+            del cls._schedulers[closed_loop]
+
+        scheduler = cls._schedulers.get(loop)
+        if scheduler is None:
+            scheduler = cls(loop=loop)
+            cls._schedulers[loop] = scheduler
+        return scheduler
+
+    @classmethod
+    def close_loop(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Stop driving the pollers on an event loop, e.g. on shutting down.
+
+        Args:
+            loop: The event loop.
+
+        Returns: None
+        """
+        scheduler = cls._schedulers.pop(loop, None)
+        if scheduler is not None:
+            scheduler._close()
 
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Constructor.
+
+        Args:
+            loop: The event loop to run on.
+        """
+        self.loop = loop
+        self._pollers: List[Poller[Any]] = []
+        self._wake_event = asyncio.Event(loop=loop)
+        self._task: Optional[asyncio.Task] = None
+        # The running polls, kept until they're done so that they aren't
+        # garbage collected while they wait
+        self._poll_tasks: Set[asyncio.Task] = set()
+
+    def add(self, poller: Poller[Any]) -> None:
+        """
+        Start driving a poller. Its first poll is started straight away.
+
+        Args:
+            poller: The poller.
+
+        Returns: None
+        """
+        self._pollers.append(poller)
+        self._start_poll(poller)
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(self._run())
+
+    def wake(self) -> None:
+        """Make the scheduler recheck which pollers are due."""
+        self._wake_event.set()
+
+    async def _run(self) -> None:
+        """Scheduler task entrypoint. Exits once there are no pollers."""
+        while self._pollers:
+            self._wake_event.clear()
+            now = self.loop.time()
+            for poller in self._pollers:
+                if not poller.polling and (poller.stopping or poller.next_poll <= now):
+                    self._start_poll(poller)
+
+            waiting = [p.next_poll for p in self._pollers if not p.polling]
+            timeout = max(min(waiting) - now, 0) if waiting else None
             try:
-                await asyncio.wait_for(self._shutdown_event.wait(), self._interval)
+                await asyncio.wait_for(self._wake_event.wait(), timeout)
             except asyncio.TimeoutError:
                 pass
-            else:
-                break
 
-        self._listener.on_terminated()
+        if self._schedulers.get(self.loop) is self:
+            del self._schedulers[self.loop]
+
+    def _start_poll(self, poller: Poller[Any]) -> None:
+        poller.polling = True
+        task = self.loop.create_task(self._poll(poller))
+        self._poll_tasks.add(task)
+        task.add_done_callback(self._poll_tasks.discard)
+
+    def _close(self) -> None:
+        """Cancel the scheduler task and any running polls."""
+        for task in [self._task, *self._poll_tasks]:
+            if task is not None:
+                task.cancel()
+
+    async def _poll(self, poller: Poller[Any]) -> None:
+        try:
+            await poller.poll()
+        finally:
+            poller.polling = False
+            if poller.terminated:
+                self._pollers.remove(poller)
+            self.wake()
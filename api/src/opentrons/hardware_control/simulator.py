@@ -19,6 +19,7 @@ from opentrons.drivers.rpi_drivers import usb_simulator
 from . import modules
 from .types import BoardRevision, Axis
 from .module_control import AttachedModulesControl
+from .time_estimator import TimeEstimator
 
 
 if TYPE_CHECKING:
@@ -159,6 +160,7 @@ class Simulator:
         # manager responsbility into the controller/backend itself as opposed
         # to the hardware api controller.
         self._module_controls: Optional[AttachedModulesControl] = None
+        self._time_estimator = TimeEstimator(config)
 
     @property
     def gpio_chardev(self) -> GPIODriverLike:
@@ -174,6 +176,11 @@ class Simulator:
     def module_controls(self, module_controls: AttachedModulesControl):
         self._module_controls = module_controls
 
+    @property
+    def time_estimator(self) -> TimeEstimator:
+        """How long the simulated actions would have taken on a robot."""
+        return self._time_estimator
+
     async def update_position(self) -> Dict[str, float]:
         return self._position
 
@@ -184,19 +191,26 @@ class Simulator:
         speed: float = None,
         axis_max_speeds: Dict[str, float] = None,
     ):
+        self._time_estimator.move(
+            self._position, target_position, speed, axis_max_speeds
+        )
         self._position.update(target_position)
         self._engaged_axes.update({ax: True for ax in target_position})
 
     async def home(self, axes: List[str] = None) -> Dict[str, float]:
         # driver_3_0-> HOMED_POSITION
         checked_axes = axes or "XYZABC"
-        self._position.update(
-            {ax: self._smoothie_driver.homed_position[ax] for ax in checked_axes}
-        )
+        homed = {ax: self._smoothie_driver.homed_position[ax] for ax in checked_axes}
+        self._time_estimator.home(self._position, homed)
+        self._position.update(homed)
         self._engaged_axes.update({ax: True for ax in checked_axes})
         return self._position
 
     async def fast_home(self, axis: Sequence[str], margin: float) -> Dict[str, float]:
+        self._time_estimator.home(
+            self._position,
+            {ax: self._smoothie_driver.homed_position[ax] for ax in axis},
+        )
         for ax in axis:
             self._position[ax] = self._smoothie_driver.homed_position[ax]
             self._engaged_axes[ax] = True
@@ -341,6 +355,7 @@ class Simulator:
         self._run_flag.set()
 
     async def probe(self, axis: str, distance: float) -> Dict[str, float]:
+        self._time_estimator.probe(self._position, axis.upper(), distance)
         self._position[axis.upper()] = self._position[axis.upper()] + distance
         return self._position
 
@@ -368,3 +383,4 @@ class Simulator:
         ms = config["splits"]
         if ms:
             self._smoothie_driver.configure_splits_for({plunger_axis.name: ms})
+            self._time_estimator.configure_splits_for({plunger_axis.name: ms})
@@ -5,7 +5,7 @@ import logging
 import asyncio
 import functools
 import weakref
-from typing import Generic, TypeVar, Any, Optional
+from typing import Generic, TypeVar, Any, Dict, Optional, Tuple
 from .adapters import SynchronousAdapter
 from .modules.mod_abc import AbstractModule
 
@@ -33,6 +33,9 @@ class CallBridger(Generic[WrappedObj]):
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # Resolved methods by name, along with the function and instance
+        # they were resolved from
+        self._wrappers: Dict[str, Tuple[Any, Any, Any]] = {}
 
     def __getattribute__(self, attr_name: str) -> Any:
         # Almost every attribute retrieved from us will be for people actually
@@ -45,6 +48,14 @@ class CallBridger(Generic[WrappedObj]):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
+        # A method resolves the same way until it is replaced
+        func = getattr(attr, "__func__", None)
+        if func is not None:
+            wrappers = object.__getattribute__(self, "_wrappers")
+            cached = wrappers.get(attr_name)
+            if cached is not None and cached[0] is func and cached[1] is attr.__self__:
+                return cached[2]
+
         if asyncio.iscoroutinefunction(attr):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
@@ -53,7 +64,7 @@ class CallBridger(Generic[WrappedObj]):
             async def wrapper(*args, **kwargs):
                 return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
 
-            return wrapper
+            resolved = wrapper
 
         elif asyncio.iscoroutine(attr):
             # Return awaitable coroutine properties run in managed thread/loop
@@ -61,7 +72,12 @@ class CallBridger(Generic[WrappedObj]):
             wrapped = asyncio.wrap_future(fut)
             return wrapped
 
-        return attr
+        else:
+            resolved = attr
+
+        if func is not None:
+            wrappers[attr_name] = (func, attr.__self__, resolved)
+        return resolved
 
 
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
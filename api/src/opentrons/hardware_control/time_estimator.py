@@ -0,0 +1,237 @@
+""" Estimation of how long simulated hardware actions would take on a robot.
+
+The hardware simulator completes every action instantly. A
+:py:class:`TimeEstimator` owned by the simulator is told about each action as
+it happens and keeps a running total of how long a real robot would have
+spent on them, using the same kinematic limits the Smoothie is configured
+with and simple linear ramp models for modules.
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, cast
+
+from opentrons.config.types import RobotConfig
+from opentrons.drivers.smoothie_drivers.constants import DEFAULT_AXES_SPEED
+from opentrons.drivers.types import MoveSplits
+
+#: The axes whose motion is coordinated by the combined (feed) speed
+GANTRY_AXES = "XYZA"
+
+
+@dataclass(frozen=True)
+class RampRate:
+    """A linear model of how quickly a module changes temperature."""
+
+    #: Degrees Celsius per second while heating
+    heating: float
+    #: Degrees Celsius per second while cooling
+    cooling: float
+
+    def seconds(
+        self,
+        start: Optional[float],
+        target: Optional[float],
+        max_rate: Optional[float] = None,
+    ) -> float:
+        """Time to go from one temperature to another.
+
+        :param start: The temperature before the change, if known
+        :param target: The temperature to reach, if any
+        :param max_rate: A ramp rate requested by the protocol, in degrees
+                         Celsius per second, that further limits the model
+        """
+        if start is None or target is None or start == target:
+            return 0.0
+        rate = self.heating if target > start else self.cooling
+        if max_rate:
+            rate = min(rate, max_rate)
+        return abs(target - start) / rate
+
+
+TEMPDECK_RAMP_RATE = RampRate(heating=0.25, cooling=0.1)
+THERMOCYCLER_BLOCK_RAMP_RATE = RampRate(heating=4.0, cooling=2.0)
+THERMOCYCLER_LID_RAMP_RATE = RampRate(heating=0.5, cooling=0.2)
+#: Seconds for the thermocycler lid to open or close
+THERMOCYCLER_LID_MOTION_SEC = 20.0
+
+
+def trapezoid_time(distance: float, max_speed: float, acceleration: float) -> float:
+    """Time to cover a distance from rest to rest with a trapezoidal profile.
+
+    :param distance: The (absolute) distance to cover, in mm
+    :param max_speed: The cruising speed, in mm/s
+    :param acceleration: The acceleration and deceleration, in mm/s^2
+    :returns: The duration of the move in seconds
+    """
+    if distance <= 0 or max_speed <= 0:
+        return 0.0
+    if acceleration <= 0:
+        return distance / max_speed
+    if distance >= max_speed ** 2 / acceleration:
+        # accelerate to cruise, cruise, then decelerate
+        return distance / max_speed + max_speed / acceleration
+    # never reaches cruising speed: accelerate halfway, decelerate halfway
+    return 2 * math.sqrt(distance / acceleration)
+
+
+class TimeEstimator:
+    """Accumulate the estimated duration of simulated hardware actions."""
+
+    def __init__(self, config: RobotConfig) -> None:
+        """Build the estimator.
+
+        :param config: The robot config whose per-axis max speeds and
+                       accelerations bound every move
+        """
+        self._max_speeds = cast(Dict[str, float], config.default_max_speed.copy())
+        self._accelerations = config.acceleration.copy()
+        self._splits: MoveSplits = {}
+        self._moved_at: Dict[str, float] = {}
+        self._elapsed = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Total estimated seconds of everything recorded so far."""
+        return self._elapsed
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self._elapsed = 0.0
+        self._moved_at.clear()
+
+    def configure_splits_for(self, config: MoveSplits) -> None:
+        """Mirror the driver's move split configuration for plunger axes."""
+        self._splits.update(config)
+
+    def wait(self, seconds: float) -> float:
+        """Record time spent waiting, e.g. for a delay or a module hold.
+
+        :returns: The seconds recorded
+        """
+        seconds = max(seconds, 0.0)
+        self._elapsed += seconds
+        return seconds
+
+    def wait_until(self, deadline: float) -> float:
+        """Record waiting until the running total reaches ``deadline``, e.g.
+        for a module that was told to start heating earlier.
+
+        :returns: The seconds recorded
+        """
+        return self.wait(deadline - self._elapsed)
+
+    def move(
+        self,
+        start: Mapping[str, float],
+        target: Mapping[str, float],
+        speed: Optional[float] = None,
+        axis_max_speeds: Optional[Mapping[str, float]] = None,
+    ) -> float:
+        """Record a move the way the Smoothie driver would execute it.
+
+        If a plunger axis with a split configuration has not moved for its
+        ``after_time``, the first ``split_distance`` of its travel is done as
+        a separate move at the split speed, like the driver does.
+
+        :param start: The position of every axis before the move
+        :param target: The target positions of the axes being moved
+        :param speed: The combined speed of the move in mm/s, or ``None``
+                      for the driver default
+        :param axis_max_speeds: Temporary per-axis speed limits
+        :returns: The seconds recorded
+        """
+        distances = {
+            ax: abs(float(pos) - float(start[ax]))
+            for ax, pos in target.items()
+            if ax in start and not math.isclose(pos, start[ax], abs_tol=1e-08)
+        }
+        if not distances:
+            return 0.0
+
+        split_distances = self._split_distances(distances)
+        duration = 0.0
+        if split_distances:
+            split_speed = min(self._splits[ax].split_speed for ax in split_distances)
+            duration += self._move_time(split_distances, split_speed, {})
+            distances = {
+                ax: dist - split_distances.get(ax, 0.0)
+                for ax, dist in distances.items()
+            }
+
+        duration += self._move_time(
+            distances, speed or float(DEFAULT_AXES_SPEED), axis_max_speeds or {}
+        )
+        self._elapsed += duration
+        for ax in distances:
+            self._moved_at[ax] = self._elapsed
+        return duration
+
+    def _split_distances(self, distances: Mapping[str, float]) -> Dict[str, float]:
+        def needs_split(ax: str) -> bool:
+            split = self._splits.get(ax)
+            if not split:
+                return False
+            moved_at = self._moved_at.get(ax)
+            return moved_at is None or split.after_time < self._elapsed - moved_at
+
+        return {
+            ax: min(dist, self._splits[ax].split_distance)
+            for ax, dist in distances.items()
+            if needs_split(ax)
+        }
+
+    def _move_time(
+        self,
+        distances: Mapping[str, float],
+        speed: float,
+        axis_max_speeds: Mapping[str, float],
+    ) -> float:
+        """Time for a coordinated move.
+
+        The combined speed applies to the length of the gantry move, or to
+        the plungers if the gantry is still; each axis additionally limits
+        the move to its own max speed and acceleration.
+        """
+        gantry = {ax: d for ax, d in distances.items() if ax in GANTRY_AXES and d > 0}
+        others = {ax: d for ax, d in distances.items() if ax not in gantry and d > 0}
+
+        times = [0.0]
+        if gantry:
+            times.append(self._vector_time(gantry, speed, axis_max_speeds))
+        for ax, dist in others.items():
+            feed = float("inf") if gantry else speed
+            times.append(self._vector_time({ax: dist}, feed, axis_max_speeds))
+        return max(times)
+
+    def _vector_time(
+        self,
+        distances: Mapping[str, float],
+        speed: float,
+        axis_max_speeds: Mapping[str, float],
+    ) -> float:
+        length = math.sqrt(sum(d ** 2 for d in distances.values()))
+        max_speed = speed
+        acceleration = float("inf")
+        for ax, dist in distances.items():
+            scale = length / dist
+            axis_speed = axis_max_speeds.get(ax, self._max_speeds.get(ax, speed))
+            max_speed = min(max_speed, axis_speed * scale)
+            axis_accel = self._accelerations.get(ax)
+            if axis_accel:
+                acceleration = min(acceleration, axis_accel * scale)
+        if math.isinf(acceleration):
+            acceleration = 0.0
+        return trapezoid_time(length, max_speed, acceleration)
+
+    def home(self, start: Mapping[str, float], homed: Mapping[str, float]) -> float:
+        """Record homing the given axes, as a move to their home positions.
+
+        :param start: The position of every axis before homing
+        :param homed: The home positions of the axes being homed
+        :returns: The seconds recorded
+        """
+        return self.move(start, homed)
+
+    def probe(self, start: Mapping[str, float], axis: str, distance: float) -> float:
+        """Record a probe of a single axis over a distance."""
+        return self.move(start, {axis: start[axis] + distance})
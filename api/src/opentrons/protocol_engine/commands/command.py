@@ -77,6 +77,13 @@ class BaseCommand(GenericModel, Generic[CommandDataT, CommandResultT]):
         None,
         description="Command execution completed timestamp, if completed",
     )
+    estimatedDuration: Optional[float] = Field(
+        None,
+        description=(
+            "How many seconds the command is estimated to take on a robot,"
+            " if it was executed by a simulation"
+        ),
+    )
 
 
 class AbstractCommandImpl(
@@ -2,6 +2,8 @@
 from logging import getLogger
 from typing import Optional
 
+from opentrons.hardware_control.time_estimator import TimeEstimator
+
 from ..state import StateStore, UpdateCommandAction
 from ..resources import ModelUtils
 from ..commands import CommandStatus, CommandMapper
@@ -29,8 +31,13 @@ class CommandExecutor:
         run_control: RunControlHandler,
         command_mapper: Optional[CommandMapper] = None,
         model_utils: Optional[ModelUtils] = None,
+        time_estimator: Optional[TimeEstimator] = None,
     ) -> None:
-        """Initialize the CommandExecutor with access to its dependencies."""
+        """Initialize the CommandExecutor with access to its dependencies.
+
+        If the hardware is simulated, its `time_estimator` is used to
+        estimate how long each command would take to execute on a robot.
+        """
         self._state_store = state_store
         self._equipment = equipment
         self._movement = movement
@@ -38,6 +45,7 @@ class CommandExecutor:
         self._run_control = run_control
         self._command_mapper = command_mapper or CommandMapper()
         self._model_utils = model_utils or ModelUtils()
+        self._time_estimator = time_estimator
 
     async def execute(self, command_id: str) -> None:
         """Run a given command's execution procedure.
@@ -63,6 +71,7 @@ class CommandExecutor:
 
         self._state_store.handle_action(UpdateCommandAction(command=running_command))
 
+        estimated_start = self._time_estimator.elapsed if self._time_estimator else 0
         result = None
         error = None
         try:
@@ -81,12 +90,18 @@ class CommandExecutor:
             completed_status = CommandStatus.FAILED
 
         completed_at = self._model_utils.get_timestamp()
+        estimated_duration = (
+            self._time_estimator.elapsed - estimated_start
+            if self._time_estimator
+            else None
+        )
         completed_command = self._command_mapper.update_command(
             command=running_command,
             result=result,
             error=error,
             status=completed_status,
             completedAt=completed_at,
+            estimatedDuration=estimated_duration,
         )
 
         self._state_store.handle_action(UpdateCommandAction(command=completed_command))
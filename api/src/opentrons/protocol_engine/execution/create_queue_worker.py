@@ -45,6 +45,7 @@ def create_queue_worker(
         movement=movement_handler,
         pipetting=pipetting_handler,
         run_control=run_control_handler,
+        time_estimator=hardware_api.time_estimator,
     )
 
     return QueueWorker(
@@ -1,6 +1,6 @@
 """Run control command side-effect logic."""
 
-from ..state import StateStore, PauseAction
+from ..state import StateStore, StateKey, PauseAction
 
 
 class RunControlHandler:
@@ -16,5 +16,6 @@ class RunControlHandler:
         """Issue a PauseAction to the store, pausing the run."""
         self._state_store.handle_action(PauseAction())
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_is_running
+            condition=self._state_store.commands.get_is_running,
+            depends_on=[StateKey.COMMANDS],
         )
@@ -1,5 +1,5 @@
 """ProtocolEngine class definition."""
-from typing import Optional
+from typing import List, Optional, Sequence
 from opentrons.hardware_control import API as HardwareAPI
 
 from .resources import ModelUtils
@@ -9,10 +9,13 @@ from .execution import QueueWorker
 from .state import (
     StateStore,
     StateView,
+    StateKey,
+    CommandKey,
     PlayAction,
     PauseAction,
     StopAction,
     UpdateCommandAction,
+    UpdateCommandsAction,
 )
 
 
@@ -79,15 +82,29 @@ class ProtocolEngine:
         Returns:
             The full, newly queued command.
         """
-        command = self._command_mapper.map_request_to_command(
-            request=request,
-            command_id=self._model_utils.generate_id(),
-            created_at=self._model_utils.get_timestamp(),
-        )
+        command = self._map_request_to_command(request)
         self._state_store.handle_action(UpdateCommandAction(command=command))
 
         return command
 
+    def add_commands(self, requests: Sequence[CommandRequest]) -> List[Command]:
+        """Add several commands to the `ProtocolEngine`'s queue at once.
+
+        This is equivalent to calling `add_command` for each request, in order,
+        but state is only updated (and waiters notified) a single time.
+
+        Arguments:
+            requests: The command types and payload data used to construct
+                the commands in state.
+
+        Returns:
+            The full, newly queued commands, in the order of `requests`.
+        """
+        commands = [self._map_request_to_command(request) for request in requests]
+        self._state_store.handle_action(UpdateCommandsAction(commands=commands))
+
+        return commands
+
     async def add_and_execute_command(self, request: CommandRequest) -> Command:
         """Add a command to the queue and wait for it to complete.
 
@@ -106,6 +123,7 @@ class ProtocolEngine:
         await self._state_store.wait_for(
             condition=self._state_store.commands.get_is_complete,
             command_id=command.id,
+            depends_on=[CommandKey(command_id=command.id)],
         )
 
         return self._state_store.commands.get(command_id=command.id)
@@ -137,7 +155,8 @@ class ProtocolEngine:
         """
         if wait_until_complete:
             await self._state_store.wait_for(
-                condition=self._state_store.commands.get_all_complete
+                condition=self._state_store.commands.get_all_complete,
+                depends_on=[StateKey.COMMANDS],
             )
 
         self._state_store.handle_action(StopAction())
@@ -146,3 +165,10 @@ class ProtocolEngine:
             await self._queue_worker.join()
         finally:
             await self._hardware_api.stop(home_after=False)
+
+    def _map_request_to_command(self, request: CommandRequest) -> Command:
+        return self._command_mapper.map_request_to_command(
+            request=request,
+            command_id=self._model_utils.generate_id(),
+            created_at=self._model_utils.get_timestamp(),
+        )
@@ -1,13 +1,20 @@
 """Protocol engine state module."""
 
 from .create_state_store import create_state_store
-from .state import State, StateStore, StateView
-from .commands import CommandState, CommandView
+from .state import State, StateStore, StateView, StateKey, CommandKey
+from .commands import CommandState, CommandView, CommandEntry, CommandSlice
 from .labware import LabwareState, LabwareView, LabwareData
 from .pipettes import PipetteState, PipetteView, PipetteData, HardwarePipette
 from .geometry import GeometryView, TipGeometry
 from .motion import MotionView, PipetteLocationData
-from .actions import Action, PlayAction, PauseAction, StopAction, UpdateCommandAction
+from .actions import (
+    Action,
+    PlayAction,
+    PauseAction,
+    StopAction,
+    UpdateCommandAction,
+    UpdateCommandsAction,
+)
 
 __all__ = [
     # top level store factory
@@ -16,9 +23,13 @@ __all__ = [
     "State",
     "StateStore",
     "StateView",
+    "StateKey",
+    "CommandKey",
     # command state
     "CommandState",
     "CommandView",
+    "CommandEntry",
+    "CommandSlice",
     # labware state
     "LabwareState",
     "LabwareView",
@@ -40,4 +51,5 @@ __all__ = [
     "PauseAction",
     "StopAction",
     "UpdateCommandAction",
+    "UpdateCommandsAction",
 ]
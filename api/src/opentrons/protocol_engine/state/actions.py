@@ -5,7 +5,7 @@ state changes.
 """
 
 from dataclasses import dataclass
-from typing import Union
+from typing import Sequence, Union
 
 from ..commands import Command
 
@@ -38,9 +38,17 @@ class UpdateCommandAction:
     command: Command
 
 
+@dataclass(frozen=True)
+class UpdateCommandsAction:
+    """Update a batch of commands at once, in order."""
+
+    commands: Sequence[Command]
+
+
 Action = Union[
     PlayAction,
     PauseAction,
     StopAction,
     UpdateCommandAction,
+    UpdateCommandsAction,
 ]
@@ -1,19 +1,85 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional
+
+
+ChangeKey = Hashable
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Waiters may subscribe to a set of keys, in which case they will only be
+    woken by notifications that include at least one of those keys. Waiters
+    that do not specify keys are woken by every notification.
+    """
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier with no waiters."""
+        # dicts preserve insertion order, so waiters are woken in the order
+        # in which they subscribed
+        self._waiters: Dict["asyncio.Future[None]", Optional[FrozenSet[ChangeKey]]] = {}
+        self._last_wakeup_count = 0
+        self._total_wakeup_count = 0
+        self._notify_count = 0
+
+    @property
+    def last_wakeup_count(self) -> int:
+        """Get the number of waiters woken by the most recent notification."""
+        return self._last_wakeup_count
+
+    @property
+    def total_wakeup_count(self) -> int:
+        """Get the number of waiters woken across all notifications."""
+        return self._total_wakeup_count
+
+    @property
+    def notify_count(self) -> int:
+        """Get the number of notifications emitted."""
+        return self._notify_count
+
+    def notify(self, keys: Optional[Iterable[ChangeKey]] = None) -> int:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            keys: The parts of state that changed. If omitted, every waiter
+                is woken, regardless of what it subscribed to.
+
+        Returns:
+            The number of waiters woken by this notification.
+        """
+        changed = frozenset(keys) if keys is not None else None
+        wakeup_count = 0
+
+        for waiter, waiter_keys in self._waiters.items():
+            if waiter.done():
+                continue
+
+            if (
+                changed is None
+                or waiter_keys is None
+                or not changed.isdisjoint(waiter_keys)
+            ):
+                waiter.set_result(None)
+                wakeup_count += 1
+
+        self._last_wakeup_count = wakeup_count
+        self._total_wakeup_count += wakeup_count
+        self._notify_count += 1
+
+        return wakeup_count
+
+    async def wait(self, keys: Optional[Iterable[ChangeKey]] = None) -> None:
+        """Wait until the next relevant state change notification.
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+        Arguments:
+            keys: The parts of state to subscribe to. If omitted, the
+                waiter will be woken by any state change.
+        """
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters[waiter] = frozenset(keys) if keys is not None else None
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        try:
+            await waiter
+        finally:
+            del self._waiters[waiter]
@@ -1,24 +1,84 @@
 """Protocol engine commands sub-state."""
 from __future__ import annotations
-from collections import OrderedDict
 from dataclasses import dataclass, replace
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 from ..commands import Command, CommandStatus
 from ..errors import CommandDoesNotExistError, ProtocolEngineStoppedError
 from ..types import EngineStatus
 from .abstract_store import HasState, HandlesActions
-from .actions import Action, UpdateCommandAction, PlayAction, PauseAction, StopAction
+from .actions import (
+    Action,
+    UpdateCommandAction,
+    UpdateCommandsAction,
+    PlayAction,
+    PauseAction,
+    StopAction,
+)
+
+
+@dataclass(frozen=True)
+class CommandEntry:
+    """A version of a command in state, along with its position in the log."""
+
+    index: int
+    command: Command
+    #: The update of the command log that made this version of the command
+    revision: int
 
 
 @dataclass(frozen=True)
 class CommandState:
-    """State of all protocol engine command resources."""
+    """State of all protocol engine command resources.
+
+    Commands are kept in an append-only log that is shared between state
+    snapshots, rather than copied for every update. Each snapshot only sees
+    the part of the log that existed when it was made:
+
+    - `all_command_ids` holds every command ID in the order it was first
+      added, of which the snapshot sees the first `command_count`.
+    - `command_updates` holds the ID of the command added or replaced by each
+      update, in order, of which the snapshot sees the first `revision`. This
+      lets the commands changed since any earlier point be found without
+      scanning the whole log.
+    - `command_versions` holds every version of each command, oldest first,
+      along with its position in the log and the update that made it. The
+      snapshot sees the latest version made before its `revision`.
+    - `queued_command_ids` holds commands in the order they were queued, of
+      which the snapshot sees the ones from `queue_start` to `queue_end`. The
+      command at `queue_start` is the next one queued.
+
+    `status_counts` and `first_failed_command_id` are maintained incrementally
+    as commands are updated, so that selectors do not need to scan the log.
+    """
 
     is_running: bool
     stop_requested: bool
-    # TODO(mc, 2021-06-16): OrderedDict is mutable. Switch to Sequence + Mapping
-    commands_by_id: OrderedDict[str, Command]
+    all_command_ids: List[str]
+    command_count: int
+    command_updates: List[str]
+    revision: int
+    command_versions: Dict[str, List[CommandEntry]]
+    queued_command_ids: List[str]
+    queue_start: int
+    queue_end: int
+    status_counts: Dict[CommandStatus, int]
+    first_failed_command_id: Optional[str]
+
+
+@dataclass(frozen=True)
+class CommandSlice:
+    """A window of the command log."""
+
+    #: The commands in the window, in log order
+    commands: List[Command]
+    #: The index of the start of the window in the command log
+    cursor: int
+    #: The number of commands in the whole log
+    total_length: int
+    #: The number of updates made to the log so far, which can be used as
+    #: `since` to only get the commands that change afterwards
+    revision: int
 
 
 class CommandStore(HasState[CommandState], HandlesActions):
@@ -31,17 +91,27 @@ class CommandStore(HasState[CommandState], HandlesActions):
         self._state = CommandState(
             is_running=False,
             stop_requested=False,
-            commands_by_id=OrderedDict(),
+            all_command_ids=[],
+            command_count=0,
+            command_updates=[],
+            revision=0,
+            command_versions={},
+            queued_command_ids=[],
+            queue_start=0,
+            queue_end=0,
+            status_counts={},
+            first_failed_command_id=None,
         )
+        # The position in `queued_command_ids` of each command that is queued
+        self._queue_positions: Dict[str, int] = {}
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
-            command = action.command
-            commands_by_id = self._state.commands_by_id.copy()
-            commands_by_id.update({command.id: command})
+            self._update_commands([action.command])
 
-            self._state = replace(self._state, commands_by_id=commands_by_id)
+        elif isinstance(action, UpdateCommandsAction):
+            self._update_commands(action.commands)
 
         elif isinstance(action, PlayAction):
             if not self._state.stop_requested:
@@ -53,6 +123,86 @@ class CommandStore(HasState[CommandState], HandlesActions):
         elif isinstance(action, StopAction):
             self._state = replace(self._state, is_running=False, stop_requested=True)
 
+    def _update_commands(self, commands: Sequence[Command]) -> None:
+        """Add commands to the log or replace them in place.
+
+        The shared log is only ever appended to, so earlier state snapshots
+        are left untouched, and each update takes constant time no matter
+        how long the log is.
+        """
+        all_command_ids = self._state.all_command_ids
+        command_updates = self._state.command_updates
+        command_versions = self._state.command_versions
+        queued_command_ids = self._state.queued_command_ids
+        queue_positions = self._queue_positions
+        status_counts = self._state.status_counts.copy()
+        first_failed_command_id = self._state.first_failed_command_id
+
+        for command in commands:
+            versions = command_versions.setdefault(command.id, [])
+
+            if not versions:
+                index = len(all_command_ids)
+                all_command_ids.append(command.id)
+            else:
+                index = versions[-1].index
+                status_counts[versions[-1].command.status] -= 1
+
+            versions.append(
+                CommandEntry(
+                    index=index,
+                    command=command,
+                    revision=len(command_updates),
+                )
+            )
+            command_updates.append(command.id)
+            status_counts[command.status] = status_counts.get(command.status, 0) + 1
+
+            if command.status == CommandStatus.QUEUED:
+                if command.id not in queue_positions:
+                    queue_positions[command.id] = len(queued_command_ids)
+                    queued_command_ids.append(command.id)
+            else:
+                queue_positions.pop(command.id, None)
+
+            if command.status == CommandStatus.FAILED:
+                if (
+                    first_failed_command_id is None
+                    or index < command_versions[first_failed_command_id][-1].index
+                ):
+                    first_failed_command_id = command.id
+
+            elif first_failed_command_id == command.id:
+                # a failed command was replaced with a non-failed one, which
+                # should not happen in practice; fall back to a full search
+                first_failed_command_id = next(
+                    (
+                        command_id
+                        for command_id in all_command_ids
+                        if command_versions[command_id][-1].command.status
+                        == CommandStatus.FAILED
+                    ),
+                    None,
+                )
+
+        # skip past commands that have left the queue or been queued again
+        queue_start = self._state.queue_start
+        while (
+            queue_start < len(queued_command_ids)
+            and queue_positions.get(queued_command_ids[queue_start]) != queue_start
+        ):
+            queue_start += 1
+
+        self._state = replace(
+            self._state,
+            command_count=len(all_command_ids),
+            revision=len(command_updates),
+            queue_start=queue_start,
+            queue_end=len(queued_command_ids),
+            status_counts=status_counts,
+            first_failed_command_id=first_failed_command_id,
+        )
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -65,10 +215,10 @@ class CommandView(HasState[CommandState]):
 
     def get(self, command_id: str) -> Command:
         """Get a command by its unique identifier."""
-        try:
-            return self._state.commands_by_id[command_id]
-        except KeyError:
+        entry = self._get_entry(command_id)
+        if entry is None:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
+        return entry.command
 
     def get_all(self) -> List[Command]:
         """Get a list of all commands in state.
@@ -77,7 +227,52 @@ class CommandView(HasState[CommandState]):
         Replacing a command (to change its status, for example) keeps its place in the
         ordering.
         """
-        return list(self._state.commands_by_id.values())
+        command_ids = self._state.all_command_ids[: self._state.command_count]
+        return [self._get_latest_entry(i).command for i in command_ids]
+
+    def get_slice(
+        self,
+        cursor: int = 0,
+        length: Optional[int] = None,
+        since: Optional[int] = None,
+    ) -> CommandSlice:
+        """Get a window of the command log without going through all of it.
+
+        Arguments:
+            cursor: The index of the first command of the window.
+            length: The maximum number of commands in the window, or None
+                for the rest of the log.
+            since: If given, only include the commands of the window that
+                were added or updated after this `revision` of the log.
+        """
+        command_count = self._state.command_count
+        revision = self._state.revision
+        end = command_count if length is None else min(cursor + length, command_count)
+
+        if since is None:
+            commands = [
+                self._get_latest_entry(command_id).command
+                for command_id in self._state.all_command_ids[cursor:end]
+            ]
+        else:
+            updated_entries = (
+                self._get_latest_entry(command_id)
+                for command_id in dict.fromkeys(
+                    self._state.command_updates[since:revision]
+                )
+            )
+            commands = [
+                entry.command
+                for entry in sorted(updated_entries, key=lambda e: e.index)
+                if cursor <= entry.index < end
+            ]
+
+        return CommandSlice(
+            commands=commands,
+            cursor=cursor,
+            total_length=command_count,
+            revision=revision,
+        )
 
     def get_next_queued(self) -> Optional[str]:
         """Return the next request in line to be executed.
@@ -94,13 +289,20 @@ class CommandView(HasState[CommandState]):
         if not self._state.is_running:
             return None
 
-        for command_id, command in self._state.commands_by_id.items():
-            if command.status == CommandStatus.FAILED:
-                raise ProtocolEngineStoppedError("Previous command failed.")
-            elif command.status == CommandStatus.QUEUED:
-                return command_id
+        next_queued_id = (
+            self._state.queued_command_ids[self._state.queue_start]
+            if self._state.queue_start < self._state.queue_end
+            else None
+        )
+        failed_entry = self._get_first_failed_entry()
 
-        return None
+        if failed_entry is not None and (
+            next_queued_id is None
+            or failed_entry.index < self._get_latest_entry(next_queued_id).index
+        ):
+            raise ProtocolEngineStoppedError("Previous command failed.")
+
+        return next_queued_id
 
     def get_is_running(self) -> bool:
         """Get whether the engine is running and queued commands should be executed."""
@@ -119,14 +321,15 @@ class CommandView(HasState[CommandState]):
         Arguments:
             command_id: Command to check.
         """
-        for search_id, search_command in self._state.commands_by_id.items():
-            search_status = search_command.status
-            is_failed = search_status == CommandStatus.FAILED
+        entry = self._get_entry(command_id)
+        failed_entry = self._get_first_failed_entry()
 
-            if search_id == command_id or is_failed:
-                return search_status == CommandStatus.SUCCEEDED or is_failed
+        if failed_entry is not None and (
+            entry is None or failed_entry.index <= entry.index
+        ):
+            return True
 
-        return False
+        return entry is not None and entry.command.status == CommandStatus.SUCCEEDED
 
     def get_all_complete(self) -> bool:
         """Get whether all commands have completed.
@@ -136,12 +339,10 @@ class CommandView(HasState[CommandState]):
         - All commands have a status of CommandStatus.SUCCEEDED
         - Any command has a status of CommandStatus.FAILED
         """
-        for command in self._state.commands_by_id.values():
-            if command.status == CommandStatus.FAILED:
-                return True
-            elif command.status != CommandStatus.SUCCEEDED:
-                return False
-        return True
+        if self._state.first_failed_command_id is not None:
+            return True
+
+        return self._count(CommandStatus.SUCCEEDED) == self._state.command_count
 
     def get_stop_requested(self) -> bool:
         """Get whether an engine stop has been requested.
@@ -164,27 +365,27 @@ class CommandView(HasState[CommandState]):
 
     def get_status(self) -> EngineStatus:
         """Get the current execution status of the engine."""
-        all_commands = self._state.commands_by_id.values()
-        all_statuses = [c.status for c in all_commands]
+        total_count = self._state.command_count
+        any_running = self._count(CommandStatus.RUNNING) > 0
 
         if self._state.stop_requested:
-            if all(s == CommandStatus.SUCCEEDED for s in all_statuses):
+            if self._count(CommandStatus.SUCCEEDED) == total_count:
                 return EngineStatus.SUCCEEDED
 
-            elif any(s == CommandStatus.RUNNING for s in all_statuses):
+            elif any_running:
                 return EngineStatus.STOP_REQUESTED
 
             else:
                 return EngineStatus.STOPPED
 
-        elif any(s == CommandStatus.FAILED for s in all_statuses):
+        elif self._state.first_failed_command_id is not None:
             return EngineStatus.FAILED
 
         elif not self._state.is_running:
-            if all(s == CommandStatus.QUEUED for s in all_statuses):
+            if self._count(CommandStatus.QUEUED) == total_count:
                 return EngineStatus.READY_TO_RUN
 
-            elif any(s == CommandStatus.RUNNING for s in all_statuses):
+            elif any_running:
                 return EngineStatus.PAUSE_REQUESTED
 
             else:
@@ -192,3 +393,25 @@ class CommandView(HasState[CommandState]):
 
         else:
             return EngineStatus.RUNNING
+
+    def _count(self, status: CommandStatus) -> int:
+        """Get the number of commands in state with a given status."""
+        return self._state.status_counts.get(status, 0)
+
+    def _get_first_failed_entry(self) -> Optional[CommandEntry]:
+        """Get the earliest failed command in the log, if any."""
+        failed_id = self._state.first_failed_command_id
+        return self._get_latest_entry(failed_id) if failed_id is not None else None
+
+    def _get_entry(self, command_id: str) -> Optional[CommandEntry]:
+        """Get the version of a command as of this state, if it was added yet."""
+        for entry in reversed(self._state.command_versions.get(command_id, ())):
+            if entry.revision < self._state.revision:
+                return entry
+        return None
+
+    def _get_latest_entry(self, command_id: str) -> CommandEntry:
+        """Get the version of a command known to be in this state."""
+        entry = self._get_entry(command_id)
+        assert entry is not None, f"Command {command_id} is not in state"
+        return entry
@@ -44,12 +44,7 @@ class GeometryView:
 
     def get_all_labware_highest_z(self) -> float:
         """Get the highest Z-point across all labware."""
-        return max(
-            [
-                self._get_highest_z_from_labware_data(lw_data)
-                for uid, lw_data in self._labware.get_all_labware()
-            ]
-        )
+        return self._labware.get_all_labware_highest_z()
 
     def get_labware_parent_position(self, labware_id: str) -> Point:
         """Get the position of the labware's parent slot (deck or module)."""
@@ -91,9 +86,8 @@ class GeometryView:
         well_location: Optional[WellLocation] = None,
     ) -> Point:
         """Get the absolute position of a well in a labware."""
-        labware_pos = self.get_labware_position(labware_id)
-        well_def = self._labware.get_well_definition(labware_id, well_name)
-        well_depth = well_def.depth
+        well_bottom = self._labware.get_well_bottom_position(labware_id, well_name)
+        well_depth = self._labware.get_well_definition(labware_id, well_name).depth
 
         if well_location is not None:
             offset = well_location.offset
@@ -105,9 +99,9 @@ class GeometryView:
             offset = (0, 0, well_depth)
 
         return Point(
-            x=labware_pos.x + offset[0] + well_def.x,
-            y=labware_pos.y + offset[1] + well_def.y,
-            z=labware_pos.z + offset[2] + well_def.z,
+            x=well_bottom.x + offset[0],
+            y=well_bottom.y + offset[1],
+            z=well_bottom.z + offset[2],
         )
 
     def _get_highest_z_from_labware_data(self, lw_data: LabwareData) -> float:
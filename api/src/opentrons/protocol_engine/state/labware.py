@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2, SlotDefV2
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -12,13 +12,14 @@ from opentrons_shared_data.pipette.dev_types import LabwareUri
 
 from opentrons.types import DeckSlotName, Point
 from opentrons.protocols.models import LabwareDefinition, WellDefinition
+from opentrons.protocols.geometry.well_positions import WellPositions
 from opentrons.calibration_storage.helpers import uri_from_details
 
 from .. import errors
 from ..resources import DeckFixedLabware
 from ..commands import Command, LoadLabwareResult, AddLabwareDefinitionResult
 from ..types import LabwareLocation, Dimensions
-from .actions import Action, UpdateCommandAction
+from .actions import Action, UpdateCommandAction, UpdateCommandsAction
 from .abstract_store import HasState, HandlesActions
 
 
@@ -33,11 +34,24 @@ class LabwareData:
 
 @dataclass(frozen=True)
 class LabwareState:
-    """State of all loaded labware resources."""
+    """State of all loaded labware resources.
+
+    In addition to the raw labware data, the state holds a geometry index
+    that is built up as labware is loaded, so that motion planning does not
+    need to re-derive it from definitions on every move:
+
+    - `slot_definitions_by_name`: deck slot definitions, by slot name
+    - `well_positions_by_labware_id`: calibrated, absolute positions of
+        every well of every loaded labware
+    - `highest_z`: the highest calibrated Z-point across all loaded labware
+    """
 
     labware_by_id: Dict[str, LabwareData]
     labware_definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV2
+    slot_definitions_by_name: Dict[DeckSlotName, SlotDefV2]
+    well_positions_by_labware_id: Dict[str, WellPositions]
+    highest_z: Optional[float]
 
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
@@ -76,13 +90,27 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             labware_definitions_by_uri=labware_definitions_by_uri,
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
+            slot_definitions_by_name=_get_slot_definitions_by_name(deck_definition),
+            well_positions_by_labware_id={},
+            highest_z=None,
         )
 
+        for fixed_labware in deck_fixed_labware:
+            self._index_labware_geometry(
+                labware_id=fixed_labware.labware_id,
+                labware_data=labware_by_id[fixed_labware.labware_id],
+                definition=fixed_labware.definition,
+            )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
             self._handle_command(action.command)
 
+        elif isinstance(action, UpdateCommandsAction):
+            for command in action.commands:
+                self._handle_command(command)
+
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
         if isinstance(command.result, LoadLabwareResult):
@@ -91,12 +119,20 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 load_name=command.result.definition.parameters.loadName,
                 version=command.result.definition.version,
             )
-            self._state.labware_definitions_by_uri[uri] = command.result.definition
-            self._state.labware_by_id[command.result.labwareId] = LabwareData(
+            labware_data = LabwareData(
                 location=command.data.location,
                 uri=uri,
                 calibration=command.result.calibration,
             )
+            self._state.labware_definitions_by_uri[uri] = command.result.definition
+            self._state.labware_by_id[command.result.labwareId] = labware_data
+            self._index_labware_geometry(
+                labware_id=command.result.labwareId,
+                labware_data=labware_data,
+                definition=command.result.definition,
+            )
+            # swap in a new state value so the StateStore can tell labware changed
+            self._state = replace(self._state)
         elif isinstance(command.result, AddLabwareDefinitionResult):
             uri = uri_from_details(
                 namespace=command.result.namespace,
@@ -104,6 +140,51 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=command.result.version,
             )
             self._state.labware_definitions_by_uri[uri] = command.data.definition
+            self._state = replace(self._state)
+
+    def _index_labware_geometry(
+        self,
+        labware_id: str,
+        labware_data: LabwareData,
+        definition: LabwareDefinition,
+    ) -> None:
+        """Add a newly loaded labware's well positions and height to the index."""
+        slot_def = self._state.slot_definitions_by_name[labware_data.location.slot]
+        slot_pos = slot_def["position"]
+        cal_offset = labware_data.calibration
+        corner_offset = definition.cornerOffsetFromSlot
+
+        labware_x = slot_pos[0] + corner_offset.x + cal_offset[0]
+        labware_y = slot_pos[1] + corner_offset.y + cal_offset[1]
+        labware_z = slot_pos[2] + corner_offset.z + cal_offset[2]
+
+        self._state.well_positions_by_labware_id[labware_id] = WellPositions.from_model(
+            definition=definition,
+            parent_point=Point(x=labware_x, y=labware_y, z=labware_z),
+        )
+
+        labware_highest_z = (
+            definition.dimensions.zDimension + slot_pos[2] + cal_offset[2]
+        )
+
+        if self._state.highest_z is None or labware_highest_z > self._state.highest_z:
+            self._state = replace(self._state, highest_z=labware_highest_z)
+
+
+def _get_slot_definitions_by_name(
+    deck_definition: DeckDefinitionV2,
+) -> Dict[DeckSlotName, SlotDefV2]:
+    slot_definitions_by_name = {}
+
+    for slot_def in deck_definition["locations"]["orderedSlots"]:
+        try:
+            slot_name = DeckSlotName.from_primitive(slot_def["id"])
+        except ValueError:
+            continue
+
+        slot_definitions_by_name[slot_name] = slot_def
+
+    return slot_definitions_by_name
 
 
 class LabwareView(HasState[LabwareState]):
@@ -136,15 +217,13 @@ class LabwareView(HasState[LabwareState]):
 
     def get_slot_definition(self, slot: DeckSlotName) -> SlotDefV2:
         """Get the definition of a slot in the deck."""
-        deck_def = self.get_deck_definition()
-
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
-
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return self._state.slot_definitions_by_name[slot]
+        except KeyError:
+            deck_def = self.get_deck_definition()
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
+            )
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
@@ -162,6 +241,29 @@ class LabwareView(HasState[LabwareState]):
                 f"Labware definition for matching {uri} not found."
             )
 
+    def get_well_bottom_position(self, labware_id: str, well_name: str) -> Point:
+        """Get the calibrated, absolute position of the bottom-center of a well."""
+        try:
+            well_positions = self._state.well_positions_by_labware_id[labware_id]
+        except KeyError:
+            raise errors.LabwareDoesNotExistError(f"Labware {labware_id} not found.")
+
+        try:
+            return well_positions.bottom(well_name)
+        except KeyError:
+            raise errors.WellDoesNotExistError(
+                f"{well_name} does not exist in {labware_id}."
+            )
+
+    def get_all_labware_highest_z(self) -> float:
+        """Get the highest calibrated Z-point across all loaded labware."""
+        highest_z = self._state.highest_z
+
+        if highest_z is None:
+            raise errors.LabwareDoesNotExistError("No labware has been loaded.")
+
+        return highest_z
+
     def get_labware_location(self, labware_id: str) -> LabwareLocation:
         """Get labware location by the labware's unique identifier."""
         return self.get_labware_data_by_id(labware_id).location
@@ -18,7 +18,7 @@ from ..commands import (
     PickUpTipResult,
     DropTipResult,
 )
-from .actions import Action, UpdateCommandAction
+from .actions import Action, UpdateCommandAction, UpdateCommandsAction
 from .abstract_store import HasState, HandlesActions
 
 
@@ -65,6 +65,10 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         if isinstance(action, UpdateCommandAction):
             self._handle_command(action.command)
 
+        elif isinstance(action, UpdateCommandsAction):
+            for command in action.commands:
+                self._handle_command(command)
+
     def _handle_command(self, command: Command) -> None:
         if isinstance(
             command.result,
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from logging import getLogger
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, TypeVar
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 
+from ..commands import Command, CommandStatus
 from ..resources import DeckFixedLabware
-from .actions import Action
+from .actions import Action, UpdateCommandAction, UpdateCommandsAction
 from .abstract_store import HasState, HandlesActions
-from .change_notifier import ChangeNotifier
+from .change_notifier import ChangeNotifier, ChangeKey
 from .commands import CommandState, CommandStore, CommandView
 from .labware import LabwareState, LabwareStore, LabwareView
 from .pipettes import PipetteState, PipetteStore, PipetteView
@@ -20,6 +23,23 @@ from .motion import MotionView
 
 ReturnT = TypeVar("ReturnT")
 
+log = getLogger(__name__)
+
+
+class StateKey(str, Enum):
+    """Substores that a `wait_for` condition may depend on."""
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+
+
+@dataclass(frozen=True)
+class CommandKey:
+    """A single command, by ID, that a `wait_for` condition may depend on."""
+
+    command_id: str
+
 
 @dataclass(frozen=True)
 class State:
@@ -115,12 +135,18 @@ class StateStore(StateView, HandlesActions):
         for substore in self._substores:
             substore.handle_action(action)
 
+        prev_state = self._state
         self._update_state_views()
 
+        changed_keys = self._get_changed_keys(action, prev_state, self._state)
+        wakeup_count = self._change_notifier.notify(changed_keys)
+        log.debug("%s woke %d state waiter(s)", type(action).__name__, wakeup_count)
+
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        depends_on: Optional[Iterable[ChangeKey]] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
@@ -135,16 +161,21 @@ class StateStore(StateView, HandlesActions):
             condition: A function that returns a truthy value when the `await`
                 should resolve
             *args: Positional arguments to pass to `condition`
+            depends_on: The parts of state that `condition` reads, as
+                `StateKey` and/or `CommandKey` values. If specified, the
+                condition will only be re-checked when one of them changes.
+                If omitted, it will be re-checked on every state change.
             **kwargs: Named arguments to pass to `condition`
 
         Returns:
             The truthy value returned by the `condition` function.
         """
         predicate = partial(condition, *args, **kwargs)
+        keys = frozenset(depends_on) if depends_on is not None else None
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(keys)
             is_done = predicate()
 
         return is_done
@@ -177,11 +208,48 @@ class StateStore(StateView, HandlesActions):
 
     def _update_state_views(self) -> None:
         """Update state view interfaces to use latest underlying values."""
-        state = state = self._get_next_state()
+        state = self._get_next_state()
 
         self._state = state
         self._commands._state = state.commands
         self._labware._state = state.labware
         self._pipettes._state = state.pipettes
 
-        self._change_notifier.notify()
+    @staticmethod
+    def _get_changed_keys(
+        action: Action,
+        prev_state: State,
+        next_state: State,
+    ) -> Optional[Set[ChangeKey]]:
+        """Get the keys of the state that an action changed.
+
+        Substores replace their state value whenever it changes, so an
+        identity check is enough to tell which substores were affected.
+
+        Returns:
+            The set of changed keys, or None if every waiter should be woken.
+        """
+        changed_keys: Set[ChangeKey] = set()
+
+        if isinstance(action, UpdateCommandAction):
+            updated_commands: Sequence[Command] = [action.command]
+        elif isinstance(action, UpdateCommandsAction):
+            updated_commands = action.commands
+        else:
+            updated_commands = []
+
+        for command in updated_commands:
+            # a failed command may complete every command queued after it
+            if command.status == CommandStatus.FAILED:
+                return None
+
+            changed_keys.add(CommandKey(command_id=command.id))
+
+        if prev_state.commands is not next_state.commands:
+            changed_keys.add(StateKey.COMMANDS)
+        if prev_state.labware is not next_state.labware:
+            changed_keys.add(StateKey.LABWARE)
+        if prev_state.pipettes is not next_state.pipettes:
+            changed_keys.add(StateKey.PIPETTES)
+
+        return changed_keys
@@ -31,8 +31,12 @@ class JsonCommandTranslator:
         for pipette_id, pipette in protocol.pipettes.items():
             result.append(self._translate_load_pipette(pipette_id, pipette))
 
-        for definition_id, definition in protocol.labwareDefinitions.items():
-            result.append(self._translate_add_labware_definition(definition))
+        # Identical definitions are read into the same model, only add it once
+        added_definitions = set()
+        for definition in protocol.labwareDefinitions.values():
+            if id(definition) not in added_definitions:
+                added_definitions.add(id(definition))
+                result.append(self._translate_add_labware_definition(definition))
 
         for labware_id, labware in protocol.labware.items():
             result.append(
@@ -63,8 +67,11 @@ class JsonCommandTranslator:
     def _translate_add_labware_definition(
         self, labware_definition: models.LabwareDefinition
     ) -> pe_commands.AddLabwareDefinitionRequest:
+        # The definition is already validated, so don't validate (and copy) it
         return pe_commands.AddLabwareDefinitionRequest(
-            data=pe_commands.AddLabwareDefinitionData(definition=labware_definition)
+            data=pe_commands.AddLabwareDefinitionData.construct(
+                definition=labware_definition
+            )
         )
 
     def _translate_load_labware(
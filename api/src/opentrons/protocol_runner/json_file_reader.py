@@ -1,15 +1,147 @@
 """JSON file reading."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Type
 
-from opentrons.protocols.models import JsonProtocol
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.typing import literal_values
+
+from opentrons.protocols.models import JsonProtocol, LabwareDefinition, json_protocol
 from .protocol_file import ProtocolFile
 
+#: How many validated labware definitions to keep for reuse
+MAX_CACHED_DEFINITIONS = 32
+
+# The model of each command, so that a command is only validated against its
+# own model rather than against every model in turn until one fits
+_COMMAND_MODELS: Dict[str, Type[BaseModel]] = {
+    command: model
+    for model in json_protocol.AllCommands.__args__  # type: ignore[attr-defined]
+    for command in literal_values(model.__fields__["command"].type_)
+}
+
+# Validated labware definitions, by the hash of their contents
+_definitions: "OrderedDict[str, LabwareDefinition]" = OrderedDict()
+_definitions_lock = threading.Lock()
+
 
 class JsonFileReader:
     """Reads and parses JSON protocol files."""
 
     @staticmethod
     def read(protocol_file: ProtocolFile) -> JsonProtocol:
-        """Read and parse file into a JsonProtocol model."""
+        """Read and parse file into a JsonProtocol model.
+
+        Labware definitions identical to ones already read are not validated
+        again, and the same definition model is used for them. Definitions
+        must therefore not be modified.
+        """
         # TODO(mc, 2021-08-25): validate files list length before access
         contents = protocol_file.files[0].read_text(encoding="utf-8")
-        return JsonProtocol.parse_raw(contents)
+        try:
+            raw = json.loads(contents)
+        except ValueError as e:
+            raise ValidationError([ErrorWrapper(e, loc="__root__")], JsonProtocol)
+
+        protocol = _parse_fast(raw)
+        if protocol is None:
+            # Let the full model report what's wrong with the protocol
+            protocol = JsonProtocol.parse_obj(raw)
+        return protocol
+
+
+def _parse_fast(raw: Any) -> Optional[JsonProtocol]:
+    """Parse a protocol, validating definitions and commands on their own.
+
+    Returns None if the protocol isn't shaped for this, e.g. if it has a
+    command that isn't known, in which case it should be parsed as a whole.
+    """
+    if not isinstance(raw, dict):
+        return None
+
+    raw_definitions = raw.get("labwareDefinitions")
+    raw_commands = raw.get("commands", [])
+    if not isinstance(raw_definitions, dict) or not isinstance(raw_commands, list):
+        return None
+
+    command_models = _get_command_models(raw_commands)
+    if command_models is None:
+        return None
+
+    errors: List[ErrorWrapper] = []
+    definitions = _parse_definitions(raw_definitions, errors)
+    commands = _parse_commands(command_models, raw_commands, errors)
+    try:
+        protocol = JsonProtocol.parse_obj(
+            {**raw, "labwareDefinitions": {}, "commands": []}
+        )
+    except ValidationError as e:
+        errors.extend(e.raw_errors)  # type: ignore[arg-type]
+
+    if errors:
+        raise ValidationError(errors, JsonProtocol)
+
+    protocol.labwareDefinitions = definitions
+    protocol.commands = commands if "commands" in raw else None  # type: ignore
+    return protocol
+
+
+def _get_command_models(raw_commands: List[Any]) -> Optional[List[Type[BaseModel]]]:
+    """Get the model of each command, or None if any command isn't known."""
+    command_models = []
+    for raw_command in raw_commands:
+        if not isinstance(raw_command, dict):
+            return None
+        model = _COMMAND_MODELS.get(raw_command.get("command"))  # type: ignore
+        if model is None:
+            return None
+        command_models.append(model)
+    return command_models
+
+
+def _parse_definitions(
+    raw_definitions: Dict[str, Any], errors: List[ErrorWrapper]
+) -> Dict[str, LabwareDefinition]:
+    definitions = {}
+    for definition_id, raw_definition in raw_definitions.items():
+        try:
+            definitions[definition_id] = _get_definition(raw_definition)
+        except ValidationError as e:
+            errors.append(ErrorWrapper(e, loc=("labwareDefinitions", definition_id)))
+    return definitions
+
+
+def _parse_commands(
+    command_models: List[Type[BaseModel]],
+    raw_commands: List[Any],
+    errors: List[ErrorWrapper],
+) -> List[BaseModel]:
+    commands = []
+    for index, (model, raw_command) in enumerate(zip(command_models, raw_commands)):
+        try:
+            commands.append(model.parse_obj(raw_command))
+        except ValidationError as e:
+            errors.append(ErrorWrapper(e, loc=("commands", index)))
+    return commands
+
+
+def _get_definition(raw_definition: Any) -> LabwareDefinition:
+    """Validate a labware definition, or reuse an identical one."""
+    serialized = json.dumps(raw_definition, sort_keys=True, separators=(",", ":"))
+    key = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    with _definitions_lock:
+        definition = _definitions.get(key)
+        if definition is not None:
+            _definitions.move_to_end(key)
+            return definition
+
+    definition = LabwareDefinition.parse_obj(raw_definition)
+    with _definitions_lock:
+        _definitions[key] = definition
+        while len(_definitions) > MAX_CACHED_DEFINITIONS:
+            _definitions.popitem(last=False)
+    return definition
@@ -102,8 +102,7 @@ class ProtocolRunner:
     def _load_json(self, protocol_file: ProtocolFile) -> None:
         protocol = self._json_file_reader.read(protocol_file)
         commands = self._json_command_translator.translate(protocol)
-        for request in commands:
-            self._protocol_engine.add_command(request=request)
+        self._protocol_engine.add_commands(requests=commands)
 
     def _load_python(self, protocol_file: ProtocolFile) -> None:
         protocol = self._python_file_reader.read(protocol_file)
@@ -1,5 +1,5 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons.protocols.context.well import WellImplementation
 
@@ -8,9 +8,52 @@ Wells = Sequence[WellImplementation]
 WellColumns = Sequence[Wells]
 
 
+def _first_run(mask: int) -> Tuple[int, int]:
+    """Get the (start, length) of the lowest run of set bits in ``mask``."""
+    if not mask:
+        return 0, 0
+    start = (mask & -mask).bit_length() - 1
+    shifted = mask >> start
+    return start, (~shifted & (shifted + 1)).bit_length() - 1
+
+
 class TipTracker:
+    """Track which wells of a tip rack have tips.
+
+    Tip presence is kept as one bitmask per column, where bit ``n`` is set
+    if the ``n``th well from the back of the column has a tip, so finding
+    a contiguous run of tips (or of empty wells) in a column takes a couple
+    of integer operations instead of a scan over the column's wells.
+
+    A rack-wide bitmask of which columns have any tips (and of which have
+    any empty wells) lets searches jump straight to candidate columns, so
+    the usual single- or 8-channel pick up finds its well in constant time.
+
+    The masks are kept in sync with each well's own tip state, so wells
+    may still be updated directly with ``set_has_tip``.
+    """
+
     def __init__(self, columns: WellColumns):
         self._columns = columns
+        self._locations: Dict[str, Tuple[int, int]] = {}
+        self._full_masks: List[int] = []
+        self._masks: List[int] = []
+        self._columns_with_tips = 0
+        self._columns_with_space = 0
+
+        for column_idx, column in enumerate(columns):
+            mask = 0
+            for row_idx, well in enumerate(column):
+                self._locations[well.get_name()] = (column_idx, row_idx)
+                well.set_has_tip_listener(
+                    partial(self._set_has_tip, column_idx, 1 << row_idx)
+                )
+                if well.has_tip():
+                    mask |= 1 << row_idx
+
+            self._full_masks.append((1 << len(column)) - 1)
+            self._masks.append(0)
+            self._update_column(column_idx, mask)
 
     def next_tip(
         self, num_tips: int = 1, starting_tip: Optional[WellImplementation] = None
@@ -29,36 +72,26 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
+        first_column = 0
+        first_row = 0
         if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns)
-            )
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
-            )
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[WellImplementation] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+            first_column, first_row = self._locate(starting_tip)
+
+        candidates = self._columns_with_tips & ~((1 << first_column) - 1)
+
+        while candidates:
+            column_idx = (candidates & -candidates).bit_length() - 1
+            candidates &= candidates - 1
+            mask = self._masks[column_idx]
+            if column_idx == first_column:
+                # Ignore tips preceding the starting tip in its column
+                mask &= ~((1 << first_row) - 1)
+
+            start, length = _first_run(mask)
+            if length >= num_tips:
+                return self._columns[column_idx][start]
+
+        return None
 
     def use_tips(
         self,
@@ -86,17 +119,15 @@ class TipTracker:
         :type num_channels: int
         :param fail_if_full: for backwards compatibility
         """
-        # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
+        column_idx, well_idx = self._locate(start_well)
+        target_column = self._columns[column_idx]
         # Number of tips to pick up is the lesser of (1) the number of tips
         # from the starting well to the end of the column, and (2) the number
         # of channels of the pipette (so a 4-channel pipette would pick up a
         # max of 4 tips, and picking up from the 2nd-to-bottom well in a
         # column would get a maximum of 2 tips)
         num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx : well_idx + num_tips]
+        target_mask = ((1 << num_tips) - 1) << well_idx
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -107,11 +138,11 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(
-                well.has_tip() for well in target_wells
+            assert (
+                self._masks[column_idx] & target_mask == target_mask
             ), "{} is out of tips".format(str(self))
 
-        for well in target_wells:
+        for well in target_column[well_idx : well_idx + num_tips]:
             well.set_has_tip(False)
 
     def previous_tip(self, num_tips: int = 1) -> Optional[WellImplementation]:
@@ -126,21 +157,17 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        candidates = self._columns_with_space
+
+        while candidates:
+            column_idx = (candidates & -candidates).bit_length() - 1
+            candidates &= candidates - 1
+            empty = self._full_masks[column_idx] & ~self._masks[column_idx]
+            start, length = _first_run(empty)
+            if length >= num_tips:
+                return self._columns[column_idx][start]
+
+        return None
 
     def return_tips(self, start_well: WellImplementation, num_channels: int = 1):
         """
@@ -163,13 +190,36 @@ class TipTracker:
         :param num_channels: The number of channels for the current pipette
         :type num_channels: int
         """
-        # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
+        column_idx, well_idx = self._locate(start_well)
+        target_column = self._columns[column_idx]
         end_idx = min(well_idx + num_channels, len(target_column))
         drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f"Well {repr(well)} has a tip")
+        drop_mask = ((1 << (end_idx - well_idx)) - 1) << well_idx
+        if self._masks[column_idx] & drop_mask:
+            for well in drop_targets:
+                if well.has_tip():
+                    raise AssertionError(f"Well {repr(well)} has a tip")
         for well in drop_targets:
             well.set_has_tip(True)
+
+    def _locate(self, well: WellImplementation) -> Tuple[int, int]:
+        """Get the (column, row) indices of a well in this tip rack."""
+        return self._locations[well.get_name()]
+
+    def _set_has_tip(self, column_idx: int, bit: int, value: bool) -> None:
+        mask = self._masks[column_idx]
+        self._update_column(column_idx, mask | bit if value else mask & ~bit)
+
+    def _update_column(self, column_idx: int, mask: int) -> None:
+        column_bit = 1 << column_idx
+        self._masks[column_idx] = mask
+
+        if mask:
+            self._columns_with_tips |= column_bit
+        else:
+            self._columns_with_tips &= ~column_bit
+
+        if mask != self._full_masks[column_idx]:
+            self._columns_with_space |= column_bit
+        else:
+            self._columns_with_space &= ~column_bit
@@ -98,10 +98,9 @@ class InstrumentContextImplementation(AbstractInstrument):
             radius=radius,
             version=self._api_version,
         )
-        for edge in edges:
-            self._protocol_interface.get_hardware().hardware.move_to(
-                self._mount, edge, speed
-            )
+        with self._protocol_interface.get_hardware().hardware.batch() as hardware:
+            for edge in edges:
+                hardware.move_to(self._mount, edge, speed)
 
     def pick_up_tip(
         self,
@@ -182,15 +181,18 @@ class InstrumentContextImplementation(AbstractInstrument):
             minimum_z_height=minimum_z_height,
         )
 
+        max_speeds = self._protocol_interface.get_max_speeds().data
         try:
-            for move in moves:
-                hardware.move_to(
-                    self._mount,
-                    move[0],
-                    critical_point=move[1],
-                    speed=speed,
-                    max_speeds=self._protocol_interface.get_max_speeds().data,
-                )
+            # Make every move of the arc in one trip to the hardware's thread
+            with hardware.batch() as batch:
+                for move in moves:
+                    batch.move_to(
+                        self._mount,
+                        move[0],
+                        critical_point=move[1],
+                        speed=speed,
+                        max_speeds=max_speeds,
+                    )
         except Exception:
             self._protocol_interface.set_last_location(None)
             raise
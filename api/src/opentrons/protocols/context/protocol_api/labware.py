@@ -3,6 +3,7 @@ from typing import List, Dict, Optional
 from opentrons.calibration_storage import helpers
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
 from opentrons.protocols.geometry.well_geometry import WellGeometry
+from opentrons.protocols.geometry.well_positions import WellPositions
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.protocols.api_support.tip_tracker import TipTracker
 from opentrons.protocols.context.well import WellImplementation
@@ -52,6 +53,7 @@ class LabwareImplementation(AbstractLabware):
         # flatten list of list of well names.
         self._ordering = [well for col in definition["ordering"] for well in col]
         self._wells: List[WellImplementation] = []
+        self._well_positions: Optional[WellPositions] = None
         self._well_name_grid = WellGrid(wells=self._wells)
         self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
 
@@ -87,6 +89,14 @@ class LabwareImplementation(AbstractLabware):
             z=self._geometry.offset.z + delta.z,
         )
         # The wells must be rebuilt
+        if self._well_positions is None:
+            self._well_positions = WellPositions.from_definition(
+                self._definition, self._calibrated_offset
+            )
+        else:
+            self._well_positions = self._well_positions.with_parent_point(
+                self._calibrated_offset
+            )
         self._wells = self._build_wells()
         self._well_name_grid = WellGrid(wells=self._wells)
         self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
@@ -136,16 +146,21 @@ class LabwareImplementation(AbstractLabware):
         return self._parameters["loadName"]
 
     def _build_wells(self) -> List[WellImplementation]:
+        assert self._well_positions is not None
+        # compute every well's position in one pass rather than well-by-well
+        tops = self._well_positions.tops().tolist()
+
         return [
             WellImplementation(
                 well_geometry=WellGeometry(
                     well_props=self._well_definition[well],
                     parent_point=self._calibrated_offset,
                     parent_object=self,
+                    position=Point(*top),
                 ),
                 display_name="{} of {}".format(well, self._display_name),
                 has_tip=self.is_tiprack(),
                 name=well,
             )
-            for well in self._ordering
+            for well, top in zip(self._ordering, tops)
         ]
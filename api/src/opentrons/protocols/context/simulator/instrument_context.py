@@ -28,7 +28,8 @@ class InstrumentContextSimulation(AbstractInstrument):
         """Constructor."""
         self._protocol_interface = protocol_interface
         self._mount = mount
-        self._pipette_dict = pipette_dict
+        # The hardware's pipette dict is shared, and this one is modified
+        self._pipette_dict = pipette_dict.copy()
         self._instrument_name = instrument_name
         self._default_speed = default_speed
         self._api_version = api_version or MAX_SUPPORTED_VERSION
@@ -20,6 +20,7 @@ class WellGeometry:
         well_props: WellDefinition,
         parent_point: Point,
         parent_object: AbstractLabware,
+        position: Optional[Point] = None,
     ):
         """
         Construct a well geometry object.
@@ -27,14 +28,22 @@ class WellGeometry:
         :param well_props: Properties from the labware definition
         :param parent_point: The coordinate of parent labware
         :param parent_object: The parent labware
+        :param position: The absolute top-center of the well, if it has
+                         already been computed (e.g. by a
+                         :py:class:`.WellPositions` for the whole labware)
         """
 
-        self._position = (
-            Point(
-                well_props["x"], well_props["y"], well_props["z"] + well_props["depth"]
+        if position is None:
+            position = (
+                Point(
+                    well_props["x"],
+                    well_props["y"],
+                    well_props["z"] + well_props["depth"],
+                )
+                + parent_point
             )
-            + parent_point
-        )
+
+        self._position = position
 
         if not parent_object:
             raise ValueError("Wells must have a parent")
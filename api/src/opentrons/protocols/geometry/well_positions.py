@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import copy
+from typing import Dict, List, Mapping, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np  # type: ignore
+
+from opentrons.types import Point
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+if TYPE_CHECKING:
+    from opentrons.protocols.models import LabwareDefinition as LabwareModel
+
+
+WellCoordinates = Tuple[float, float, float, float]
+"""A well's (x, y, z, depth) relative to its labware's origin."""
+
+
+class WellPositions:
+    """Absolute positions of every well in a labware, computed all at once.
+
+    Well coordinates are kept in NumPy arrays in the order of the labware
+    definition's ``ordering`` (i.e. A1, B1, ... A2, B2, ...), so that the
+    positions of a whole labware can be computed, or moved to a new origin,
+    with a single array operation rather than one :py:class:`.Point` at a
+    time.
+    """
+
+    def __init__(
+        self,
+        ordering: Sequence[Sequence[str]],
+        coordinates: Mapping[str, WellCoordinates],
+        parent_point: Point = Point(0, 0, 0),
+    ) -> None:
+        """
+        Construct a set of well positions.
+
+        :param ordering: Well names, grouped by column, from the definition
+        :param coordinates: Each well's (x, y, z, depth) relative to the
+                            labware's origin
+        :param parent_point: The absolute position of the labware's origin
+        """
+        self._names: List[str] = [name for column in ordering for name in column]
+        self._index_by_name: Dict[str, int] = {
+            name: index for index, name in enumerate(self._names)
+        }
+
+        relative = np.array(
+            [coordinates[name] for name in self._names], dtype=float
+        ).reshape(-1, 4)
+        parent = np.array([parent_point.x, parent_point.y, parent_point.z])
+
+        self._parent_point = parent_point
+        self._depths = relative[:, 3]
+        self._bottoms = parent + relative[:, :3]
+        self._tops = self._bottoms.copy()
+        self._tops[:, 2] += self._depths
+
+    @classmethod
+    def from_definition(
+        cls, definition: LabwareDefinition, parent_point: Point = Point(0, 0, 0)
+    ) -> WellPositions:
+        """Build well positions from a labware definition dictionary."""
+        wells = definition["wells"]
+        return cls(
+            ordering=definition["ordering"],
+            coordinates={
+                name: (props["x"], props["y"], props["z"], props["depth"])
+                for name, props in wells.items()
+            },
+            parent_point=parent_point,
+        )
+
+    @classmethod
+    def from_model(
+        cls, definition: "LabwareModel", parent_point: Point = Point(0, 0, 0)
+    ) -> WellPositions:
+        """Build well positions from a labware definition model."""
+        return cls(
+            ordering=definition.ordering,
+            coordinates={
+                name: (props.x, props.y, props.z, props.depth)
+                for name, props in definition.wells.items()
+            },
+            parent_point=parent_point,
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """All well names, in definition order."""
+        return list(self._names)
+
+    @property
+    def parent_point(self) -> Point:
+        """The absolute position of the labware's origin."""
+        return self._parent_point
+
+    def with_parent_point(self, parent_point: Point) -> WellPositions:
+        """Get the same wells, moved to a labware origin at ``parent_point``."""
+        delta = parent_point - self._parent_point
+        shift = np.array([delta.x, delta.y, delta.z])
+
+        moved = copy.copy(self)
+        moved._parent_point = parent_point
+        moved._bottoms = self._bottoms + shift
+        moved._tops = self._tops + shift
+        return moved
+
+    def tops(self) -> np.ndarray:
+        """
+        Get the top-center of every well at once.
+
+        :return: An (N, 3) array of absolute (x, y, z) positions, in
+                 definition order
+        """
+        return self._tops
+
+    def top(self, name: str, z: float = 0.0) -> Point:
+        """Get the top-center of a single well."""
+        x, y, top_z = self._tops[self._index_by_name[name]].tolist()
+        return Point(x, y, top_z + z)
+
+    def bottom(self, name: str, z: float = 0.0) -> Point:
+        """Get the bottom-center of a single well."""
+        x, y, bottom_z = self._bottoms[self._index_by_name[name]].tolist()
+        return Point(x, y, bottom_z + z)
+
+    def depth(self, name: str) -> float:
+        """Get the depth of a single well."""
+        return float(self._depths[self._index_by_name[name]])
@@ -6,6 +6,7 @@ a protocol from the command line.
 
 import argparse
 import asyncio
+import datetime
 
 import sys
 import logging
@@ -27,7 +28,9 @@ from typing import (
 
 
 import opentrons
+from opentrons.hardware_control import API, ThreadManager
 from opentrons.hardware_control.simulator_setup import load_simulator
+from opentrons.hardware_control.time_estimator import TimeEstimator
 from opentrons.protocol_api import MAX_SUPPORTED_VERSION
 from opentrons.protocols.execution import execute
 import opentrons.broker
@@ -74,16 +77,28 @@ class CommandScraper:
     """
 
     def __init__(
-        self, logger: logging.Logger, level: str, broker: opentrons.broker.Broker
+        self,
+        logger: logging.Logger,
+        level: str,
+        broker: opentrons.broker.Broker,
+        time_estimator: Optional[TimeEstimator] = None,
     ) -> None:
         """Build the scraper.
 
         :param logger: The :py:class:`logging.logger` to scrape
         :param level: The log level to scrape
         :param broker: Which broker to subscribe to
+        :param time_estimator: If specified, the hardware simulator's time
+                               estimator, used to add an estimated
+                               ``duration`` to each command
         """
         self._logger = logger
         self._broker = broker
+        self._time_estimator = time_estimator
+        self._started: List[Tuple[Dict[str, Any], float]] = []
+        # Commands are charged from the end of the previous command so that
+        # unpublished preparatory moves count towards the command needing them
+        self._mark = time_estimator.elapsed if time_estimator else 0.0
         self._queue = queue.Queue()  # type: ignore
         if level != "none":
             level = getattr(logging, level.upper(), logging.WARNING)
@@ -118,13 +133,19 @@ class CommandScraper:
         """The callback subscribed to the broker"""
         payload = message["payload"]
         if message["$"] == "before":
-            self._commands.append(
-                {"level": self._depth, "payload": payload, "logs": []}
-            )
+            command = {"level": self._depth, "payload": payload, "logs": []}
+            self._commands.append(command)
+            if self._time_estimator:
+                self._started.append((command, self._mark))
+                self._mark = self._time_estimator.elapsed
             self._depth += 1
         else:
             while not self._queue.empty():
                 self._commands[-1]["logs"].append(self._queue.get())
+            if self._time_estimator and self._started:
+                command, started_at = self._started.pop()
+                self._mark = self._time_estimator.elapsed
+                command["duration"] = self._mark - started_at
             self._depth = max(self._depth - 1, 0)
 
 
@@ -285,6 +306,14 @@ def simulate(
                        a payload do ``payload['text'].format(**payload)``.
         - ``logs``: Any log messages that occurred during execution of this
                     command, as a logging.LogRecord
+        - ``duration``: The estimated number of seconds this command would
+                        take on a robot, including the commands nested in it
+                        and any moves made in preparation for it since the
+                        previous command. Based on the robot's motion
+                        settings, pipette flow rates, delays and module
+                        temperature ramps. Only present for Protocol API v2
+                        protocols. See :py:meth:`estimate_duration` for the
+                        whole run.
 
     :param file-like protocol_file: The protocol file to simulate.
     :param str file_name: The name of the file
@@ -358,15 +387,21 @@ def simulate(
         # we want a None literal rather than empty dict so get_protocol_api
         # will look for custom labware if this is a robot
         gpa_extras = getattr(protocol, "extra_labware", None) or None
+        hardware = hardware_simulator or ThreadManager(API.build_hardware_simulator)
         context = get_protocol_api(
             getattr(protocol, "api_level", MAX_SUPPORTED_VERSION),
             bundled_labware=getattr(protocol, "bundled_labware", None),
             bundled_data=getattr(protocol, "bundled_data", None),
-            hardware_simulator=hardware_simulator,
+            hardware_simulator=hardware,
             extra_labware=gpa_extras,
         )
         broker = context.broker
-        scraper = CommandScraper(stack_logger, log_level, broker)
+        # only estimate the time taken by the protocol itself, not by
+        # setting up the context or by anything simulated beforehand
+        time_estimator: Optional[TimeEstimator] = hardware.time_estimator
+        if time_estimator:
+            time_estimator.reset()
+        scraper = CommandScraper(stack_logger, log_level, broker, time_estimator)
         try:
             execute.run_protocol(protocol, context)
             if (
@@ -382,19 +417,43 @@ def simulate(
     return scraper.commands, bundle_contents
 
 
-def format_runlog(runlog: List[Mapping[str, Any]]) -> str:
+def estimate_duration(runlog: List[Mapping[str, Any]]) -> Optional[float]:
+    """
+    Estimate how many seconds the commands in a run log (return value of
+    :py:meth:`simulate`) would take to execute on a robot.
+
+    :param runlog: The output of a call to :py:func:`simulate`
+    :returns: The estimate, or ``None`` if the run log has no durations
+    """
+    durations = [
+        command["duration"]
+        for command in runlog
+        if command["level"] == 0 and "duration" in command
+    ]
+    return sum(durations) if durations else None
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    return str(datetime.timedelta(seconds=round(seconds)))
+
+
+def format_runlog(runlog: List[Mapping[str, Any]], show_durations: bool = False) -> str:
     """
     Format a run log (return value of :py:meth:`simulate``) into a
     human-readable string
 
     :param runlog: The output of a call to :py:func:`simulate`
+    :param show_durations: Whether to include the estimated duration of each
+                           command and of the whole run
     """
     to_ret = []
     for command in runlog:
-        to_ret.append(
-            "\t" * command["level"]
-            + command["payload"].get("text", "").format(**command["payload"])
-        )
+        text = command["payload"].get("text", "").format(**command["payload"])
+        if show_durations and "duration" in command:
+            text += f" ({_format_duration(command['duration'])})"
+        to_ret.append("\t" * command["level"] + text)
         if command["logs"]:
             to_ret.append("\t" * command["level"] + "Logs from this command:")
             to_ret.extend(
@@ -404,6 +463,9 @@ def format_runlog(runlog: List[Mapping[str, Any]]) -> str:
                     for l in command["logs"]  # noqa: E741
                 ]
             )
+    total = estimate_duration(runlog)
+    if show_durations and total is not None:
+        to_ret.append(f"Estimated run time: {_format_duration(total)}")
     return "\n".join(to_ret)
 
 
@@ -540,6 +602,13 @@ def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         choices=["runlog", "nothing"],
         default="runlog",
     )
+    parser.add_argument(
+        "-e",
+        "--estimate-duration",
+        action="store_true",
+        help="Show the estimated duration of each command in the runlog, "
+        "and of the whole protocol, as it would run on a robot.",
+    )
     return parser
 
 
@@ -595,7 +664,7 @@ def main() -> int:
             bundle.create_bundle(maybe_bundle, bundle_dest)
 
     if args.output == "runlog":
-        print(format_runlog(runlog))
+        print(format_runlog(runlog, show_durations=args.estimate_duration))
 
     return 0
 
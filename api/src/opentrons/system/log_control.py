@@ -7,7 +7,8 @@ This is the implementation of the endpoints in
 import asyncio
 import logging
 import subprocess
-from typing import Tuple
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
 
 LOG = logging.getLogger(__name__)
@@ -15,6 +16,9 @@ LOG = logging.getLogger(__name__)
 MAX_RECORDS = 100000
 DEFAULT_RECORDS = 50000
 
+#: Most bytes of journalctl's output to hold at once while streaming records
+CHUNK_SIZE = 64 * 1024
+
 
 async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
     """Dump the log files.
@@ -39,6 +43,103 @@ async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
     return stdout
 
 
+def _journal_time(time: datetime) -> str:
+    # journalctl reads times as local time unless given as a timestamp
+    return f"@{int(time.timestamp())}"
+
+
+def _journal_args(
+    selector: str,
+    records: int,
+    mode: str,
+    cursor: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> List[str]:
+    args = ["-t", selector]
+    # journalctl's -n always counts back from the end of the journal
+    if cursor is None and since is None:
+        args += ["-n", str(records)]
+    args += ["-o", mode, "-a"]
+    if cursor is not None:
+        args += ["--after-cursor", cursor]
+    if since is not None:
+        args += ["--since", _journal_time(since)]
+    if until is not None:
+        args += ["--until", _journal_time(until)]
+    return args
+
+
+async def stream_records(
+    selector: str,
+    records: int,
+    mode: str,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> AsyncIterator[bytes]:
+    """Stream the log files as journalctl prints them.
+
+    Output is yielded in chunks of up to :py:data:`CHUNK_SIZE` bytes as it is
+    read, rather than once journalctl is done, so however many records there
+    are only a chunk is held at a time. Chunks don't line up with records.
+
+    In the "json" mode, every record is a JSON object on its own line, and
+    its "__CURSOR" field can be passed as ``cursor`` to later get only the
+    records after it.
+
+    Without ``cursor`` or ``since``, the latest ``records`` records are
+    printed. With either of them, the records are counted forward from there
+    instead, so that following the logs by cursor doesn't skip any; this
+    counts lines, so in the "short" mode a record printed on several lines
+    counts as several records.
+
+    :param selector: The syslog selector to limit responses to
+    :param records: The maximum number of records to print
+    :param mode: A journalctl dump mode. Should be either "short" or "json".
+    :param cursor: Only print the records after the one with this cursor
+    :param since: Only print the records from this time on
+    :param until: Only print the records up to this time
+    """
+    count_forward = cursor is not None or since is not None
+    args = _journal_args(selector, records, mode, cursor, since, until)
+
+    proc = await asyncio.create_subprocess_exec(
+        "journalctl", "--no-pager", *args, stdout=subprocess.PIPE
+    )
+    try:
+        assert proc.stdout, "journalctl's output is piped"
+        remaining = records
+        while True:
+            chunk = await proc.stdout.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if count_forward:
+                end = _find_line_end(chunk, remaining)
+                if end is not None:
+                    # journalctl is killed below rather than read to the end
+                    yield chunk[:end]
+                    return
+                remaining -= chunk.count(b"\n")
+            yield chunk
+        await proc.wait()
+    finally:
+        # Whoever is streaming may stop early, e.g. on disconnecting
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+def _find_line_end(chunk: bytes, lines: int) -> Optional[int]:
+    """Get the index just past the given number of lines of a chunk, if any."""
+    end = 0
+    for _ in range(lines):
+        end = chunk.find(b"\n", end) + 1
+        if end == 0:
+            return None
+    return end
+
+
 async def set_syslog_level(level: str) -> Tuple[int, str, str]:
     """
     Set the minimum level for which logs will be sent upstream via syslog-ng.
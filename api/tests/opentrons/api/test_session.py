@@ -5,7 +5,7 @@ import pytest
 import base64
 
 from opentrons.api import session
-from opentrons.api.session import _accumulate, _dedupe
+from opentrons.api.session import _ReferentCollector
 from opentrons.hardware_control import ThreadedAsyncForbidden
 
 from tests.opentrons.conftest import state
@@ -87,21 +87,30 @@ async def test_load_and_run_v2(main_router, protocol, protocol_file, loop):
     assert session.protocol_text == protocol.text
 
 
-def test_accumulate():
-    res = _accumulate(
-        [
-            (["a"], ["d"], ["g", "h"], [("l", "m")]),
-            (["b", "c"], ["e", "f"], ["i"], [("m", "n")]),
-        ]
-    )
-
-    assert res == (
-        ["a", "b", "c"],
-        ["d", "e", "f"],
-        ["g", "h", "i"],
-        [("l", "m"), ("m", "n")],
-    )
-    assert _accumulate([]) == ([], [], [], [])
+def test_referent_collector():
+    collector = _ReferentCollector()
+    with patch.object(
+        session.introspection,
+        "get_referred_objects",
+        side_effect=[
+            (["a"], ["d"], ["g", "h"]),
+            (["b", "a"], ["e", "d"], ["g"]),
+            ValueError("bad location"),
+        ],
+    ):
+        collector.add({"text": "first"})
+        collector.add({"text": "second"})
+        collector.add({"text": "third"})
+
+    assert list(collector.instruments) == ["a", "b"]
+    assert list(collector.containers) == ["d", "e"]
+    assert list(collector.modules) == ["g", "h"]
+    assert list(collector.interactions) == [
+        ("a", "d"),
+        ("b", "e"),
+        ("b", "d"),
+        ("a", "e"),
+    ]
 
 
 def test_dedupe():
@@ -122,7 +131,15 @@ def test_dedupe():
         # Labware item that therefore breaks identity checking.
         + [third["A1"].parent for elem in range(10)]
     )
-    assert sorted(_dedupe(iterable), key=lambda lw: lw.name) == sorted(
+    collector = _ReferentCollector()
+    for lw in iterable:
+        with patch.object(
+            session.introspection,
+            "get_referred_objects",
+            return_value=([], [lw], []),
+        ):
+            collector.add({"text": lw.name})
+    assert sorted(collector.containers, key=lambda lw: lw.name) == sorted(
         [first, second, third], key=lambda lw: lw.name
     )
 
@@ -1,3 +1,6 @@
+import logging
+
+from opentrons.broker import Broker
 from opentrons.commands.publisher import CommandPublisher, publish
 
 
@@ -63,3 +66,49 @@ def test_add_listener():
     fake_obj.A(0, 2)
 
     assert calls == expected, "No calls expected after unsubscribe()"
+
+
+def test_has_subscribers():
+    broker = Broker()
+    assert not broker.has_subscribers("command")
+
+    unsubscribe = broker.subscribe("command", lambda message: None)
+    assert broker.has_subscribers("command")
+    assert not broker.has_subscribers("session")
+
+    unsubscribe()
+    assert not broker.has_subscribers("command")
+
+
+def test_no_payload_without_listeners(caplog):
+    built = []
+
+    def counted_command(arg1, meta=None, arg2="", arg3=""):
+        built.append(arg1)
+        return my_command(arg1, meta, arg2, arg3)
+
+    class CountedClass(CommandPublisher):
+        def __init__(self):
+            super().__init__(None)
+
+        @publish.both(command=counted_command, meta="{arg1}")
+        def D(self, arg1):
+            return arg1
+
+    fake_obj = CountedClass()
+    fake_obj.broker.set_logger(logging.getLogger("test_broker"))
+
+    with caplog.at_level(logging.WARNING, logger="test_broker"):
+        assert fake_obj.D(1) == 1
+    assert built == []
+    assert caplog.records == []
+
+    with caplog.at_level(logging.INFO, logger="test_broker"):
+        fake_obj.D(2)
+    assert built == []
+    assert len(caplog.messages) == 1
+    assert caplog.messages[0].endswith("CountedClass.D: {'arg1': 2}")
+
+    fake_obj.broker.subscribe("command", lambda message: None)
+    fake_obj.D(3)
+    assert built == [3, 3]
@@ -0,0 +1,106 @@
+import datetime
+import json
+import threading
+
+import pytest
+
+from opentrons.calibration_storage import file_operators as io
+
+
+def test_read_returns_copies(tmp_path):
+    path = tmp_path / "cal.json"
+    io.save_to_file(path, {"default": {"offset": [1, 2, 3]}})
+
+    first = io.read_cal_file(path)
+    first["default"]["offset"] = [0, 0, 0]
+    assert io.read_cal_file(path) == {"default": {"offset": [1, 2, 3]}}
+
+
+def test_read_sees_changed_files(tmp_path):
+    path = tmp_path / "cal.json"
+    io.save_to_file(path, {"value": 1})
+    assert io.read_cal_file(str(path)) == {"value": 1}
+
+    # files written outside of calibration storage are read again
+    path.write_text(json.dumps({"value": 22}))
+    assert io.read_cal_file(str(path)) == {"value": 22}
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_file(str(path))
+
+
+def test_save_decodes_like_read(tmp_path):
+    path = tmp_path / "cal.json"
+    modified = datetime.datetime(2021, 3, 4, 5, 6, 7)
+    io.save_to_file(path, {"default": {"lastModified": modified}})
+    assert io.read_cal_file(path) == {"default": {"lastModified": modified}}
+    assert [p.name for p in tmp_path.iterdir()] == ["cal.json"]
+
+
+def test_batch_writes(tmp_path):
+    index = tmp_path / "index.json"
+    cal = tmp_path / "cal.json"
+
+    with io.batch_writes():
+        io.save_to_file(index, {"a": 1})
+        io.save_to_file(cal, {"b": 2})
+        io.save_to_file(index, {"a": 3})
+        with io.batch_writes():
+            io.save_to_file(cal, {"b": 4})
+        # nothing is written until the batch is done, but it can be read
+        assert not index.exists() and not cal.exists()
+        assert io.read_cal_file(index) == {"a": 3}
+
+    assert json.loads(index.read_text()) == {"a": 3}
+    assert json.loads(cal.read_text()) == {"b": 4}
+
+
+def test_failed_batch_writes_nothing(tmp_path):
+    path = tmp_path / "cal.json"
+    io.save_to_file(path, {"value": 1})
+
+    with pytest.raises(RuntimeError):
+        with io.batch_writes():
+            io.save_to_file(path, {"value": 2})
+            raise RuntimeError("oh no")
+
+    assert io.read_cal_file(path) == {"value": 1}
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = tmp_path / "cal.json"
+    io.save_to_file(path, {"value": 1})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(io.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        io.save_to_file(path, {"value": 2})
+
+    assert [p.name for p in tmp_path.iterdir()] == ["cal.json"]
+    assert io.read_cal_file(path) == {"value": 1}
+
+
+def test_batch_writes_per_thread(tmp_path):
+    batched = tmp_path / "batched.json"
+    other = tmp_path / "other.json"
+
+    seen_from_other = []
+
+    def save_other():
+        io.save_to_file(other, {"c": 5})
+        seen_from_other.append(batched.exists())
+
+    with io.batch_writes():
+        io.save_to_file(batched, {"a": 1})
+        # another thread isn't held up by the batch, nor part of it
+        thread = threading.Thread(target=save_other)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert seen_from_other == [False]
+        assert json.loads(other.read_text()) == {"c": 5}
+
+    assert json.loads(batched.read_text()) == {"a": 1}
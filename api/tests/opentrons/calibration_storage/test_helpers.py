@@ -0,0 +1,23 @@
+import copy
+
+from opentrons.calibration_storage import helpers
+from opentrons.protocols.labware.definition import get_labware_definition
+
+
+def test_hash_labware_def():
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+    labware_hash = helpers.hash_labware_def(definition)
+    assert helpers.hash_labware_def(definition) == labware_hash
+
+    # equal definitions hash the same, and metadata doesn't count
+    same = copy.deepcopy(definition)
+    same["metadata"]["displayName"] = "my tiprack"
+    assert helpers.hash_labware_def(same) == labware_hash
+
+    different = copy.deepcopy(definition)
+    different["parameters"]["tipLength"] += 1
+    assert helpers.hash_labware_def(different) != labware_hash
+
+    # a definition modified in place hashes as its new contents
+    definition["parameters"]["tipLength"] += 1
+    assert helpers.hash_labware_def(definition) == helpers.hash_labware_def(different)
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import pty
+from typing import AsyncGenerator, List, Tuple
+
+import pytest
+from opentrons.drivers.asyncio.communication import SelectorSerial
+
+
+@pytest.fixture
+async def server(
+    loop: asyncio.AbstractEventLoop,
+) -> AsyncGenerator[Tuple[str, List[asyncio.StreamWriter], List[bytes]], None]:
+    """A TCP server standing in for an emulator."""
+    writers: List[asyncio.StreamWriter] = []
+    received: List[bytes] = []
+
+    async def _on_connect(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        writers.append(writer)
+        while True:
+            data = await reader.read(100)
+            if not data:
+                break
+            received.append(data)
+
+    server = await asyncio.start_server(_on_connect, host="127.0.0.1", port=0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"socket://127.0.0.1:{port}", writers, received
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.fixture
+async def subject(
+    loop: asyncio.AbstractEventLoop, server
+) -> AsyncGenerator[SelectorSerial, None]:
+    """The test subject, connected to the server."""
+    url, writers, _ = server
+    subject = await SelectorSerial.create(port=url, baud_rate=115200, timeout=1)
+    while not writers:
+        await asyncio.sleep(0.01)
+    yield subject
+    await subject.close()
+
+
+def test_supports(loop: asyncio.AbstractEventLoop) -> None:
+    """It should support sockets and local devices only."""
+    assert SelectorSerial.supports("socket://127.0.0.1:9999", loop)
+    assert SelectorSerial.supports("/dev/ttyAMA0", loop)
+    assert not SelectorSerial.supports("loop://", loop)
+
+
+async def test_read_until(subject: SelectorSerial, server) -> None:
+    """It should read until the match, across chunks, leaving the rest."""
+    _, writers, _ = server
+    writers[0].write(b"M114 X:1 ")
+    await writers[0].drain()
+    await asyncio.sleep(0.01)
+    writers[0].write(b"Y:2 ok\r\nok\r\nmore")
+
+    assert await subject.read_until(b"ok\r\nok\r\n") == b"M114 X:1 Y:2 ok\r\nok\r\n"
+    assert await subject.read_until(b"ok", timeout=0.05) == b"more"
+
+
+async def test_read_until_timeout(subject: SelectorSerial, server) -> None:
+    """It should return the partial data read if the match never arrives."""
+    _, writers, _ = server
+    writers[0].write(b"partial")
+
+    assert await subject.read_until(b"ok", timeout=0.1) == b"partial"
+
+
+async def test_write_resets_input(subject: SelectorSerial, server) -> None:
+    """It should discard unread data and write everything."""
+    _, writers, received = server
+    writers[0].write(b"stale ok")
+    await asyncio.sleep(0.05)
+
+    await subject.write(b"G28.2 X\r\n\r\n")
+    writers[0].write(b"fresh ok")
+
+    assert await subject.read_until(b"ok") == b"fresh ok"
+    assert b"".join(received) == b"G28.2 X\r\n\r\n"
+
+
+async def test_close_and_reopen(subject: SelectorSerial, server) -> None:
+    """It should reconnect when reopened."""
+    _, writers, _ = server
+    await subject.close()
+    assert not await subject.is_open()
+
+    await subject.open()
+    assert await subject.is_open()
+    while len(writers) < 2:
+        await asyncio.sleep(0.01)
+    writers[1].write(b"ok")
+
+    assert await subject.read_until(b"ok") == b"ok"
+
+
+async def test_local_device(loop: asyncio.AbstractEventLoop) -> None:
+    """It should read and write a local tty."""
+    controller, device = pty.openpty()
+    subject = await SelectorSerial.create(
+        port=os.ttyname(device), baud_rate=115200, timeout=1
+    )
+    try:
+        await subject.write(b"M400\r\n")
+        assert os.read(controller, 100) == b"M400\r\n"
+
+        os.write(controller, b"ok\r\n")
+        assert await subject.read_until(b"ok\r\n") == b"ok\r\n"
+    finally:
+        await subject.close()
+        os.close(controller)
+        os.close(device)
@@ -4,6 +4,7 @@ import pytest
 from mock import AsyncMock, call
 
 from opentrons.drivers.asyncio.communication.async_serial import AsyncSerial
+from opentrons.drivers.command_builder import CommandBuilder
 from opentrons.drivers.asyncio.communication.serial_connection import SerialConnection
 from opentrons.drivers.asyncio.communication import (
     NoResponse,
@@ -93,6 +94,47 @@ async def test_send_command_response(
     assert response == response_data
 
 
+async def test_send_commands(
+    mock_serial_port: AsyncMock, subject: SerialConnection, ack: str
+) -> None:
+    """It should send commands in one write and read an ack for each."""
+    mock_serial_port.read_until.side_effect = (
+        f"first {ack}".encode(),
+        f"second {ack}".encode(),
+    )
+    commands = [
+        CommandBuilder(terminator="\n").add_gcode("G0"),
+        CommandBuilder(terminator="\n").add_gcode("M400"),
+    ]
+
+    response = await subject.send_commands(commands=commands, timeout=1)
+
+    assert response == ["first", "second"]
+    mock_serial_port.write.assert_called_once_with(data=b"G0 \nM400 \n")
+    mock_serial_port.read_until.assert_has_calls(
+        calls=[
+            call(match=ack.encode(), timeout=1),
+            call(match=ack.encode(), timeout=1),
+        ]
+    )
+
+
+async def test_send_commands_missing_ack(
+    mock_serial_port: AsyncMock, subject: SerialConnection, ack: str
+) -> None:
+    """It should raise without retrying if any ack is missing."""
+    mock_serial_port.read_until.side_effect = (f"first {ack}".encode(), b"")
+    commands = [
+        CommandBuilder(terminator="\n").add_gcode("G0"),
+        CommandBuilder(terminator="\n").add_gcode("M400"),
+    ]
+
+    with pytest.raises(NoResponse):
+        await subject.send_commands(commands=commands)
+
+    mock_serial_port.write.assert_called_once()
+
+
 @pytest.mark.parametrize(
     argnames=["response", "exception_type"],
     argvalues=[
@@ -190,7 +190,11 @@ async def test_clear_limit_switch(
         else:
             return "ok"
 
+    def write_batch_mock(commands, timeout):
+        return [write_mock(c, retries=0, timeout=timeout) for c in commands]
+
     mock_connection.send_command.side_effect = write_mock
+    mock_connection.send_commands.side_effect = write_batch_mock
 
     # This will cause a limit-switch error and not back off
     with pytest.raises(driver_3_0.SmoothieError):
@@ -230,7 +234,11 @@ async def test_unstick_axes(
         else:
             return "ok"
 
+    def write_batch_mock(commands, timeout):
+        return [write_mock(c, retries=0, timeout=timeout) for c in commands]
+
     mock_connection.send_command.side_effect = write_mock
+    mock_connection.send_commands.side_effect = write_batch_mock
 
     await smoothie.unstick_axes(axes="ABCXYZ", distance=2, speed=3)
 
@@ -5,7 +5,13 @@ from mock import AsyncMock
 from opentrons.drivers.asyncio.communication.serial_connection import SerialConnection
 from opentrons.drivers.thermocycler import driver
 from opentrons.drivers.command_builder import CommandBuilder
-from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
+from opentrons.drivers.asyncio.communication import NoResponse
+from opentrons.drivers.types import (
+    Temperature,
+    PlateTemperature,
+    ThermocyclerLidStatus,
+    ThermocyclerStatus,
+)
 from opentrons.drivers.utils import TC_GCODE_ROUNDING_PRECISION
 
 
@@ -151,6 +157,47 @@ async def test_get_plate_temp(
     assert response == PlateTemperature(target=30, current=23.32, hold=120)
 
 
+async def test_get_status(
+    subject: driver.ThermocyclerDriver, connection: AsyncMock
+) -> None:
+    """It should read the lid status and temperatures in one transaction."""
+    connection.send_commands.return_value = [
+        "Lid:open",
+        "T:100.000 C:22.041",
+        "T:30.000 C:23.317 H:120",
+    ]
+
+    response = await subject.get_status()
+
+    expected = [
+        CommandBuilder(terminator=driver.TC_COMMAND_TERMINATOR).add_gcode(gcode=gcode)
+        for gcode in ("M119", "M141", "M105")
+    ]
+
+    connection.send_commands.assert_called_once_with(commands=expected)
+    assert response == ThermocyclerStatus(
+        lid_status=ThermocyclerLidStatus.OPEN,
+        lid_temperature=Temperature(target=100, current=22.04),
+        plate_temperature=PlateTemperature(target=30, current=23.32, hold=120),
+    )
+
+
+async def test_get_status_retry(
+    subject: driver.ThermocyclerDriver, connection: AsyncMock
+) -> None:
+    """It should resend the whole batch if an ack is missing."""
+    connection.send_commands.side_effect = [
+        NoResponse(port="port", command="M141"),
+        ["Lid:closed", "T:none C:22.041", "T:none C:23.317 H:none"],
+    ]
+
+    response = await subject.get_status()
+
+    assert connection.send_commands.call_count == 2
+    connection.on_retry.assert_called_once()
+    assert response.lid_status == ThermocyclerLidStatus.CLOSED
+
+
 async def test_set_ramp_rate(
     subject: driver.ThermocyclerDriver, connection: AsyncMock
 ) -> None:
@@ -1,3 +1,5 @@
+from typing import List
+
 import pytest
 from mock import MagicMock
 from opentrons.drivers.types import MoveSplit
@@ -23,12 +25,26 @@ async def subject(emulation_app) -> SmoothieDriver:
 
 @pytest.fixture
 def spy(subject: SmoothieDriver) -> MagicMock:
-    """Attach a spy to gcode sender."""
-    spy = MagicMock(wraps=subject._connection.send_data)
-    subject._connection.send_data = spy
+    """Attach a spy to gcode senders."""
+    spy = MagicMock()
+    for name in ("send_data", "send_commands"):
+        sender = MagicMock(wraps=getattr(subject._connection, name))
+        spy.attach_mock(sender, name)
+        setattr(subject._connection, name, sender)
     return spy
 
 
+def get_command_log(spy: MagicMock) -> List[str]:
+    """Get the gcode sent, in order, whether sent alone or streamed."""
+    command_log = []
+    for name, args, kwargs in spy.mock_calls:
+        if name == "send_data":
+            command_log.append(kwargs["data"].strip())
+        elif name == "send_commands":
+            command_log += [c.build().strip() for c in kwargs["commands"]]
+    return command_log
+
+
 async def test_dwell_and_activate_axes(subject: SmoothieDriver, spy: MagicMock):
     subject.activate_axes("X")
     await subject._set_saved_current()
@@ -52,7 +68,7 @@ async def test_dwell_and_activate_axes(subject: SmoothieDriver, spy: MagicMock):
         "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
 
     assert command_log == expected
 
@@ -69,7 +85,7 @@ async def test_disable_motor(subject: SmoothieDriver, spy: MagicMock):
         "M18 ABC",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
 
@@ -111,7 +127,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
         "M114.2",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
     spy.reset_mock()
@@ -121,7 +137,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
         "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
     spy.reset_mock()
@@ -133,7 +149,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
         "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
     spy.reset_mock()
@@ -150,7 +166,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
         "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
 
@@ -182,17 +198,15 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
     expected = [
         "M55 M92 C0.03125 G4 P0.01 G0 F60 M907 A0.1 B0.05 C1.75 X1.25 Y1.25"
         " Z0.8 G4 P0.005",
-        "M400",
         "G0 C18.0",
         "M400",
         "M54 M92 C1.0 G4 P0.01",
-        "M400",
         "G0 F24000 M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 C3 X0 Y1.123 Z2",
         "M400",
         "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
     spy.reset_mock()
@@ -201,17 +215,15 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
     expected = [
         "M53 M92 B0.03125 G4 P0.01 G0 F60 M907 A0.1 B1.75 C0.05 X0.3 Y0.3 Z0.1"
         " G4 P0.005",
-        "M400",
         "G0 B18.0",
         "M400",
         "M52 M92 B1.0 G4 P0.01",
-        "M400",
         "G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
         "M400",
         "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
 
@@ -244,7 +256,7 @@ async def test_set_active_current(subject: SmoothieDriver, spy: MagicMock):
         "M114.2",  # update the position
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
 
@@ -259,7 +271,7 @@ async def test_steps_per_mm(subject: SmoothieDriver, spy: MagicMock):
     expected["Z"] = 450
     assert subject.steps_per_mm == expected
 
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == ["M92 Z450", "M400"]
 
 
@@ -272,7 +284,7 @@ async def test_pipette_configs(subject: SmoothieDriver, spy: MagicMock):
     }
     assert res == expected_return
 
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == [
         "M365.0 Z175",
         "M400",
@@ -304,7 +316,7 @@ async def test_set_acceleration(subject: SmoothieDriver, spy: MagicMock):
         "M204 S10000 A4 B5 C6 X1 Y2 Z3",
         "M400",
     ]
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == expected
 
 
@@ -323,7 +335,7 @@ async def test_read_and_write_pipettes(subject: SmoothieDriver, spy: MagicMock):
 async def test_fast_home(subject: SmoothieDriver, spy: MagicMock):
     await subject.fast_home(axis="X", safety_margin=12)
 
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == [
         "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X406.0",
         "M400",
@@ -346,7 +358,7 @@ async def test_fast_home(subject: SmoothieDriver, spy: MagicMock):
 
 async def test_update_homing_flags(subject: SmoothieDriver, spy: MagicMock):
     await subject.update_homed_flags()
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == ["G28.6", "M400"]
 
 
@@ -354,7 +366,7 @@ async def test_update_pipette_config(subject: SmoothieDriver, spy: MagicMock):
     await subject.update_pipette_config(
         "X", {"retract": 2, "debounce": 3, "max_travel": 4, "home": 5}
     )
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == [
         "M365.3 X2",
         "M400",
@@ -386,7 +398,7 @@ async def test_do_relative_splits_during_home_for(
 
     await subject._do_relative_splits_during_home_for("BC")
 
-    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    command_log = get_command_log(spy)
     assert command_log == [
         "M53 M55 M92 B0.03125 C0.03125 G4 P0.01 M907 B1.75 G4 P0.005 G0 F60 G91",
         "M400",
@@ -1,5 +1,12 @@
+import asyncio
+
 import pytest
+from opentrons.config import robot_configs
 from opentrons.hardware_control import modules, ExecutionManager
+from opentrons.hardware_control.time_estimator import (
+    TEMPDECK_RAMP_RATE,
+    TimeEstimator,
+)
 
 
 from opentrons.drivers.rpi_drivers.types import USBPort
@@ -91,3 +98,48 @@ async def test_revision_model_parsing(loop, usb_port):
     assert mag.model() == "temperatureModuleV1"
     mag._device_info["model"] = "temp_deck_v1.1"
     assert mag.model() == "temperatureModuleV1"
+
+
+async def test_sim_time_estimate(loop, usb_port):
+    temp = await modules.TempDeck.build(
+        port="",
+        simulating=True,
+        usb_port=usb_port,
+        interrupt_callback=lambda x: None,
+        loop=loop,
+        execution_manager=ExecutionManager(loop=loop),
+        polling_frequency=0,
+    )
+    estimator = TimeEstimator(robot_configs.build_config({}))
+    temp.set_time_estimator(estimator)
+    await temp.wait_next_poll()
+
+    await temp.set_temperature(10)
+    assert estimator.elapsed == pytest.approx(10 / TEMPDECK_RAMP_RATE.heating)
+
+    # time spent on something else counts towards the ramp
+    await temp.start_set_temperature(4)
+    estimator.wait(20)
+    await temp.await_temperature(4)
+    assert estimator.elapsed == pytest.approx(
+        10 / TEMPDECK_RAMP_RATE.heating + 6 / TEMPDECK_RAMP_RATE.cooling
+    )
+
+
+async def test_status_after_start_set_temperature(loop, usb_port):
+    temp = await modules.TempDeck.build(
+        port="",
+        simulating=True,
+        usb_port=usb_port,
+        interrupt_callback=lambda x: None,
+        loop=loop,
+        execution_manager=ExecutionManager(loop=loop),
+        polling_frequency=0.2,
+    )
+    # the first poll has happened by the time the module is built
+    assert temp.status == "idle"
+
+    # the idle poller is hurried so the new target shows up straight away
+    await asyncio.wait_for(temp.start_set_temperature(40), timeout=0.5)
+    assert temp.target == 40
+    assert temp.status == "holding at target"
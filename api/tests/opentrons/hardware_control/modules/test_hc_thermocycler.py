@@ -1,7 +1,14 @@
 import pytest
 import mock
 from opentrons.drivers.thermocycler import SimulatingDriver
+from opentrons.config import robot_configs
 from opentrons.hardware_control import modules, ExecutionManager
+from opentrons.hardware_control.time_estimator import (
+    THERMOCYCLER_BLOCK_RAMP_RATE,
+    THERMOCYCLER_LID_MOTION_SEC,
+    THERMOCYCLER_LID_RAMP_RATE,
+    TimeEstimator,
+)
 
 from opentrons.drivers.rpi_drivers.types import USBPort
 
@@ -59,6 +66,37 @@ async def test_lid(loop, usb_port):
     assert therm.lid_status == "open"
 
 
+async def test_sim_time_estimate(loop, usb_port):
+    therm = await modules.build(
+        port="/dev/ot_module_sim_thermocycler0",
+        usb_port=usb_port,
+        which="thermocycler",
+        simulating=True,
+        interrupt_callback=lambda x: None,
+        loop=loop,
+        execution_manager=ExecutionManager(loop=loop),
+    )
+    estimator = TimeEstimator(robot_configs.build_config({}))
+    therm.set_time_estimator(estimator)
+    await therm.wait_next_poll()
+
+    # the lid starts open
+    await therm.open()
+    assert estimator.elapsed == 0
+    await therm.close()
+    assert estimator.elapsed == THERMOCYCLER_LID_MOTION_SEC
+
+    await therm.set_lid_temperature(103)
+    lid_heated = THERMOCYCLER_LID_MOTION_SEC + 80 / THERMOCYCLER_LID_RAMP_RATE.heating
+    assert estimator.elapsed == pytest.approx(lid_heated)
+
+    await therm.set_temperature(95, hold_time_seconds=30)
+    await therm.set_temperature(4, ramp_rate=1)
+    assert estimator.elapsed == pytest.approx(
+        lid_heated + 72 / THERMOCYCLER_BLOCK_RAMP_RATE.heating + 30 + 91 / 1
+    )
+
+
 async def test_sim_state(loop, usb_port):
     therm = await modules.build(
         port="/dev/ot_module_sim_thermocycler0",
@@ -70,9 +108,10 @@ async def test_sim_state(loop, usb_port):
         execution_manager=ExecutionManager(loop=loop),
     )
 
-    assert therm.temperature is None
+    # the first poll has happened by the time the module is built
+    assert therm.temperature == 23
     assert therm.target is None
-    assert therm.status == "error"
+    assert therm.status == "idle"
     assert therm.live_data["status"] == therm.status
     assert therm.live_data["data"]["currentTemp"] == therm.temperature
     assert therm.live_data["data"]["targetTemp"] == therm.target
@@ -1,4 +1,8 @@
-from opentrons.types import Mount
+import threading
+
+import pytest
+
+from opentrons.types import Mount, Point
 from opentrons.hardware_control import API, ThreadManager
 
 
@@ -8,3 +12,58 @@ async def test_synch_adapter():
     synch.cache_instruments({Mount.LEFT: "p10_single"})
     assert synch.attached_instruments[Mount.LEFT]["name"].startswith("p10_single")
     thread_manager.clean_up()
+
+
+async def test_synch_adapter_reuses_methods(monkeypatch):
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    assert synch.home is synch.home
+    assert synch.get_instrument_max_height is synch.get_instrument_max_height
+
+    # replaced methods are resolved again
+    homed = []
+
+    async def fake_home(self, axes=None):
+        homed.append(threading.current_thread())
+
+    monkeypatch.setattr(API, "home", fake_home)
+    synch.home()
+    assert homed == [thread_manager._thread]
+    thread_manager.clean_up()
+
+
+async def test_synch_adapter_batch(monkeypatch):
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    calls = []
+
+    async def fake_move_to(self, mount, abs_position, speed=None, **kwargs):
+        if abs_position is None:
+            raise ValueError("nowhere to go")
+        calls.append((abs_position, threading.current_thread()))
+
+    monkeypatch.setattr(API, "move_to", fake_move_to)
+
+    with synch.batch() as batch:
+        batch.move_to(Mount.LEFT, Point(1, 1, 1))
+        batch.move_to(Mount.LEFT, Point(2, 2, 2))
+        # nothing is called until the batch is done
+        assert calls == []
+    assert calls == [
+        (Point(1, 1, 1), thread_manager._thread),
+        (Point(2, 2, 2), thread_manager._thread),
+    ]
+
+    # the first error stops the rest of the batch
+    calls.clear()
+    with pytest.raises(ValueError, match="nowhere to go"):
+        with synch.batch() as batch:
+            batch.move_to(Mount.LEFT, Point(1, 1, 1))
+            batch.move_to(Mount.LEFT, None)
+            batch.move_to(Mount.LEFT, Point(2, 2, 2))
+    assert [position for position, _ in calls] == [Point(1, 1, 1)]
+
+    with pytest.raises(TypeError):
+        with synch.batch() as batch:
+            batch.attached_instruments()
+    thread_manager.clean_up()
@@ -551,3 +551,31 @@ async def test_reset_instruments(dummy_instruments, loop, monkeypatch):
     hw_api.reset_instrument()
     assert not (old_l is hw_api._attached_instruments[types.Mount.LEFT])
     assert not (old_r is hw_api._attached_instruments[types.Mount.LEFT])
+
+
+async def test_attached_instrument_snapshot(dummy_instruments, loop):
+    hw_api = await hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop
+    )
+    await hw_api.home()
+    await hw_api.cache_instruments()
+    mount = types.Mount.LEFT
+
+    first = hw_api.attached_instruments[mount]
+    # unchanged pipettes reuse the same snapshot
+    assert hw_api.attached_instruments[mount] is first
+    assert hw_api.get_attached_instrument(types.Mount.RIGHT) == {}
+
+    await hw_api.pick_up_tip(mount, 20.0)
+    with_tip = hw_api.attached_instruments[mount]
+    assert with_tip is not first
+    assert with_tip["has_tip"] and not first["has_tip"]
+
+    await hw_api.prepare_for_aspirate(mount)
+    await hw_api.aspirate(mount, 2)
+    aspirated = hw_api.attached_instruments[mount]
+    assert aspirated["current_volume"] == 2
+    assert with_tip["current_volume"] == 0
+
+    hw_api.set_flow_rate(mount, aspirate=1)
+    assert hw_api.attached_instruments[mount]["aspirate_flow_rate"] == 1
@@ -78,6 +78,89 @@ async def test_filtering_modules():
     assert filtered_modules == api.attached_modules[2:4]
 
 
+async def test_register_modules_concurrently(monkeypatch):
+    import opentrons.hardware_control as hardware_control
+    from opentrons.hardware_control import module_control
+
+    api = await hardware_control.API.build_hardware_simulator()
+    controls = api._backend.module_controls
+    original_build = controls.build_module
+    delays = {
+        "/dev/ot_module_sim_tempdeck0": 0.05,
+        "/dev/ot_module_sim_magdeck1": 0,
+        "/dev/ot_module_sim_thermocycler2": 0.5,
+        "/dev/ot_module_sim_tempdeck4": 0.01,
+    }
+    cleaned_up = []
+
+    async def fake_build(port, **kwargs):
+        if port not in delays:
+            raise RuntimeError("could not connect")
+        await asyncio.sleep(delays[port])
+        module = await original_build(port=port, **kwargs)
+        original_cleanup = module.cleanup
+
+        async def cleanup():
+            cleaned_up.append(module.port)
+            await original_cleanup()
+
+        monkeypatch.setattr(module, "cleanup", cleanup)
+        return module
+
+    monkeypatch.setattr(module_control, "MODULE_BUILD_TIMEOUT_SEC", 0.2)
+    monkeypatch.setattr(controls, "build_module", fake_build)
+    new_mods = [
+        ModuleAtPort(port="/dev/ot_module_sim_tempdeck0", name="tempdeck"),
+        ModuleAtPort(port="/dev/ot_module_sim_magdeck1", name="magdeck"),
+        ModuleAtPort(port="/dev/ot_module_sim_thermocycler2", name="thermocycler"),
+        ModuleAtPort(port="/dev/ot_module_sim_magdeck3", name="magdeck"),
+        ModuleAtPort(port="/dev/ot_module_sim_tempdeck4", name="tempdeck"),
+    ]
+
+    # the first module that could not be built, in port order, is reported
+    with pytest.raises(asyncio.TimeoutError):
+        await controls.register_modules(new_mods_at_ports=new_mods)
+
+    assert [mod.port for mod in api.attached_modules] == [
+        "/dev/ot_module_sim_tempdeck0",
+        "/dev/ot_module_sim_magdeck1",
+        "/dev/ot_module_sim_tempdeck4",
+    ]
+
+    # the module that timed out is cleaned up once its build finishes
+    assert len(controls._abandoned_builds) == 1
+    await asyncio.sleep(0.5)
+    assert cleaned_up == ["/dev/ot_module_sim_thermocycler2"]
+    assert not controls._abandoned_builds
+
+
+async def test_clean_up_abandoned_module_builds(monkeypatch):
+    import opentrons.hardware_control as hardware_control
+    from opentrons.hardware_control import module_control
+
+    api = await hardware_control.API.build_hardware_simulator()
+    controls = api._backend.module_controls
+
+    async def fake_build(port, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(module_control, "MODULE_BUILD_TIMEOUT_SEC", 0.01)
+    monkeypatch.setattr(controls, "build_module", fake_build)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await controls.register_modules(
+            new_mods_at_ports=[
+                ModuleAtPort(port="/dev/ot_module_sim_tempdeck0", name="tempdeck")
+            ]
+        )
+    (cleanup,) = controls._abandoned_builds
+
+    api.clean_up()
+    await asyncio.wait([cleanup], timeout=1)
+    assert cleanup.cancelled()
+    assert not controls._abandoned_builds
+
+
 async def test_module_update_integration(monkeypatch, loop):
     from opentrons.hardware_control import modules
 
@@ -145,3 +145,29 @@ def test_flow_rate_setting():
     assert pip.dispense_flow_rate == 3
     assert pip.blow_out_flow_rate == 4
     assert pip.config is config
+
+
+def test_version_tracking():
+    pip = pipette.Pipette(pipette_config.load("p300_single_v2.0"), PIP_CAL, "testId")
+    versions = [pip.version]
+
+    def changed():
+        versions.append(pip.version)
+        return versions[-1] != versions[-2]
+
+    assert not changed()
+    pip.add_tip(25.0)
+    assert changed()
+    pip.ready_to_aspirate = True
+    assert changed()
+    pip.add_current_volume(10)
+    assert changed()
+    pip.aspirate_flow_rate = 2
+    assert changed()
+    pip.update_config_item("top", 19.5)
+    assert changed()
+    # reading state doesn't change it
+    pip.has_tip, pip.current_volume, pip.available_volume
+    assert not changed()
+    pip.remove_tip()
+    assert changed()
@@ -1,5 +1,14 @@
+import asyncio
+from typing import List
+
 from mock import AsyncMock, MagicMock
-from opentrons.hardware_control.poller import Poller, Listener, Reader
+from opentrons.hardware_control.poller import (
+    Poller,
+    PollScheduler,
+    Listener,
+    Reader,
+    WaitableListener,
+)
 
 
 async def test_poll_error() -> None:
@@ -31,3 +40,124 @@ async def test_notify() -> None:
 
     listener.on_poll.assert_called_once_with(23)
     listener.on_terminated.assert_called_once()
+
+
+class _IdleListener(WaitableListener[int]):
+    """A listener that only wants fast polls when waited on."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.polls: List[int] = []
+
+    def on_poll(self, result: int) -> None:
+        self.polls.append(result)
+        super().on_poll(result)
+
+
+async def test_idle_interval() -> None:
+    """It should poll at the idle interval unless someone is waiting."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 1
+    listener = _IdleListener()
+
+    p: Poller[int] = Poller(
+        interval_seconds=0.01,
+        idle_interval_seconds=10,
+        reader=reader,
+        listener=listener,
+    )
+    await asyncio.sleep(0.1)
+    assert len(listener.polls) == 1
+
+    assert await asyncio.wait_for(listener.wait_next_poll(), timeout=0.5) == 1
+    assert len(listener.polls) == 2
+
+    await p.stop_and_wait()
+
+
+async def test_shared_scheduler(loop: asyncio.AbstractEventLoop) -> None:
+    """It should drive all pollers on a loop from one scheduler."""
+    readers = [AsyncMock(spec=Reader), AsyncMock(spec=Reader)]
+    listeners = [MagicMock(spec=Listener), MagicMock(spec=Listener)]
+    pollers: List[Poller[int]] = [
+        Poller(interval_seconds=0.01, reader=reader, listener=listener)
+        for reader, listener in zip(readers, listeners)
+    ]
+    assert (
+        pollers[0]._scheduler is pollers[1]._scheduler is PollScheduler.for_loop(loop)
+    )
+
+    async def polled_again() -> None:
+        while any(reader.read.call_count < 2 for reader in readers):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(polled_again(), timeout=1)
+
+    await pollers[0].stop_and_wait()
+    count = readers[0].read.call_count
+    await asyncio.sleep(0.05)
+    assert readers[0].read.call_count == count
+    listeners[0].on_terminated.assert_called_once()
+
+    await pollers[1].stop_and_wait()
+    listeners[1].on_terminated.assert_called_once()
+
+
+async def test_first_poll_and_scheduler_cleanup(
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """It should poll straight away and drop the scheduler once unused."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 1
+    listener = MagicMock(spec=Listener)
+
+    p: Poller[int] = Poller(
+        interval_seconds=10, reader=reader, listener=listener, loop=loop
+    )
+    await asyncio.wait_for(p.wait_first_poll(), timeout=0.5)
+    listener.on_poll.assert_called_once_with(1)
+    assert PollScheduler._schedulers[loop] is p._scheduler
+
+    await p.stop_and_wait()
+    await asyncio.sleep(0)
+    assert loop not in PollScheduler._schedulers
+
+
+async def test_close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """It should cancel the polls and drop the scheduler of a closed loop."""
+
+    async def read() -> int:
+        await asyncio.sleep(10)
+        return 1
+
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = read
+    listener = MagicMock(spec=Listener)
+
+    p: Poller[int] = Poller(
+        interval_seconds=0.01, reader=reader, listener=listener, loop=loop
+    )
+    scheduler = p._scheduler
+    await asyncio.sleep(0)
+    (poll_task,) = scheduler._poll_tasks
+
+    PollScheduler.close_loop(loop)
+    assert loop not in PollScheduler._schedulers
+    await asyncio.wait([poll_task], timeout=0.5)
+    assert poll_task.cancelled()
+    assert not scheduler._poll_tasks
+
+
+def test_scheduler_of_closed_loop_dropped() -> None:
+    """It should drop the scheduler of a loop that was closed while polling."""
+    closed_loop = asyncio.new_event_loop()
+    scheduler = PollScheduler.for_loop(closed_loop)
+    closed_loop.close()
+
+    other_loop = asyncio.new_event_loop()
+    try:
+        assert PollScheduler.for_loop(other_loop) is not scheduler
+        assert closed_loop not in PollScheduler._schedulers
+    finally:
+        PollScheduler.close_loop(other_loop)
+        other_loop.close()
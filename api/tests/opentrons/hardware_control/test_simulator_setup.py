@@ -40,6 +40,8 @@ async def test_with_thermocycler(loop):
     simulator = await simulator_setup.create_simulator(setup)
 
     assert type(simulator.attached_modules[0]) == Thermocycler
+    # The plate status is only updated by the poller
+    await simulator.attached_modules[0].wait_next_poll()
     assert simulator.attached_modules[0].live_data == {
         "data": {
             "currentCycleIndex": None,
@@ -69,3 +69,12 @@ async def test_module_cache_remove_entry():
     future.result()
     mods_after = thread_manager.attached_modules
     assert len(mods_after) == 1
+
+
+async def test_bridged_methods_reused():
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    assert thread_manager.home is thread_manager.home
+    home = thread_manager.home
+    await home()
+    assert thread_manager.home is home
+    thread_manager.clean_up()
@@ -0,0 +1,125 @@
+import pytest
+
+from opentrons.config import robot_configs
+from opentrons.drivers.types import MoveSplit
+from opentrons.hardware_control import API
+from opentrons.hardware_control.time_estimator import (
+    RampRate,
+    TimeEstimator,
+    trapezoid_time,
+)
+from opentrons.types import Mount
+
+HOME = {"X": 0.0, "Y": 0.0, "Z": 0.0, "A": 0.0, "B": 0.0, "C": 0.0}
+
+
+@pytest.fixture
+def estimator():
+    return TimeEstimator(robot_configs.build_config({}))
+
+
+def test_trapezoid_time():
+    # long enough to reach cruising speed: 1 s to accelerate and decelerate
+    assert trapezoid_time(300, 100, 100) == pytest.approx(4.0)
+    # too short to reach cruising speed
+    assert trapezoid_time(25, 100, 100) == pytest.approx(1.0)
+    assert trapezoid_time(0, 100, 100) == 0
+
+
+def test_move_limited_by_axis(estimator):
+    # Z is limited to 125 mm/s and 1500 mm/s^2 by the default config
+    duration = estimator.move(HOME, {"Z": 100.0}, speed=400)
+    assert duration == pytest.approx(trapezoid_time(100, 125, 1500))
+    assert estimator.elapsed == duration
+
+    # axis max speeds lower the limit further
+    duration = estimator.move(
+        {**HOME, "Z": 100.0}, {"Z": 0.0}, axis_max_speeds={"Z": 50}
+    )
+    assert duration == pytest.approx(trapezoid_time(100, 50, 1500))
+
+
+def test_move_coordinates_gantry(estimator):
+    # a diagonal move is scaled so that neither axis exceeds its limits
+    duration = estimator.move(HOME, {"X": 300.0, "Y": 400.0}, speed=1000)
+    assert duration == pytest.approx(trapezoid_time(500, 500, 2500))
+    # a plunger moving along with the gantry is not bound by its feed
+    assert estimator.move(
+        {**HOME, "X": 300.0, "Y": 400.0}, {"X": 0.0, "Y": 0.0, "B": 1.0}, speed=1000
+    ) == pytest.approx(duration)
+
+
+def test_move_ignores_still_axes(estimator):
+    assert estimator.move(HOME, dict(HOME), speed=10) == 0
+    assert estimator.elapsed == 0
+
+
+def test_plunger_speed(estimator):
+    duration = estimator.move(HOME, {"B": 10.0}, speed=5)
+    assert duration == pytest.approx(trapezoid_time(10, 5, 200))
+
+
+def test_move_splits(estimator):
+    estimator.configure_splits_for(
+        {
+            "B": MoveSplit(
+                split_distance=1,
+                split_current=1.75,
+                split_speed=1,
+                after_time=60,
+                fullstep=True,
+            )
+        }
+    )
+    # the first mm of a move after being still is at the split speed
+    expected = trapezoid_time(1, 1, 200) + trapezoid_time(9, 5, 200)
+    assert estimator.move(HOME, {"B": 10.0}, speed=5) == pytest.approx(expected)
+    # not once the axis has moved recently
+    start = {**HOME, "B": 10.0}
+    assert estimator.move(start, {"B": 0.0}, speed=5) == pytest.approx(
+        trapezoid_time(10, 5, 200)
+    )
+    # but again after being still for long enough
+    estimator.wait(61)
+    assert estimator.move(HOME, {"B": 10.0}, speed=5) == pytest.approx(expected)
+
+
+def test_ramp_rate():
+    rate = RampRate(heating=2.0, cooling=0.5)
+    assert rate.seconds(20, 60) == 20
+    assert rate.seconds(60, 20) == 80
+    assert rate.seconds(20, 60, max_rate=1.0) == 40
+    assert rate.seconds(None, 60) == 0
+    assert rate.seconds(20, None) == 0
+
+
+def test_wait_until(estimator):
+    estimator.wait(10)
+    assert estimator.wait_until(25) == 15
+    assert estimator.wait_until(20) == 0
+    assert estimator.elapsed == 25
+
+
+async def test_simulator_estimates(loop):
+    hardware = await API.build_hardware_simulator(
+        attached_instruments={Mount.LEFT: {"model": "p300_single_v2.0", "id": "testy"}},
+        loop=loop,
+    )
+    estimator = hardware.time_estimator
+    await hardware.home()
+    await hardware.cache_instruments()
+
+    homed_at = estimator.elapsed
+    await hardware.delay(30)
+    assert estimator.elapsed == homed_at + 30
+
+    await hardware.pick_up_tip(Mount.LEFT, 20.0)
+    await hardware.prepare_for_aspirate(Mount.LEFT)
+    before_aspirate = estimator.elapsed
+    await hardware.aspirate(Mount.LEFT, 100, rate=1.0)
+    slow = estimator.elapsed - before_aspirate
+    await hardware.dispense(Mount.LEFT)
+    before_aspirate = estimator.elapsed
+    await hardware.aspirate(Mount.LEFT, 100, rate=2.0)
+    fast = estimator.elapsed - before_aspirate
+    assert 0 < fast < slow
@@ -463,7 +463,7 @@ def test_aspirate(ctx, get_labware_def, monkeypatch):
     )
     fake_move.reset_mock()
     hardware = ctx._implementation.get_hardware().hardware
-    hardware._obj_to_adapt._attached_instruments[Mount.RIGHT]._current_volume = 1
+    hardware._obj_to_adapt._attached_instruments[Mount.RIGHT].set_current_volume(1)
 
     instr.aspirate(2.0)
     fake_move.assert_not_called()
@@ -129,7 +129,7 @@ def test_aspirate(set_up_paired_instrument, monkeypatch, ctx):
     )
     fake_move.reset_mock()
     hardware = ctx._implementation.get_hardware().hardware
-    hardware._obj_to_adapt._attached_instruments[Mount.RIGHT]._current_volume = 1
+    hardware._obj_to_adapt._attached_instruments[Mount.RIGHT].set_current_volume(1)
 
     paired.aspirate(2.0)
     fake_move.assert_not_called()
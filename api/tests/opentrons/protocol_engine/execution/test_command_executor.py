@@ -200,6 +200,7 @@ async def test_execute(
             completedAt=datetime(year=2023, month=3, day=3),
             result=command_result,
             error=None,
+            estimatedDuration=None,
         )
     ).then_return(completed_command)
 
@@ -309,6 +310,7 @@ async def test_execute_raises_protocol_engine_error(
             completedAt=datetime(year=2023, month=3, day=3),
             result=None,
             error="oh no",
+            estimatedDuration=None,
         )
     ).then_return(failed_command)
 
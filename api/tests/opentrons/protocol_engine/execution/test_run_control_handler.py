@@ -2,7 +2,7 @@
 import pytest
 from decoy import Decoy
 
-from opentrons.protocol_engine.state import StateStore, PauseAction
+from opentrons.protocol_engine.state import StateStore, StateKey, PauseAction
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 
 
@@ -26,5 +26,8 @@ async def test_pause(
 
     decoy.verify(
         state_store.handle_action(PauseAction()),
-        await state_store.wait_for(condition=state_store.commands.get_is_running),
+        await state_store.wait_for(
+            condition=state_store.commands.get_is_running,
+            depends_on=[StateKey.COMMANDS],
+        ),
     )
@@ -54,3 +54,27 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_keyed_subscribers() -> None:
+    """Test that keyed subscribers are only woken by relevant notifications."""
+    subject = ChangeNotifier()
+    foo_result = asyncio.create_task(subject.wait(keys=["foo"]))
+    bar_result = asyncio.create_task(subject.wait(keys=["bar", "baz"]))
+    any_result = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    assert subject.notify(keys=["baz"]) == 2
+    await asyncio.gather(bar_result, any_result)
+    assert foo_result.done() is False
+    assert subject.last_wakeup_count == 2
+
+    assert subject.notify(keys=["qux"]) == 0
+    await asyncio.sleep(0)
+    assert foo_result.done() is False
+
+    assert subject.notify() == 1
+    await foo_result
+
+    assert subject.notify_count == 3
+    assert subject.total_wakeup_count == 3
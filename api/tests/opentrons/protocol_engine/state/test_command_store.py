@@ -1,10 +1,19 @@
 """Tests for the command lifecycle state."""
-from collections import OrderedDict
+import pytest
 
-from opentrons.protocol_engine.state.commands import CommandState, CommandStore
+from opentrons.protocol_engine import EngineStatus
+from opentrons.protocol_engine.commands import CommandStatus
+from opentrons.protocol_engine.errors import CommandDoesNotExistError
+from opentrons.protocol_engine.state.commands import (
+    CommandEntry,
+    CommandState,
+    CommandStore,
+    CommandView,
+)
 
 from opentrons.protocol_engine.state.actions import (
     UpdateCommandAction,
+    UpdateCommandsAction,
     PlayAction,
     PauseAction,
     StopAction,
@@ -14,6 +23,7 @@ from .command_fixtures import (
     create_pending_command,
     create_running_command,
     create_completed_command,
+    create_failed_command,
 )
 
 
@@ -27,7 +37,18 @@ def test_command_store_handles_command() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=False,
-        commands_by_id=OrderedDict({"command-id": command}),
+        all_command_ids=["command-id"],
+        command_count=1,
+        command_updates=["command-id"],
+        revision=1,
+        command_versions={
+            "command-id": [CommandEntry(index=0, command=command, revision=0)]
+        },
+        queued_command_ids=["command-id"],
+        queue_start=0,
+        queue_end=1,
+        status_counts={CommandStatus.QUEUED: 1},
+        first_failed_command_id=None,
     )
 
 
@@ -45,25 +66,162 @@ def test_command_store_preserves_handle_order() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=False,
-        commands_by_id=OrderedDict(
-            [
-                ("command-id-1", command_a),
-                ("command-id-2", command_b),
-            ]
-        ),
+        all_command_ids=["command-id-1", "command-id-2"],
+        command_count=2,
+        command_updates=["command-id-1", "command-id-2"],
+        revision=2,
+        command_versions={
+            "command-id-1": [CommandEntry(index=0, command=command_a, revision=0)],
+            "command-id-2": [CommandEntry(index=1, command=command_b, revision=1)],
+        },
+        queued_command_ids=["command-id-1"],
+        queue_start=0,
+        queue_end=1,
+        status_counts={CommandStatus.QUEUED: 1, CommandStatus.RUNNING: 1},
+        first_failed_command_id=None,
     )
 
     subject.handle_action(UpdateCommandAction(command=command_c))
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=False,
-        commands_by_id=OrderedDict(
-            [
-                ("command-id-1", command_c),
-                ("command-id-2", command_b),
-            ]
-        ),
+        all_command_ids=["command-id-1", "command-id-2"],
+        command_count=2,
+        command_updates=["command-id-1", "command-id-2", "command-id-1"],
+        revision=3,
+        command_versions={
+            "command-id-1": [
+                CommandEntry(index=0, command=command_a, revision=0),
+                CommandEntry(index=0, command=command_c, revision=2),
+            ],
+            "command-id-2": [CommandEntry(index=1, command=command_b, revision=1)],
+        },
+        queued_command_ids=["command-id-1"],
+        queue_start=1,
+        queue_end=1,
+        status_counts={
+            CommandStatus.QUEUED: 0,
+            CommandStatus.RUNNING: 1,
+            CommandStatus.SUCCEEDED: 1,
+        },
+        first_failed_command_id=None,
+    )
+
+
+def test_command_store_handles_batch_update() -> None:
+    """It should handle a batch of commands the same as individual updates."""
+    command_a = create_pending_command(command_id="command-id-1")
+    command_b = create_pending_command(command_id="command-id-2")
+    command_c = create_running_command(command_id="command-id-1")
+
+    batch_subject = CommandStore()
+    batch_subject.handle_action(
+        UpdateCommandsAction(commands=[command_a, command_b, command_c])
+    )
+
+    single_subject = CommandStore()
+    for command in (command_a, command_b, command_c):
+        single_subject.handle_action(UpdateCommandAction(command=command))
+
+    assert batch_subject.state == single_subject.state
+    assert batch_subject.state.all_command_ids == ["command-id-1", "command-id-2"]
+
+
+def test_command_store_tracks_queue_and_failures() -> None:
+    """It should keep the queue cursor and first failed command up to date."""
+    command_1 = create_pending_command(command_id="command-id-1")
+    command_2 = create_pending_command(command_id="command-id-2")
+    command_3 = create_pending_command(command_id="command-id-3")
+
+    subject = CommandStore()
+
+    for command in (command_1, command_2, command_3):
+        subject.handle_action(UpdateCommandAction(command=command))
+
+    assert subject.state.queued_command_ids == [
+        "command-id-1",
+        "command-id-2",
+        "command-id-3",
+    ]
+    assert subject.state.queue_start == 0
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_failed_command(command_id="command-id-3"))
+    )
+    assert subject.state.queue_start == 1
+    assert subject.state.queued_command_ids[subject.state.queue_start] == "command-id-2"
+    assert subject.state.first_failed_command_id == "command-id-3"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_failed_command(command_id="command-id-1"))
+    )
+    assert subject.state.first_failed_command_id == "command-id-1"
+    assert subject.state.status_counts == {
+        CommandStatus.QUEUED: 1,
+        CommandStatus.RUNNING: 0,
+        CommandStatus.FAILED: 2,
+    }
+
+
+def test_command_store_shares_log_between_snapshots() -> None:
+    """It should append to a shared command log rather than copying it."""
+    command_a = create_pending_command(command_id="command-id-1")
+    command_b = create_failed_command(command_id="command-id-1")
+    command_c = create_pending_command(command_id="command-id-2")
+
+    subject = CommandStore()
+    subject.handle_action(UpdateCommandAction(command=command_a))
+    state_before = subject.state
+
+    subject.handle_action(PlayAction())
+    subject.handle_action(UpdateCommandsAction(commands=[command_b, command_c]))
+    state_after = subject.state
+
+    assert state_before is not state_after
+    assert state_after.all_command_ids is state_before.all_command_ids
+    assert state_after.command_updates is state_before.command_updates
+    assert state_after.command_versions is state_before.command_versions
+    assert state_after.queued_command_ids is state_before.queued_command_ids
+
+    view_before = CommandView(state_before)
+    assert view_before.get_all() == [command_a]
+    assert view_before.get_next_queued() is None
+    assert view_before.get_status() == EngineStatus.READY_TO_RUN
+    assert view_before.get_slice(since=0).revision == 1
+    with pytest.raises(CommandDoesNotExistError):
+        view_before.get("command-id-2")
+
+    view_after = CommandView(state_after)
+    assert view_after.get_all() == [command_b, command_c]
+    assert view_after.get_status() == EngineStatus.FAILED
+
+
+def test_command_store_keeps_queue_order() -> None:
+    """It should keep queued commands in the order they were queued."""
+    subject = CommandStore()
+    subject.handle_action(PlayAction())
+
+    for command_id in ("command-id-1", "command-id-2"):
+        subject.handle_action(
+            UpdateCommandAction(command=create_pending_command(command_id=command_id))
+        )
+    assert CommandView(subject.state).get_next_queued() == "command-id-1"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_pending_command(command_id="command-id-1"))
+    )
+    assert CommandView(subject.state).get_next_queued() == "command-id-2"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-2"))
     )
+    assert CommandView(subject.state).get_next_queued() == "command-id-1"
 
 
 def test_command_store_handles_play_action() -> None:
@@ -74,7 +232,16 @@ def test_command_store_handles_play_action() -> None:
     assert subject.state == CommandState(
         is_running=True,
         stop_requested=False,
-        commands_by_id=OrderedDict(),
+        all_command_ids=[],
+        command_count=0,
+        command_updates=[],
+        revision=0,
+        command_versions={},
+        queued_command_ids=[],
+        queue_start=0,
+        queue_end=0,
+        status_counts={},
+        first_failed_command_id=None,
     )
 
 
@@ -86,7 +253,16 @@ def test_command_store_handles_pause_action() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=False,
-        commands_by_id=OrderedDict(),
+        all_command_ids=[],
+        command_count=0,
+        command_updates=[],
+        revision=0,
+        command_versions={},
+        queued_command_ids=[],
+        queue_start=0,
+        queue_end=0,
+        status_counts={},
+        first_failed_command_id=None,
     )
 
 
@@ -100,7 +276,16 @@ def test_command_store_handles_stop_action() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        all_command_ids=[],
+        command_count=0,
+        command_updates=[],
+        revision=0,
+        command_versions={},
+        queued_command_ids=[],
+        queue_start=0,
+        queue_end=0,
+        status_counts={},
+        first_failed_command_id=None,
     )
 
 
@@ -113,5 +298,14 @@ def test_command_store_cannot_restart_after_stop() -> None:
     assert subject.state == CommandState(
         is_running=False,
         stop_requested=True,
-        commands_by_id=OrderedDict(),
+        all_command_ids=[],
+        command_count=0,
+        command_updates=[],
+        revision=0,
+        command_versions={},
+        queued_command_ids=[],
+        queue_start=0,
+        queue_end=0,
+        status_counts={},
+        first_failed_command_id=None,
     )
@@ -1,11 +1,16 @@
 """Labware state store tests."""
 import pytest
-from collections import OrderedDict
+from collections import Counter
 from contextlib import nullcontext as does_not_raise
-from typing import List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
 from opentrons.protocol_engine import EngineStatus, commands as cmd, errors
-from opentrons.protocol_engine.state.commands import CommandState, CommandView
+from opentrons.protocol_engine.state.commands import (
+    CommandEntry,
+    CommandSlice,
+    CommandState,
+    CommandView,
+)
 from opentrons.protocol_engine.state.actions import PlayAction, PauseAction
 
 from .command_fixtures import (
@@ -22,10 +27,40 @@ def get_command_view(
     commands_by_id: Sequence[Tuple[str, cmd.Command]] = (),
 ) -> CommandView:
     """Get a command view test subject."""
+    all_command_ids: List[str] = []
+    command_versions: Dict[str, List[CommandEntry]] = {}
+
+    for revision, (command_id, command) in enumerate(commands_by_id):
+        if command_id not in command_versions:
+            all_command_ids.append(command_id)
+        index = all_command_ids.index(command_id)
+        command_versions.setdefault(command_id, []).append(
+            CommandEntry(index=index, command=command, revision=revision)
+        )
+
+    all_entries = [(i, command_versions[i][-1].command) for i in all_command_ids]
+    status_counts = Counter(command.status for _, command in all_entries)
+    queued_command_ids = [
+        i for i, command in all_entries if command.status == cmd.CommandStatus.QUEUED
+    ]
+    first_failed_command_id = next(
+        (i for i, command in all_entries if command.status == cmd.CommandStatus.FAILED),
+        None,
+    )
+
     state = CommandState(
         is_running=is_running,
         stop_requested=stop_requested,
-        commands_by_id=OrderedDict(commands_by_id),
+        all_command_ids=all_command_ids,
+        command_count=len(all_command_ids),
+        command_updates=[command_id for command_id, _ in commands_by_id],
+        revision=len(commands_by_id),
+        command_versions=command_versions,
+        queued_command_ids=queued_command_ids,
+        queue_start=0,
+        queue_end=len(queued_command_ids),
+        status_counts=dict(status_counts),
+        first_failed_command_id=first_failed_command_id,
     )
 
     return CommandView(state=state)
@@ -65,6 +100,67 @@ def test_get_all() -> None:
     assert subject.get_all() == [command_1, command_2, command_3]
 
 
+def test_get_slice() -> None:
+    """It should get a window of the command log."""
+    command_1 = create_completed_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_pending_command(command_id="command-id-3")
+
+    subject = get_command_view(
+        commands_by_id=[
+            ("command-id-1", command_1),
+            ("command-id-2", command_2),
+            ("command-id-3", command_3),
+        ]
+    )
+
+    assert subject.get_slice() == CommandSlice(
+        commands=[command_1, command_2, command_3],
+        cursor=0,
+        total_length=3,
+        revision=3,
+    )
+    assert subject.get_slice(cursor=1, length=1) == CommandSlice(
+        commands=[command_2],
+        cursor=1,
+        total_length=3,
+        revision=3,
+    )
+    assert subject.get_slice(cursor=2, length=5).commands == [command_3]
+    assert subject.get_slice(cursor=3).commands == []
+
+
+def test_get_slice_since() -> None:
+    """It should only get commands updated since a revision of the log."""
+    command_1 = create_pending_command(command_id="command-id-1")
+    command_2 = create_pending_command(command_id="command-id-2")
+    command_3 = create_pending_command(command_id="command-id-3")
+    running_command_1 = create_running_command(command_id="command-id-1")
+    completed_command_1 = create_completed_command(command_id="command-id-1")
+
+    subject = get_command_view(
+        commands_by_id=[
+            ("command-id-1", command_1),
+            ("command-id-2", command_2),
+            ("command-id-3", command_3),
+            ("command-id-1", running_command_1),
+            ("command-id-3", create_running_command(command_id="command-id-3")),
+            ("command-id-1", completed_command_1),
+        ]
+    )
+
+    result = subject.get_slice(since=3)
+    assert result.revision == 6
+    assert result.total_length == 3
+    assert [c.id for c in result.commands] == ["command-id-1", "command-id-3"]
+    assert result.commands[0] == completed_command_1
+
+    assert subject.get_slice(since=4, cursor=0, length=2).commands == [
+        completed_command_1
+    ]
+    assert subject.get_slice(since=6).commands == []
+
+
 def test_get_next_queued_returns_first_pending() -> None:
     """It should return the first command that's pending."""
     pending_command = create_pending_command()
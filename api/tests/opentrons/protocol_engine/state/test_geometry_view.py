@@ -126,66 +126,13 @@ def test_get_labware_highest_z(
 
 def test_get_all_labware_highest_z(
     decoy: Decoy,
-    standard_deck_def: DeckDefinitionV2,
-    well_plate_def: LabwareDefinition,
-    reservoir_def: LabwareDefinition,
     labware_view: LabwareView,
     subject: GeometryView,
 ) -> None:
-    """It should get the highest Z amongst all labware."""
-    plate_data = LabwareData(
-        uri=uri_from_details(
-            namespace=well_plate_def.namespace,
-            load_name=well_plate_def.parameters.loadName,
-            version=well_plate_def.version,
-        ),
-        location=DeckSlotLocation(slot=DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3),
-    )
-    reservoir_data = LabwareData(
-        uri=uri_from_details(
-            namespace=reservoir_def.namespace,
-            load_name=reservoir_def.parameters.loadName,
-            version=reservoir_def.version,
-        ),
-        location=DeckSlotLocation(slot=DeckSlotName.SLOT_4),
-        calibration=(1, -2, 3),
-    )
-
-    decoy.when(labware_view.get_labware_data_by_id("plate-id")).then_return(plate_data)
-
-    decoy.when(labware_view.get_labware_data_by_id("reservoir-id")).then_return(
-        reservoir_data
-    )
+    """It should get the highest Z amongst all labware from the labware index."""
+    decoy.when(labware_view.get_all_labware_highest_z()).then_return(42.0)
 
-    decoy.when(labware_view.get_definition_by_uri(plate_data.uri)).then_return(
-        well_plate_def
-    )
-
-    decoy.when(labware_view.get_definition_by_uri(reservoir_data.uri)).then_return(
-        reservoir_def
-    )
-
-    decoy.when(labware_view.get_all_labware()).then_return(
-        [
-            ("plate-id", plate_data),
-            ("reservoir-id", reservoir_data),
-        ]
-    )
-
-    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
-        Point(1, 2, 3)
-    )
-
-    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_4)).then_return(
-        Point(4, 5, 6)
-    )
-
-    plate_z = subject.get_labware_highest_z("plate-id")
-    reservoir_z = subject.get_labware_highest_z("reservoir-id")
-    all_z = subject.get_all_labware_highest_z()
-
-    assert all_z == max(plate_z, reservoir_z)
+    assert subject.get_all_labware_highest_z() == 42.0
 
 
 def test_get_labware_position(
@@ -234,39 +181,18 @@ def test_get_well_position(
     subject: GeometryView,
 ) -> None:
     """It should be able to get the position of a well top in a labware."""
-    labware_data = LabwareData(
-        uri=uri_from_details(
-            namespace=well_plate_def.namespace,
-            load_name=well_plate_def.parameters.loadName,
-            version=well_plate_def.version,
-        ),
-        location=DeckSlotLocation(slot=DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3),
-    )
     well_def = well_plate_def.wells["B2"]
-    slot_pos = Point(4, 5, 6)
+    well_bottom = Point(4, 5, 6)
 
-    decoy.when(labware_view.get_definition_by_uri(labware_data.uri)).then_return(
-        well_plate_def
-    )
-
-    decoy.when(labware_view.get_labware_data_by_id("plate-id")).then_return(
-        labware_data
+    decoy.when(labware_view.get_well_bottom_position("plate-id", "B2")).then_return(
+        well_bottom
     )
 
     decoy.when(labware_view.get_well_definition("plate-id", "B2")).then_return(well_def)
 
-    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
-        slot_pos
-    )
-
     point = subject.get_well_position("plate-id", "B2")
 
-    assert point == Point(
-        x=slot_pos[0] + 1 + well_def.x,
-        y=slot_pos[1] - 2 + well_def.y,
-        z=slot_pos[2] + 3 + well_def.z + well_def.depth,
-    )
+    assert point == Point(x=4, y=5, z=6 + well_def.depth)
 
 
 def test_get_well_position_with_top_offset(
@@ -277,41 +203,20 @@ def test_get_well_position_with_top_offset(
     subject: GeometryView,
 ) -> None:
     """It should be able to get the position of a well top in a labware."""
-    labware_data = LabwareData(
-        uri=uri_from_details(
-            namespace=well_plate_def.namespace,
-            load_name=well_plate_def.parameters.loadName,
-            version=well_plate_def.version,
-        ),
-        location=DeckSlotLocation(slot=DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3),
-    )
     well_def = well_plate_def.wells["B2"]
-    slot_pos = Point(4, 5, 6)
+    well_bottom = Point(4, 5, 6)
 
-    decoy.when(labware_view.get_definition_by_uri(labware_data.uri)).then_return(
-        well_plate_def
-    )
-
-    decoy.when(labware_view.get_labware_data_by_id("plate-id")).then_return(
-        labware_data
+    decoy.when(labware_view.get_well_bottom_position("plate-id", "B2")).then_return(
+        well_bottom
     )
 
     decoy.when(labware_view.get_well_definition("plate-id", "B2")).then_return(well_def)
 
-    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
-        slot_pos
-    )
-
     point = subject.get_well_position(
         "plate-id", "B2", WellLocation(origin=WellOrigin.TOP, offset=(1, 2, 3))
     )
 
-    assert point == Point(
-        x=slot_pos[0] + 1 + well_def.x + 1,
-        y=slot_pos[1] - 2 + well_def.y + 2,
-        z=slot_pos[2] + 3 + well_def.z + well_def.depth + 3,
-    )
+    assert point == Point(x=4 + 1, y=5 + 2, z=6 + well_def.depth + 3)
 
 
 def test_get_well_position_with_bottom_offset(
@@ -322,41 +227,20 @@ def test_get_well_position_with_bottom_offset(
     subject: GeometryView,
 ) -> None:
     """It should be able to get the position of a well top in a labware."""
-    labware_data = LabwareData(
-        uri=uri_from_details(
-            namespace=well_plate_def.namespace,
-            load_name=well_plate_def.parameters.loadName,
-            version=well_plate_def.version,
-        ),
-        location=DeckSlotLocation(slot=DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3),
-    )
     well_def = well_plate_def.wells["B2"]
-    slot_pos = Point(4, 5, 6)
-
-    decoy.when(labware_view.get_definition_by_uri(labware_data.uri)).then_return(
-        well_plate_def
-    )
+    well_bottom = Point(4, 5, 6)
 
-    decoy.when(labware_view.get_labware_data_by_id("plate-id")).then_return(
-        labware_data
+    decoy.when(labware_view.get_well_bottom_position("plate-id", "B2")).then_return(
+        well_bottom
     )
 
     decoy.when(labware_view.get_well_definition("plate-id", "B2")).then_return(well_def)
 
-    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
-        slot_pos
-    )
-
     point = subject.get_well_position(
         "plate-id", "B2", WellLocation(origin=WellOrigin.BOTTOM, offset=(3, 2, 1))
     )
 
-    assert point == Point(
-        x=slot_pos[0] + 1 + well_def.x + 3,
-        y=slot_pos[1] - 2 + well_def.y + 2,
-        z=slot_pos[2] + 3 + well_def.z + 1,
-    )
+    assert point == Point(x=4 + 3, y=5 + 2, z=6 + 1)
 
 
 def test_get_effective_tip_length(
@@ -4,14 +4,13 @@ import pytest
 from opentrons.calibration_storage.helpers import uri_from_details
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.types import DeckSlotName
+from opentrons.types import DeckSlotName, Point
 
 from opentrons.protocol_engine.resources import DeckFixedLabware
 from opentrons.protocol_engine.types import DeckSlotLocation
 from opentrons.protocol_engine.state.actions import UpdateCommandAction
 from opentrons.protocol_engine.state.labware import (
     LabwareStore,
-    LabwareState,
     LabwareData,
 )
 
@@ -48,18 +47,36 @@ def test_initial_state(
         load_name=fixed_trash_def.parameters.loadName,
     )
 
+    slot_def = standard_deck_def["locations"]["orderedSlots"][11]
+    slot_pos = slot_def["position"]
+    trash_offset = fixed_trash_def.cornerOffsetFromSlot
+    trash_well = fixed_trash_def.wells["A1"]
+
     # TODO(mc, 2021-06-02): usage of ._state over .state is temporary
     # until store.state returns the state instead of a state view
-    assert subject._state == LabwareState(
-        deck_definition=standard_deck_def,
-        labware_by_id={
-            "fixedTrash": LabwareData(
-                location=DeckSlotLocation(slot=DeckSlotName.FIXED_TRASH),
-                uri=expected_trash_uri,
-                calibration=(0, 0, 0),
-            )
-        },
-        labware_definitions_by_uri={expected_trash_uri: fixed_trash_def},
+    assert subject._state.deck_definition == standard_deck_def
+    assert subject._state.labware_by_id == {
+        "fixedTrash": LabwareData(
+            location=DeckSlotLocation(slot=DeckSlotName.FIXED_TRASH),
+            uri=expected_trash_uri,
+            calibration=(0, 0, 0),
+        )
+    }
+    assert subject._state.labware_definitions_by_uri == {
+        expected_trash_uri: fixed_trash_def
+    }
+    assert subject._state.slot_definitions_by_name[DeckSlotName.FIXED_TRASH] == (
+        slot_def
+    )
+    trash_positions = subject._state.well_positions_by_labware_id["fixedTrash"]
+    assert trash_positions.names == ["A1"]
+    assert trash_positions.bottom("A1") == Point(
+        x=slot_pos[0] + trash_offset.x + trash_well.x,
+        y=slot_pos[1] + trash_offset.y + trash_well.y,
+        z=slot_pos[2] + trash_offset.z + trash_well.z,
+    )
+    assert subject._state.highest_z == (
+        slot_pos[2] + fixed_trash_def.dimensions.zDimension
     )
 
 
@@ -97,6 +114,18 @@ def test_handles_load_labware(
         == well_plate_def
     )
 
+    slot_pos = subject._state.slot_definitions_by_name[DeckSlotName.SLOT_1]["position"]
+    corner_offset = well_plate_def.cornerOffsetFromSlot
+    well_def = well_plate_def.wells["B2"]
+    well_positions = subject._state.well_positions_by_labware_id["test-labware-id"]
+
+    assert len(well_positions.names) == len(well_plate_def.wells)
+    assert well_positions.bottom("B2") == Point(
+        x=slot_pos[0] + corner_offset.x + well_def.x + 1,
+        y=slot_pos[1] + corner_offset.y + well_def.y + 2,
+        z=slot_pos[2] + corner_offset.z + well_def.z + 3,
+    )
+
 
 def test_handles_add_labware_defintion(
     subject: LabwareStore,
@@ -5,6 +5,7 @@ from typing import Dict, Optional, cast
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 from opentrons_shared_data.pipette.dev_types import LabwareUri
 from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocols.geometry.well_positions import WellPositions
 from opentrons.types import DeckSlotName, Point
 
 from opentrons.protocol_engine import errors
@@ -20,12 +21,26 @@ def get_labware_view(
     labware_by_id: Optional[Dict[str, LabwareData]] = None,
     labware_definitions_by_uri: Optional[Dict[str, LabwareDefinition]] = None,
     deck_definition: Optional[DeckDefinitionV2] = None,
+    well_positions_by_labware_id: Optional[Dict[str, WellPositions]] = None,
+    highest_z: Optional[float] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    slot_definitions_by_name = (
+        {
+            DeckSlotName.from_primitive(slot_def["id"]): slot_def
+            for slot_def in deck_definition["locations"]["orderedSlots"]
+        }
+        if deck_definition is not None
+        else {}
+    )
+
     state = LabwareState(
         labware_by_id=labware_by_id or {},
         labware_definitions_by_uri=labware_definitions_by_uri or {},
         deck_definition=deck_definition or cast(DeckDefinitionV2, {"fake": True}),
+        slot_definitions_by_name=slot_definitions_by_name,
+        well_positions_by_labware_id=well_positions_by_labware_id or {},
+        highest_z=highest_z,
     )
 
     return LabwareView(state=state)
@@ -442,3 +457,33 @@ def test_get_slot_position(standard_deck_def: DeckDefinitionV2) -> None:
     result = subject.get_slot_position(DeckSlotName.SLOT_3)
 
     assert result == Point(x=slot_pos[0], y=slot_pos[1], z=slot_pos[2])
+
+
+def test_get_well_bottom_position() -> None:
+    """It should get a well's absolute position from the geometry index."""
+    well_positions = WellPositions(
+        ordering=[["A1"]],
+        coordinates={"A1": (1, 2, 3, 4)},
+        parent_point=Point(10, 20, 30),
+    )
+    subject = get_labware_view(
+        well_positions_by_labware_id={"plate-id": well_positions}
+    )
+
+    assert subject.get_well_bottom_position("plate-id", "A1") == Point(11, 22, 33)
+
+    with pytest.raises(errors.WellDoesNotExistError):
+        subject.get_well_bottom_position("plate-id", "B1")
+
+    with pytest.raises(errors.LabwareDoesNotExistError):
+        subject.get_well_bottom_position("other-id", "A1")
+
+
+def test_get_all_labware_highest_z() -> None:
+    """It should get the highest Z of all labware from the geometry index."""
+    subject = get_labware_view(highest_z=42.0)
+    assert subject.get_all_labware_highest_z() == 42.0
+
+    subject = get_labware_view(highest_z=None)
+    with pytest.raises(errors.LabwareDoesNotExistError):
+        subject.get_all_labware_highest_z()
@@ -4,9 +4,24 @@ from decoy import Decoy
 from typing import Callable, Optional
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
-from opentrons.protocol_engine.state import StateStore, State, PlayAction
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocol_engine.types import DeckSlotLocation, DeckSlotName
+from opentrons.protocol_engine.state import (
+    StateStore,
+    State,
+    StateKey,
+    CommandKey,
+    PlayAction,
+    UpdateCommandAction,
+)
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
+from .command_fixtures import (
+    create_pending_command,
+    create_failed_command,
+    create_load_labware_command,
+)
+
 
 @pytest.fixture
 def change_notifier(decoy: Decoy) -> ChangeNotifier:
@@ -48,9 +63,65 @@ def test_notify_on_state_change(
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify({StateKey.COMMANDS}), times=0)
     subject.handle_action(PlayAction())
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify({StateKey.COMMANDS}), times=1)
+
+
+def test_notify_command_keys(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should notify the keys of the command and substores that changed."""
+    command = create_pending_command(command_id="command-id")
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    decoy.verify(
+        change_notifier.notify(
+            {StateKey.COMMANDS, CommandKey(command_id="command-id")}
+        ),
+        times=1,
+    )
+
+
+def test_notify_labware_keys(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+    well_plate_def: LabwareDefinition,
+) -> None:
+    """It should notify that labware changed when labware is loaded."""
+    command = create_load_labware_command(
+        labware_id="labware-id",
+        location=DeckSlotLocation(slot=DeckSlotName.SLOT_1),
+        definition=well_plate_def,
+        calibration=(1, 2, 3),
+    )
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    decoy.verify(
+        change_notifier.notify(
+            {
+                StateKey.COMMANDS,
+                StateKey.LABWARE,
+                CommandKey(command_id="command-id"),
+            }
+        ),
+        times=1,
+    )
+
+
+def test_notify_everyone_on_failure(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should wake all waiters if a command fails."""
+    command = create_failed_command(command_id="command-id")
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    decoy.verify(change_notifier.notify(None), times=1)
 
 
 async def test_wait_for_state(
@@ -70,7 +141,27 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(None), times=2)
+
+
+async def test_wait_for_state_depends_on(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the keys the condition depends on."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition(bar="baz")).then_return(None, "hello world")
+
+    result = await subject.wait_for(
+        check_condition,
+        depends_on=[StateKey.LABWARE],
+        bar="baz",
+    )
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait(frozenset({StateKey.LABWARE})), times=1)
 
 
 async def test_wait_for_state_short_circuit(
@@ -86,7 +177,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -13,10 +13,13 @@ from opentrons.protocol_engine.resources import ModelUtils
 
 from opentrons.protocol_engine.state import (
     StateStore,
+    StateKey,
+    CommandKey,
     PlayAction,
     PauseAction,
     StopAction,
     UpdateCommandAction,
+    UpdateCommandsAction,
 )
 
 
@@ -111,6 +114,60 @@ def test_add_command(
     )
 
 
+def test_add_commands(
+    decoy: Decoy,
+    state_store: StateStore,
+    command_mapper: CommandMapper,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should add several commands to the state in a single action."""
+    request_1 = commands.PauseRequest(data=commands.PauseData(message="hello"))
+    request_2 = commands.PauseRequest(data=commands.PauseData(message="goodbye"))
+
+    created_at = datetime(year=2021, month=1, day=1)
+
+    queued_command_1 = commands.Pause(
+        id="command-id-1",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        data=request_1.data,
+    )
+    queued_command_2 = commands.Pause(
+        id="command-id-2",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        data=request_2.data,
+    )
+
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(
+        command_mapper.map_request_to_command(
+            request=request_1,
+            command_id="command-id-1",
+            created_at=created_at,
+        )
+    ).then_return(queued_command_1)
+    decoy.when(
+        command_mapper.map_request_to_command(
+            request=request_2,
+            command_id="command-id-2",
+            created_at=created_at,
+        )
+    ).then_return(queued_command_2)
+
+    result = subject.add_commands([request_1, request_2])
+
+    assert result == [queued_command_1, queued_command_2]
+    decoy.verify(
+        state_store.handle_action(
+            UpdateCommandsAction(commands=[queued_command_1, queued_command_2])
+        ),
+        times=1,
+    )
+
+
 async def test_execute_command(
     decoy: Decoy,
     state_store: StateStore,
@@ -170,6 +227,7 @@ async def test_execute_command(
         await state_store.wait_for(
             condition=state_store.commands.get_is_complete,
             command_id="command-id",
+            depends_on=[CommandKey(command_id="command-id")],
         ),
     )
 
@@ -251,7 +309,10 @@ async def test_stop_after_wait(
     await subject.stop(wait_until_complete=True)
 
     decoy.verify(
-        await state_store.wait_for(condition=state_store.commands.get_all_complete),
+        await state_store.wait_for(
+            condition=state_store.commands.get_all_complete,
+            depends_on=[StateKey.COMMANDS],
+        ),
         state_store.handle_action(StopAction()),
         await queue_worker.join(),
         await hardware_api.stop(home_after=False),
@@ -139,6 +139,41 @@ def test_labware(
     assert len(result) == 4
 
 
+def test_labware_shared_definition(
+    subject: JsonCommandTranslator,
+    minimal_labware_def: dict,
+) -> None:
+    """It should add a definition used under several IDs only once."""
+    definition = models.LabwareDefinition.parse_obj(minimal_labware_def)
+    protocol = _make_json_protocol(
+        labware={
+            "labware-id-abc123": models.json_protocol.Labware(
+                slot="1", definitionId="definition-id-abc123"
+            ),
+            "labware-id-def456": models.json_protocol.Labware(
+                slot="2", definitionId="definition-id-def456"
+            ),
+        },
+    )
+    # The JSON file reader reads identical definitions into the same model
+    protocol.labwareDefinitions = {
+        "definition-id-abc123": definition,
+        "definition-id-def456": definition,
+    }
+
+    result = subject.translate(protocol)
+
+    assert result[0] == pe_commands.AddLabwareDefinitionRequest(
+        data=pe_commands.AddLabwareDefinitionData(definition=definition)
+    )
+    assert result[0].data.definition is definition  # type: ignore[union-attr]
+    assert [type(r) for r in result] == [
+        pe_commands.AddLabwareDefinitionRequest,
+        pe_commands.LoadLabwareRequest,
+        pe_commands.LoadLabwareRequest,
+    ]
+
+
 def test_pipettes(subject: JsonCommandTranslator) -> None:
     """It should translate pipette specs into LoadPipetteRequest objects."""
     json_pipettes = {
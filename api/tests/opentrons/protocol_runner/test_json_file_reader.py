@@ -1,6 +1,9 @@
 """Integration tests for the JsonFileReader interface."""
+import json
+import pytest
 from decoy import matchers
 from pathlib import Path
+from pydantic import ValidationError
 
 from opentrons.protocol_runner.protocol_file import ProtocolFile, ProtocolFileType
 from opentrons.protocol_runner.json_file_reader import JsonFileReader
@@ -45,3 +48,58 @@ def test_reads_file(json_protocol_file: Path) -> None:
             )
         ],
     )
+
+
+def test_reads_file_with_shared_definitions(
+    json_protocol_file: Path, tmp_path: Path
+) -> None:
+    """It should read identical labware definitions into the same model."""
+    contents = json.loads(json_protocol_file.read_text(encoding="utf-8"))
+    definition = contents["labwareDefinitions"][
+        "opentrons/opentrons_96_tiprack_300ul/1"
+    ]
+    contents["labwareDefinitions"]["another-definition-id"] = definition
+    other_file = tmp_path / "other-protocol.json"
+    other_file.write_text(json.dumps(contents), encoding="utf-8")
+
+    subject = JsonFileReader()
+    result = subject.read(
+        ProtocolFile(protocol_type=ProtocolFileType.JSON, files=[json_protocol_file])
+    )
+    other_result = subject.read(
+        ProtocolFile(protocol_type=ProtocolFileType.JSON, files=[other_file])
+    )
+
+    definitions = {
+        id(d) for r in (result, other_result) for d in r.labwareDefinitions.values()
+    }
+    assert len(definitions) == 1
+    assert other_result.commands == result.commands
+
+
+@pytest.mark.parametrize(
+    argnames=["command", "error_location"],
+    argvalues=[
+        ({"command": "pickUpTip", "params": {}}, ("commands", 0, "params")),
+        ({"command": "doAFlip", "params": {}}, ("commands", 0)),
+    ],
+)
+def test_reads_invalid_command(
+    json_protocol_file: Path, command: dict, error_location: tuple
+) -> None:
+    """It should raise a validation error locating the invalid command."""
+    contents = json.loads(json_protocol_file.read_text(encoding="utf-8"))
+    contents["commands"] = [command]
+    json_protocol_file.write_text(json.dumps(contents), encoding="utf-8")
+
+    subject = JsonFileReader()
+
+    with pytest.raises(ValidationError) as exc_info:
+        subject.read(
+            ProtocolFile(
+                protocol_type=ProtocolFileType.JSON, files=[json_protocol_file]
+            )
+        )
+
+    locations = [error["loc"] for error in exc_info.value.errors()]
+    assert all(loc[: len(error_location)] == error_location for loc in locations)
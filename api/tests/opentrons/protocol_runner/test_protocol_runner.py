@@ -187,16 +187,7 @@ def test_load_json(
     subject.load(json_protocol_file)
 
     decoy.verify(
-        protocol_engine.add_command(
-            request=pe_commands.PauseRequest(
-                data=pe_commands.PauseData(message="hello")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.PauseRequest(
-                data=pe_commands.PauseData(message="goodbye")
-            )
-        ),
+        protocol_engine.add_commands(requests=commands),
     )
 
 
@@ -68,6 +68,7 @@ async def test_protocol_runner_with_python(python_protocol_file: Path) -> None:
         createdAt=matchers.IsA(datetime),
         startedAt=matchers.IsA(datetime),
         completedAt=matchers.IsA(datetime),
+        estimatedDuration=matchers.IsA(float),
         data=commands.PickUpTipData(
             pipetteId=pipette_id_captor.value,
             labwareId=labware_id_captor.value,
@@ -114,6 +115,7 @@ async def test_protocol_runner_with_json(json_protocol_file: Path) -> None:
         createdAt=matchers.IsA(datetime),
         startedAt=matchers.IsA(datetime),
         completedAt=matchers.IsA(datetime),
+        estimatedDuration=matchers.IsA(float),
         data=commands.PickUpTipData(
             pipetteId="pipette-id",
             labwareId="labware-id",
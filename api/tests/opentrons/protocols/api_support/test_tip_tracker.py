@@ -157,3 +157,31 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def test_next_tip_starting_tip(wells, tiptracker):
+    assert tiptracker.next_tip(starting_tip=wells[3]) is wells[3]
+    assert tiptracker.next_tip(5, starting_tip=wells[3]) is wells[3]
+    assert tiptracker.next_tip(6, starting_tip=wells[3]) is wells[8]
+
+    tiptracker.use_tips(wells[8], num_channels=8)
+    assert tiptracker.next_tip(8, starting_tip=wells[3]) is wells[16]
+
+
+def test_next_tip_only_considers_first_run(wells, tiptracker):
+    # Only the first run of tips in a column is considered, even if a longer
+    # run follows a gap further down the column
+    wells[1].set_has_tip(False)
+    assert tiptracker.next_tip(2) is wells[8]
+    assert tiptracker.next_tip(1) is wells[0]
+
+
+def test_tracks_wells_changed_directly(wells, tiptracker):
+    for well in wells[:16]:
+        well.set_has_tip(False)
+    assert tiptracker.next_tip() is wells[16]
+    assert tiptracker.previous_tip(8) is wells[0]
+
+    wells[0].set_has_tip(True)
+    assert tiptracker.next_tip() is wells[0]
+    assert tiptracker.previous_tip(8) is wells[8]
@@ -0,0 +1,49 @@
+import pytest
+
+from opentrons.types import Location, Point
+from opentrons.protocol_api import labware
+from opentrons.protocols.context.protocol_api.labware import LabwareImplementation
+from opentrons.protocols.geometry.well_positions import WellPositions
+
+labware_name = "corning_96_wellplate_360ul_flat"
+
+
+@pytest.fixture
+def plate_positions() -> WellPositions:
+    definition = labware.get_labware_definition(labware_name)
+    return WellPositions.from_definition(definition, Point(10, 20, 30))
+
+
+def test_matches_well_geometry(plate_positions: WellPositions):
+    plate = labware.Labware(
+        implementation=LabwareImplementation(
+            labware.get_labware_definition(labware_name),
+            Location(Point(10, 20, 30), "Test Slot"),
+        )
+    )
+
+    tops = plate_positions.tops().tolist()
+
+    for index, well in enumerate(plate.wells()):
+        assert Point(*tops[index]) == well.top().point
+        assert plate_positions.top(well.well_name) == well.top().point
+        assert plate_positions.bottom(well.well_name, z=1) == well.bottom(z=1).point
+
+
+def test_names(plate_positions: WellPositions):
+    assert plate_positions.names[:3] == ["A1", "B1", "C1"]
+    assert len(plate_positions.names) == 96
+
+
+def test_with_parent_point(plate_positions: WellPositions):
+    moved = plate_positions.with_parent_point(Point(0, 0, 0))
+    definition = labware.get_labware_definition(labware_name)
+    a1 = definition["wells"]["A1"]
+
+    assert moved.parent_point == Point(0, 0, 0)
+    assert moved.bottom("A1") == Point(a1["x"], a1["y"], a1["z"])
+    assert moved.top("A1") == Point(a1["x"], a1["y"], a1["z"] + a1["depth"])
+    assert moved.depth("A1") == a1["depth"]
+    assert plate_positions.bottom("A1") == Point(
+        a1["x"] + 10, a1["y"] + 20, a1["z"] + 30
+    )
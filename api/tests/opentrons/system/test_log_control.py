@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from opentrons.system import log_control
+
+
+class FakeProcess:
+    def __init__(self, output: bytes) -> None:
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(output)
+        self.stdout.feed_eof()
+        self.returncode = None
+        self.kill = mock.Mock()
+
+    async def wait(self):
+        self.returncode = 0
+        return self.returncode
+
+
+@pytest.fixture
+def mock_exec():
+    with mock.patch("asyncio.create_subprocess_exec") as m:
+        yield m
+
+
+async def test_stream_records(mock_exec, monkeypatch):
+    output = b'{"MESSAGE": "one"}\n{"MESSAGE": "two"}\n'
+    proc = FakeProcess(output)
+
+    async def create_subprocess_exec(*args, **kwargs):
+        return proc
+
+    mock_exec.side_effect = create_subprocess_exec
+    monkeypatch.setattr(log_control, "CHUNK_SIZE", 16)
+
+    chunks = [
+        chunk async for chunk in log_control.stream_records("opentrons-api", 10, "json")
+    ]
+    assert b"".join(chunks) == output
+    assert max(len(chunk) for chunk in chunks) == 16
+    assert mock_exec.call_args[0] == (
+        "journalctl",
+        "--no-pager",
+        "-t",
+        "opentrons-api",
+        "-n",
+        "10",
+        "-o",
+        "json",
+        "-a",
+    )
+    proc.kill.assert_not_called()
+
+
+async def test_stream_records_filtered(mock_exec):
+    proc = FakeProcess(b"")
+
+    async def create_subprocess_exec(*args, **kwargs):
+        return proc
+
+    mock_exec.side_effect = create_subprocess_exec
+    since = datetime(2021, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+    until = datetime(2021, 3, 4, 6, 0, 0, tzinfo=timezone.utc)
+    records = log_control.stream_records(
+        "uvicorn", 5, "short", cursor="s=abc;i=1", since=since, until=until
+    )
+
+    assert [chunk async for chunk in records] == []
+    assert "-n" not in mock_exec.call_args[0]
+    assert mock_exec.call_args[0][-6:] == (
+        "--after-cursor",
+        "s=abc;i=1",
+        "--since",
+        f"@{int(since.timestamp())}",
+        "--until",
+        f"@{int(until.timestamp())}",
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [8, 64])
+async def test_stream_records_after_cursor(mock_exec, monkeypatch, chunk_size):
+    output = b'{"MESSAGE": "one"}\n{"MESSAGE": "two"}\n{"MESSAGE": "three"}\n'
+    proc = FakeProcess(output)
+
+    async def create_subprocess_exec(*args, **kwargs):
+        return proc
+
+    mock_exec.side_effect = create_subprocess_exec
+    monkeypatch.setattr(log_control, "CHUNK_SIZE", chunk_size)
+
+    records = log_control.stream_records("uvicorn", 2, "json", cursor="s=abc;i=1")
+
+    # the first records after the cursor, not the last ones in the journal
+    chunks = [chunk async for chunk in records]
+    assert b"".join(chunks) == b'{"MESSAGE": "one"}\n{"MESSAGE": "two"}\n'
+    assert "-n" not in mock_exec.call_args[0]
+    proc.kill.assert_called_once()
+
+
+async def test_stream_records_stopped_early(mock_exec, monkeypatch):
+    proc = FakeProcess(b"x" * 64)
+
+    async def create_subprocess_exec(*args, **kwargs):
+        return proc
+
+    mock_exec.side_effect = create_subprocess_exec
+    monkeypatch.setattr(log_control, "CHUNK_SIZE", 16)
+
+    records = log_control.stream_records("uvicorn", 5, "short")
+    assert await records.__anext__() == b"x" * 16
+    await records.aclose()
+    proc.kill.assert_called_once()
+    assert proc.returncode is not None
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from opentrons import simulate, protocols
+from opentrons.hardware_control.time_estimator import TimeEstimator
 from opentrons.protocols.types import ApiDeprecationError
 from opentrons.protocols.execution.errors import ExceptionInProtocolError
 
@@ -43,6 +44,37 @@ def test_simulate_function_json_apiv2(get_json_protocol_fixture):
     ]
 
 
+def test_simulate_estimates_duration(get_json_protocol_fixture):
+    jp = get_json_protocol_fixture("3", "simple", False)
+    runlog, _ = simulate.simulate(io.StringIO(jp), "simple.json")
+    durations = {item["payload"]["text"]: item["duration"] for item in runlog}
+    assert durations["Delaying for 0 minutes and 42.0 seconds"] == pytest.approx(42)
+    assert all(duration > 0 for duration in durations.values())
+
+    total = simulate.estimate_duration(runlog)
+    assert total == pytest.approx(sum(durations.values()))
+    formatted = simulate.format_runlog(runlog, show_durations=True)
+    assert "Delaying for 0 minutes and 42.0 seconds (42.0 s)" in formatted
+    assert formatted.splitlines()[-1].startswith("Estimated run time: 0:0")
+
+
+def test_simulate_resets_time_estimate(get_json_protocol_fixture, monkeypatch):
+    estimators = []
+    original_reset = TimeEstimator.reset
+
+    def reset(self):
+        estimators.append(self)
+        original_reset(self)
+
+    monkeypatch.setattr(TimeEstimator, "reset", reset)
+    jp = get_json_protocol_fixture("3", "simple", False)
+    runlog, _ = simulate.simulate(io.StringIO(jp), "simple.json")
+
+    # the estimate starts from zero once the context is set up
+    assert len(estimators) == 1
+    assert estimators[0].elapsed == pytest.approx(simulate.estimate_duration(runlog))
+
+
 def test_simulate_function_bundle_apiv2(get_bundle_fixture):
     bundle = get_bundle_fixture("simple_bundle")
     runlog, bundle = simulate.simulate(bundle["filelike"], "simple_bundle.zip")
@@ -1,6 +1,7 @@
 """Methods and types for serializing and deserializing frames."""
 from __future__ import annotations
 
+import json
 from typing import List
 
 from pydantic import BaseModel
@@ -60,3 +61,30 @@ def from_frames(frames: List[bytes]) -> TopicEvent:
         )
     except (ValueError, IndexError, AttributeError) as e:
         raise MalformedFrames() from e
+
+
+_EVENT_FIELDS = frozenset(
+    name for name, field in Event.__fields__.items() if field.required
+)
+
+
+def to_json(frames: List[bytes]) -> str:
+    """
+    Create the json serialized TopicEvent of a zmq frame.
+
+    The event is taken as is, rather than parsed into an Event and serialized
+    again. It is only checked to be a JSON object with the fields of an
+    Event, so that what is sent on is always valid JSON.
+
+    :raises: MalformedFrame
+    """
+    try:
+        topic, event_json = (f.decode('utf-8') for f in frames)
+        event = json.loads(event_json)
+    except (ValueError, AttributeError) as e:
+        raise MalformedFrames() from e
+
+    if not isinstance(event, dict) or not _EVENT_FIELDS.issubset(event):
+        raise MalformedFrames()
+
+    return f'{{"topic": {json.dumps(topic)}, "event": {event_json}}}'
@@ -37,9 +37,20 @@ class Subscriber:
 
     async def next_event(self) -> TopicEvent:
         """Get next event."""
-        s = await self._connection.recv_multipart()
+        s = await self.next_frames()
         return from_frames(s)
 
+    async def next_frames(self) -> typing.List[bytes]:
+        """Get the frames of the next event, without parsing them."""
+        frames: typing.List[bytes] = \
+            await self._connection.recv_multipart()
+        return frames
+
+    async def frames(self) -> typing.AsyncIterator[typing.List[bytes]]:
+        """Iterate over the frames of events, without parsing them."""
+        while True:
+            yield await self.next_frames()
+
     def __aiter__(self) -> 'Subscriber':
         """Create an async iterator."""
         return self
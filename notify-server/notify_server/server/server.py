@@ -3,6 +3,7 @@
 import logging
 import asyncio
 from asyncio import Queue
+from typing import AbstractSet, List
 
 from notify_server.network.connection import create_publisher, create_pull, \
     Connection
@@ -19,6 +20,9 @@ async def _publisher_server_task(connection: Connection,
     This is the publisher server. Clients connect using zmq.PUSH pattern and
     send messages to topics. Each topic, data pair is enqueued in queue.
 
+    While the queue is full, no messages are read, so publishers are held
+    back once their connection's buffer fills up.
+
     :param connection: The network connection.
     :param queue: Queue for received messages.
     :return: None
@@ -34,20 +38,50 @@ async def _publisher_server_task(connection: Connection,
         connection.close()
 
 
+def _coalesce(batch: List[List[bytes]],
+              topics: AbstractSet[bytes]) -> List[List[bytes]]:
+    """
+    Drop all but the latest message of each coalesced topic in a batch.
+
+    :param batch: The multipart messages to publish, in order.
+    :param topics: The topics to coalesce.
+    :return: The messages to publish, in order.
+    """
+    latest = {m[0]: i for i, m in enumerate(batch) if m[0] in topics}
+    if len(latest) == 0:
+        return batch
+    return [m for i, m in enumerate(batch)
+            if m[0] not in latest or latest[m[0]] == i]
+
+
 async def _subscriber_server_task(connection: Connection,
-                                  queue: Queue) -> None:
+                                  queue: Queue,
+                                  max_batch_size: int = 1,
+                                  coalesced_topics: AbstractSet[bytes] =
+                                  frozenset()) -> None:
     """
     Run a task that publishes messages to subscribers.
 
+    Every message waiting in the queue, up to max_batch_size, is taken at
+    once. Messages are published as received, without deserializing them, so
+    each is serialized once however many subscribers there are.
+
     :param connection: The network connection.
     :param queue: The queue of multipart messages to send
+    :param max_batch_size: The most messages to take from the queue at once
+    :param coalesced_topics: Topics for which only the latest message of a
+        batch is published
     :return: None
     """
     try:
         while True:
-            s = await queue.get()
-            log.debug("Publishing: %s", s)
-            await connection.send_multipart(s)
+            batch = [await queue.get()]
+            while len(batch) < max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for s in _coalesce(batch, coalesced_topics):
+                log.debug("Publishing: %s", s)
+                await connection.send_multipart(s)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
@@ -56,12 +90,14 @@ async def _subscriber_server_task(connection: Connection,
 
 async def run(settings: Settings) -> None:
     """Run the server tasks. Will not return."""
-    queue: Queue = Queue()
+    queue: Queue = Queue(maxsize=settings.queue_size)
 
     subtask = asyncio.create_task(
         _subscriber_server_task(
             create_publisher(settings.subscriber_address.connection_string()),
-            queue
+            queue,
+            settings.max_batch_size,
+            frozenset(t.encode('utf-8') for t in settings.coalesced_topics)
         )
     )
     pubtask = asyncio.create_task(
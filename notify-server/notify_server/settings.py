@@ -1,5 +1,7 @@
 """Settings class."""
 
+from typing import List
+
 from typing_extensions import Literal
 from pydantic import BaseSettings, BaseModel, Field
 
@@ -27,6 +29,23 @@ class Settings(BaseSettings):
     publisher_address: ServerBindAddress = ServerBindAddress(scheme="ipc")
     subscriber_address: ServerBindAddress = ServerBindAddress(scheme="tcp")
 
+    queue_size: int = Field(
+        1000,
+        description="How many received events may wait to be published "
+                    "before publishers have to wait",
+        gt=0
+    )
+    max_batch_size: int = Field(
+        100,
+        description="The most waiting events to publish at once",
+        gt=0
+    )
+    coalesced_topics: List[str] = Field(
+        [],
+        description="Topics, e.g. of frequent polls, for which only the "
+                    "latest of the events waiting to be published is sent"
+    )
+
     production: bool = Field(
         True,
         description="Whether this the application is running in a "
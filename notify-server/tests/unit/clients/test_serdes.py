@@ -3,7 +3,7 @@ from typing import List
 
 import pytest
 from notify_server.clients.serdes import (
-    TopicEvent, MalformedFrames, to_frames, from_frames)
+    TopicEvent, MalformedFrames, to_frames, from_frames, to_json)
 from notify_server.models.event import Event
 
 
@@ -30,3 +30,24 @@ def test_entry_from_frames(event: Event) -> None:
     """Test that an object is created from_frames."""
     entry = from_frames([b"topic", event.json().encode('utf-8')])
     assert entry == TopicEvent(topic="topic", event=event)
+
+
+def test_to_json(event: Event) -> None:
+    """Test that frames are turned into the json of a TopicEvent."""
+    frames = to_frames(topic="topic", event=event)
+    assert to_json(frames) == TopicEvent(topic="topic", event=event).json()
+
+
+@pytest.mark.parametrize(argnames=["frames"],
+                         argvalues=[
+                             [[]],
+                             [[b"a"]],
+                             [[b"a", b"\xff"]],
+                             [[b"a", b"{"]],
+                             [[b"a", b"[]"]],
+                             [[b"a", b"{}"]]]
+                         )
+def test_to_json_fail(frames: List[bytes]) -> None:
+    """Test that an exception is raised on bad message."""
+    with pytest.raises(MalformedFrames):
+        to_json(frames)
@@ -0,0 +1,54 @@
+"""Unit tests for the server module."""
+import asyncio
+from asyncio import Queue
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from notify_server.network.connection import Connection
+from notify_server.server.server import _coalesce, _subscriber_server_task
+
+
+@pytest.mark.parametrize(argnames=["batch", "expected"],
+                         argvalues=[
+                             [[[b"a", b"1"], [b"b", b"2"]],
+                              [[b"a", b"1"], [b"b", b"2"]]],
+                             [[[b"poll", b"1"], [b"a", b"2"],
+                               [b"poll", b"3"]],
+                              [[b"a", b"2"], [b"poll", b"3"]]]])
+def test_coalesce(batch: List[List[bytes]],
+                  expected: List[List[bytes]]) -> None:
+    """Test that only the latest message of a coalesced topic is kept."""
+    assert _coalesce(batch, frozenset([b"poll"])) == expected
+
+
+@pytest.mark.asyncio
+async def test_subscriber_server_task() -> None:
+    """Test that waiting messages are published in batches."""
+    loop = asyncio.get_running_loop()
+    queue: Queue = Queue()
+    sent: List[List[bytes]] = []
+
+    def send_multipart(frames: List[bytes]) -> "asyncio.Future[None]":
+        sent.append(frames)
+        result = loop.create_future()
+        result.set_result(None)
+        return result
+
+    connection = MagicMock(spec=Connection)
+    connection.send_multipart.side_effect = send_multipart
+
+    for m in ([b"poll", b"1"], [b"a", b"2"], [b"poll", b"3"], [b"poll", b"4"]):
+        queue.put_nowait(m)
+
+    task = asyncio.create_task(
+        _subscriber_server_task(connection, queue, 3, frozenset([b"poll"])))
+    while len(sent) < 3:
+        await asyncio.sleep(0)
+    task.cancel()
+    await task
+
+    # The last message didn't fit in the first batch
+    assert sent == [[b"a", b"2"], [b"poll", b"3"], [b"poll", b"4"]]
+    connection.close.assert_called_once()
@@ -15,6 +15,7 @@ from .hardware import initialize_hardware, cleanup_hardware
 from .service import initialize_logging
 from .service.dependencies import get_protocol_manager
 from .service.legacy.rpc import cleanup_rpc_server
+from .protocols import cleanup_analysis_pool
 from . import constants
 
 log = logging.getLogger(__name__)
@@ -68,6 +69,7 @@ async def on_shutdown() -> None:
     shutdown_results = await asyncio.gather(
         cleanup_rpc_server(app.state),
         cleanup_hardware(app.state),
+        cleanup_analysis_pool(app.state),
         return_exceptions=True,
     )
 
@@ -3,7 +3,7 @@
 from opentrons.protocol_runner import ProtocolFile, ProtocolFileType
 
 from .router import protocols_router, ProtocolNotFound
-from .dependencies import get_protocol_store
+from .dependencies import get_protocol_store, cleanup_analysis_pool
 from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
     "ProtocolNotFound",
     # protocol state management
     "get_protocol_store",
+    "cleanup_analysis_pool",
     "ProtocolStore",
     "ProtocolResource",
     "ProtocolNotFoundError",
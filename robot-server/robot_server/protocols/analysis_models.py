@@ -2,7 +2,7 @@
 # TODO(mc, 2021-08-25): add modules to simulation result
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Union
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.types import MountType
@@ -107,6 +107,14 @@ class CompletedAnalysis(AnalysisSummary):
         ...,
         description="The protocol commands the run is expected to produce",
     )
+    estimatedDuration: Optional[float] = Field(
+        None,
+        description=(
+            "How many seconds the run is estimated to take on a robot, based on"
+            " the robot's motion settings, pipette flow rates, delays, and"
+            " module temperature ramps"
+        ),
+    )
     # TODO(mc, 2021-09-01): replace string with error details object. Details
     # object should try to distinguish between engine errors, Python execution
     # errors, and unexpected errors due to Opentrons-sourced bugs
@@ -0,0 +1,163 @@
+"""Protocol analysis in worker processes."""
+import asyncio
+import hashlib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from opentrons.config import CONFIG
+from opentrons.protocol_engine import Command as ProtocolCommand
+from opentrons.protocol_runner import ProtocolFile, create_simulating_runner
+
+#: How many protocols may be analyzed at the same time
+MAX_WORKERS = 2
+
+#: How many analysis outcomes to keep around for reuse
+MAX_CACHED_OUTCOMES = 8
+
+
+class AnalysisError(Exception):
+    """An error raised while analyzing a protocol in a worker process.
+
+    Only the message of the original error is kept, since the error itself
+    may not survive being sent back from the worker.
+    """
+
+    pass
+
+
+@dataclass(frozen=True)
+class AnalysisOutcome:
+    """The commands a protocol produced in simulation, and any errors."""
+
+    commands: Sequence[ProtocolCommand]
+    errors: Sequence[Exception]
+
+
+def analyze_in_process(protocol_file: ProtocolFile) -> AnalysisOutcome:
+    """Simulate a protocol in its own event loop, e.g. in a worker process."""
+    return asyncio.run(_analyze(protocol_file))
+
+
+async def _analyze(protocol_file: ProtocolFile) -> AnalysisOutcome:
+    try:
+        protocol_runner = await create_simulating_runner()
+        commands = await protocol_runner.run(protocol_file)
+    except Exception as e:
+        return AnalysisOutcome(commands=[], errors=[AnalysisError(str(e))])
+
+    return AnalysisOutcome(commands=list(commands), errors=[])
+
+
+def get_analysis_key(protocol_file: ProtocolFile) -> str:
+    """Hash everything the outcome of analyzing a protocol depends on.
+
+    That is the protocol's files, any custom labware definitions, and the
+    robot's settings. The location of the protocol files does not matter, so
+    uploading the same protocol again results in the same key.
+    """
+    digest = hashlib.sha256(protocol_file.protocol_type.value.encode())
+    labware_dir = Path(CONFIG["labware_user_definitions_dir_v2"])
+    settings_files = [
+        Path(CONFIG["feature_flags_file"]),
+        Path(CONFIG["robot_settings_file"]),
+    ]
+
+    def add_file(name: str, path: Path) -> None:
+        contents = path.read_bytes()
+        digest.update(f"\n{name}:{len(contents)}\n".encode())
+        digest.update(contents)
+
+    for path in protocol_file.files:
+        add_file(f"protocol/{path.name}", path)
+
+    if labware_dir.is_dir():
+        for path in sorted(labware_dir.rglob("*")):
+            if path.is_file():
+                add_file(f"labware/{path.relative_to(labware_dir)}", path)
+
+    for path in settings_files:
+        if path.is_file():
+            add_file(f"settings/{path.name}", path)
+
+    return digest.hexdigest()
+
+
+class AnalysisPool:
+    """Analyze protocols in a bounded pool of worker processes.
+
+    Analyses run outside of the server's process, so they neither block its
+    event loop nor run more than a few at a time. Outcomes are kept by
+    :py:func:`get_analysis_key`, so analyzing an identical protocol again,
+    even while its first analysis is still running, reuses that analysis.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_cached: int = MAX_CACHED_OUTCOMES,
+    ) -> None:
+        """Initialize the pool.
+
+        Arguments:
+            executor: Executor to run analyses in. Defaults to a pool of
+                :py:data:`MAX_WORKERS` freshly spawned processes.
+            max_cached: How many analysis outcomes to keep for reuse.
+        """
+        # Forking the server, with its hardware and threads, isn't safe
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._max_cached = max_cached
+        self._outcomes: "OrderedDict[str, asyncio.Future[AnalysisOutcome]]" = (
+            OrderedDict()
+        )
+
+    async def analyze(self, protocol_file: ProtocolFile) -> AnalysisOutcome:
+        """Analyze a protocol, or reuse the analysis of an identical one."""
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, get_analysis_key, protocol_file)
+        outcome = self._outcomes.get(key)
+
+        if outcome is not None:
+            self._outcomes.move_to_end(key)
+        else:
+            # Only send what the analysis needs to the worker
+            request = ProtocolFile(
+                protocol_type=protocol_file.protocol_type,
+                files=list(protocol_file.files),
+            )
+            outcome = asyncio.ensure_future(
+                loop.run_in_executor(self._executor, analyze_in_process, request)
+            )
+            outcome.add_done_callback(lambda f: self._forget_failed(key, f))
+            self._outcomes[key] = outcome
+
+            while len(self._outcomes) > self._max_cached:
+                self._outcomes.popitem(last=False)
+
+        # Other analyses may be waiting on the same outcome
+        return await asyncio.shield(outcome)
+
+    async def shutdown(self) -> None:
+        """Stop the worker processes once any running analyses finish.
+
+        Analyses that haven't started yet are cancelled.
+        """
+        for outcome in self._outcomes.values():
+            outcome.cancel()
+
+        self._outcomes.clear()
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    def _forget_failed(
+        self, key: str, outcome: "asyncio.Future[AnalysisOutcome]"
+    ) -> None:
+        # Analysis errors are part of the outcome; this is the pool failing
+        if outcome.cancelled() or outcome.exception() is not None:
+            if self._outcomes.get(key) is outcome:
+                del self._outcomes[key]
@@ -1,5 +1,11 @@
 """Protocol analysis storage."""
-from typing import Dict, List, Set, Sequence
+import sqlite3
+from collections import OrderedDict
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Sequence, Union
+
+from pydantic import ValidationError
 
 from opentrons.calibration_storage.helpers import uri_from_details
 from opentrons.protocol_engine import commands as pe_commands
@@ -13,22 +19,86 @@ from .analysis_models import (
     AnalysisPipette,
 )
 
+log = getLogger(__name__)
+
+#: How many completed analyses to keep parsed in memory
+MAX_CACHED_ANALYSES = 8
+
+#: The error of an analysis that was still pending when the server stopped
+INTERRUPTED_ANALYSIS_ERROR = (
+    "Analysis was interrupted by a server restart. Upload the protocol again"
+    " to analyze it."
+)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS analysis (
+    id TEXT PRIMARY KEY,
+    protocol_id TEXT NOT NULL,
+    completed_analysis TEXT
+)
+"""
+
 
 class AnalysisStore:
-    """Storage interface for protocol analyses."""
+    """Storage interface for protocol analyses.
 
-    def __init__(self) -> None:
-        """Initialize the AnalysisStore's internal state."""
-        self._analysis_ids_by_protocol: Dict[str, Set[str]] = {}
-        self._analyses_by_id: Dict[str, ProtocolAnalysis] = {}
+    Completed analyses are saved serialized in a SQLite database. Only the
+    IDs of the analyses are kept in memory, along with the few completed
+    analyses that were used most recently, since their command lists can
+    be large.
+    """
+
+    def __init__(
+        self,
+        database: Union[Path, str] = ":memory:",
+        max_cached: int = MAX_CACHED_ANALYSES,
+    ) -> None:
+        """Initialize the AnalysisStore's internal state.
+
+        Arguments:
+            database: Path of the SQLite database to save analyses in.
+                Defaults to a database that only lives in memory.
+            max_cached: How many completed analyses to keep parsed in memory.
+        """
+        # The store may be created in a worker thread by FastAPI's dependency
+        # injection, but it is only used from one thread at a time
+        self._database = sqlite3.connect(str(database), check_same_thread=False)
+        self._max_cached = max_cached
+        self._analysis_ids_by_protocol: Dict[str, List[str]] = {}
+        self._pending_ids: Set[str] = set()
+        self._completed_by_id: "OrderedDict[str, CompletedAnalysis]" = OrderedDict()
+
+        with self._database:
+            self._database.execute(_CREATE_TABLE)
+            # An analysis left pending by a previous server will never
+            # complete, so report it as failed rather than pending forever
+            self._database.executemany(
+                "UPDATE analysis SET completed_analysis = ? WHERE id = ?",
+                [
+                    (self._build_interrupted(analysis_id).json(), analysis_id)
+                    for (analysis_id,) in self._database.execute(
+                        "SELECT id FROM analysis WHERE completed_analysis IS NULL"
+                    ).fetchall()
+                ],
+            )
+
+        for analysis_id, protocol_id in self._database.execute(
+            "SELECT id, protocol_id FROM analysis ORDER BY rowid"
+        ):
+            self._analysis_ids_by_protocol.setdefault(protocol_id, []).append(
+                analysis_id
+            )
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> List[ProtocolAnalysis]:
         """Add a pending analysis to the store."""
-        self._analyses_by_id[analysis_id] = PendingAnalysis(id=analysis_id)
+        with self._database:
+            self._database.execute(
+                "INSERT INTO analysis (id, protocol_id) VALUES (?, ?)",
+                (analysis_id, protocol_id),
+            )
 
-        ids_for_protocol = self._analysis_ids_by_protocol.get(protocol_id, set())
-        ids_for_protocol.add(analysis_id)
-        self._analysis_ids_by_protocol[protocol_id] = ids_for_protocol
+        self._pending_ids.add(analysis_id)
+        self._analysis_ids_by_protocol.setdefault(protocol_id, []).append(analysis_id)
 
         return self.get_by_protocol(protocol_id)
 
@@ -67,6 +137,11 @@ class AnalysisStore:
                     )
                 )
 
+        durations = [
+            c.estimatedDuration for c in commands if c.estimatedDuration is not None
+        ]
+        estimated_duration = sum(durations) if durations else None
+
         if len(error_messages) > 0:
             result = AnalysisResult.ERROR
         elif any(c.status == pe_commands.CommandStatus.FAILED for c in commands):
@@ -74,17 +149,85 @@ class AnalysisStore:
         else:
             result = AnalysisResult.OK
 
-        self._analyses_by_id[analysis_id] = CompletedAnalysis(
+        analysis = CompletedAnalysis(
             id=analysis_id,
             result=result,
             commands=list(commands),
+            estimatedDuration=estimated_duration,
             errors=error_messages,
             labware=labware,
             pipettes=pipettes,
         )
 
+        with self._database:
+            self._database.execute(
+                "UPDATE analysis SET completed_analysis = ? WHERE id = ?",
+                (analysis.json(), analysis_id),
+            )
+
+        self._pending_ids.discard(analysis_id)
+        self._cache(analysis)
+
+    def remove_by_protocol(self, protocol_id: str) -> None:
+        """Remove all analyses of a given protocol ID from the store."""
+        with self._database:
+            self._database.execute(
+                "DELETE FROM analysis WHERE protocol_id = ?", (protocol_id,)
+            )
+
+        for analysis_id in self._analysis_ids_by_protocol.pop(protocol_id, []):
+            self._pending_ids.discard(analysis_id)
+            self._completed_by_id.pop(analysis_id, None)
+
     def get_by_protocol(self, protocol_id: str) -> List[ProtocolAnalysis]:
         """Get an analysis for a given protocol ID from the store."""
-        ids_for_protocol = self._analysis_ids_by_protocol.get(protocol_id, set())
+        analyses: List[ProtocolAnalysis] = []
+
+        for analysis_id in self._analysis_ids_by_protocol.get(protocol_id, []):
+            if analysis_id in self._pending_ids:
+                analyses.append(PendingAnalysis(id=analysis_id))
+            else:
+                completed = self._get_completed(analysis_id)
+                if completed is not None:
+                    analyses.append(completed)
+
+        return analyses
+
+    def _get_completed(self, analysis_id: str) -> Optional[CompletedAnalysis]:
+        analysis = self._completed_by_id.get(analysis_id)
+
+        if analysis is not None:
+            self._completed_by_id.move_to_end(analysis_id)
+            return analysis
+
+        row = self._database.execute(
+            "SELECT completed_analysis FROM analysis WHERE id = ?",
+            (analysis_id,),
+        ).fetchone()
+
+        try:
+            analysis = CompletedAnalysis.parse_raw(row[0])
+        except (TypeError, ValidationError) as e:
+            log.warning(f"Unable to load analysis {analysis_id}", exc_info=e)
+            return None
+
+        self._cache(analysis)
+        return analysis
+
+    @staticmethod
+    def _build_interrupted(analysis_id: str) -> CompletedAnalysis:
+        return CompletedAnalysis(
+            id=analysis_id,
+            result=AnalysisResult.ERROR,
+            commands=[],
+            errors=[INTERRUPTED_ANALYSIS_ERROR],
+            labware=[],
+            pipettes=[],
+        )
+
+    def _cache(self, analysis: CompletedAnalysis) -> None:
+        self._completed_by_id[analysis.id] = analysis
+        self._completed_by_id.move_to_end(analysis.id)
 
-        return [self._analyses_by_id[analysis_id] for analysis_id in ids_for_protocol]
+        while len(self._completed_by_id) > self._max_cached:
+            self._completed_by_id.popitem(last=False)
@@ -1,22 +1,24 @@
 """Protocol router dependency wire-up."""
 import logging
-from pathlib import Path
-from tempfile import gettempdir
 from fastapi import Depends
 
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons.config import infer_config_base_dir
 
 from robot_server.app_state import AppState, get_app_state
 from .protocol_store import ProtocolStore
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_pool import AnalysisPool
 
 log = logging.getLogger(__name__)
 
 _PROTOCOL_STORE_KEY = "protocol_store"
-_PROTOCOL_STORE_DIRECTORY = Path(gettempdir()) / "opentrons-protocols"
+_PROTOCOL_STORE_DIRECTORY = infer_config_base_dir() / "protocols"
 
 _ANALYSIS_STORE_KEY = "analysis_store"
+_ANALYSIS_STORE_DATABASE = _PROTOCOL_STORE_DIRECTORY / "analyses.db"
+
+_ANALYSIS_POOL_KEY = "analysis_pool"
 
 
 def get_protocol_store(app_state: AppState = Depends(get_app_state)) -> ProtocolStore:
@@ -36,19 +38,40 @@ def get_analysis_store(app_state: AppState = Depends(get_app_state)) -> Analysis
     analysis_store = getattr(app_state, _ANALYSIS_STORE_KEY, None)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore()
+        log.info(f"Storing protocol analyses in {_ANALYSIS_STORE_DATABASE}")
+        _ANALYSIS_STORE_DATABASE.parent.mkdir(parents=True, exist_ok=True)
+        analysis_store = AnalysisStore(database=_ANALYSIS_STORE_DATABASE)
         setattr(app_state, _ANALYSIS_STORE_KEY, analysis_store)
 
     return analysis_store
 
 
-async def get_protocol_analyzer(
+def get_analysis_pool(app_state: AppState = Depends(get_app_state)) -> AnalysisPool:
+    """Get a singleton AnalysisPool to run protocol analyses in."""
+    analysis_pool = getattr(app_state, _ANALYSIS_POOL_KEY, None)
+
+    if analysis_pool is None:
+        analysis_pool = AnalysisPool()
+        setattr(app_state, _ANALYSIS_POOL_KEY, analysis_pool)
+
+    return analysis_pool
+
+
+def get_protocol_analyzer(
+    analysis_pool: AnalysisPool = Depends(get_analysis_pool),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_pool=analysis_pool,
         analysis_store=analysis_store,
     )
+
+
+async def cleanup_analysis_pool(app_state: AppState) -> None:
+    """Shutdown the AnalysisPool singleton and remove it from global state."""
+    analysis_pool = getattr(app_state, _ANALYSIS_POOL_KEY, None)
+    setattr(app_state, _ANALYSIS_POOL_KEY, None)
+
+    if analysis_pool is not None:
+        await analysis_pool.shutdown()
@@ -1,10 +1,7 @@
 """Protocol analysis module."""
-from typing import Sequence
-from opentrons.protocol_engine import Command as ProtocolCommand
-from opentrons.protocol_runner import ProtocolRunner
-
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_pool import AnalysisPool, AnalysisOutcome
 
 
 class ProtocolAnalyzer:
@@ -12,11 +9,11 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        analysis_pool: AnalysisPool,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._analysis_pool = analysis_pool
         self._analysis_store = analysis_store
 
     async def analyze(
@@ -25,16 +22,13 @@ class ProtocolAnalyzer:
         analysis_id: str,
     ) -> None:
         """Analyze a given protocol, storing the analysis when complete."""
-        commands: Sequence[ProtocolCommand] = []
-        errors: Sequence[Exception] = []
-
         try:
-            commands = await self._protocol_runner.run(protocol_resource)
+            outcome = await self._analysis_pool.analyze(protocol_resource)
         except Exception as e:
-            errors = [e]
+            outcome = AnalysisOutcome(commands=[], errors=[e])
 
         self._analysis_store.update(
             analysis_id=analysis_id,
-            commands=commands,
-            errors=errors,
+            commands=outcome.commands,
+            errors=outcome.errors,
         )
@@ -1,15 +1,28 @@
 """Methods for saving and retrieving protocol files."""
+import json
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from fastapi import UploadFile
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Tuple
 
 from opentrons.protocol_runner import ProtocolFile, ProtocolFileType
 
 log = getLogger(__name__)
 
+_INDEX_FILE_NAME = "protocols.db"
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS protocol (
+    id TEXT PRIMARY KEY,
+    protocol_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    file_names TEXT NOT NULL
+)
+"""
+
 
 @dataclass(frozen=True)
 class ProtocolResource(ProtocolFile):
@@ -37,16 +50,37 @@ class ProtocolFileInvalidError(ValueError):
 
 
 class ProtocolStore:
-    """Methods for storing and retrieving protocol files."""
+    """Methods for storing and retrieving protocol files.
+
+    Protocols are indexed in a SQLite database next to their files, so the
+    store picks up where it left off when the server restarts.
+    """
 
     def __init__(self, directory: Path) -> None:
         """Initialize the ProtocolStore.
 
         Arguments:
-            directory: Directory in which to place created files.
+            directory: Directory in which to place created files and the
+                protocol index.
         """
         self._directory = directory
-        self._protocols_by_id: Dict[str, ProtocolResource] = {}
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # The store may be created in a worker thread by FastAPI's dependency
+        # injection, but it is only used from one thread at a time
+        self._index = sqlite3.connect(
+            str(directory / _INDEX_FILE_NAME),
+            check_same_thread=False,
+        )
+        with self._index:
+            self._index.execute(_CREATE_TABLE)
+
+        self._protocols_by_id: Dict[str, ProtocolResource] = {
+            row[0]: self._resource_from_row(row)
+            for row in self._index.execute(
+                "SELECT id, protocol_type, created_at, file_names FROM protocol"
+                " ORDER BY rowid"
+            )
+        }
 
     async def create(
         self,
@@ -81,6 +115,17 @@ class ProtocolStore:
             files=saved_files,
         )
 
+        with self._index:
+            self._index.execute(
+                "INSERT INTO protocol VALUES (?, ?, ?, ?)",
+                (
+                    protocol_id,
+                    entry.protocol_type.value,
+                    created_at.isoformat(),
+                    json.dumps([f.name for f in saved_files]),
+                ),
+            )
+
         self._protocols_by_id[protocol_id] = entry
 
         return entry
@@ -103,6 +148,9 @@ class ProtocolStore:
         except KeyError as e:
             raise ProtocolNotFoundError(protocol_id) from e
 
+        with self._index:
+            self._index.execute("DELETE FROM protocol WHERE id = ?", (protocol_id,))
+
         try:
             for file_path in entry.files:
                 file_path.unlink()
@@ -118,6 +166,17 @@ class ProtocolStore:
     def _get_protocol_dir(self, protocol_id: str) -> Path:
         return self._directory / protocol_id
 
+    def _resource_from_row(self, row: Tuple[str, str, str, str]) -> ProtocolResource:
+        protocol_id, protocol_type, created_at, file_names = row
+        protocol_dir = self._get_protocol_dir(protocol_id)
+
+        return ProtocolResource(
+            protocol_id=protocol_id,
+            protocol_type=ProtocolFileType(protocol_type),
+            created_at=datetime.fromisoformat(created_at),
+            files=[protocol_dir / name for name in json.loads(file_names)],
+        )
+
     # TODO(mc, 2021-06-01): add multi-file support and ditch all of this
     # logic in favor of whatever protocol analyzer we come up with
     @staticmethod
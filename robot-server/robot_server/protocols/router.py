@@ -179,12 +179,14 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> EmptyResponseModel:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_store: In-memory database of protocol analyses.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
@@ -192,4 +194,6 @@ async def delete_protocol_by_id(
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
+    analysis_store.remove_by_protocol(protocol_id=protocolId)
+
     return EmptyResponseModel()
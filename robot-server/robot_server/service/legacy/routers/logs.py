@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Query, Response
-from typing import Dict
+from datetime import datetime
+from fastapi import APIRouter, Query
+from starlette.responses import StreamingResponse
+from typing import Dict, Optional
 
 from opentrons.system import log_control
 from robot_server.service.legacy.models.logs import LogIdentifier, LogFormat
@@ -13,7 +15,15 @@ IDENTIFIER_TO_SYSLOG_ID: Dict[LogIdentifier, str] = {
 }
 
 
-@router.get("/logs/{log_identifier}", description="Get logs from the robot.")
+@router.get(
+    "/logs/{log_identifier}",
+    description=(
+        "Get logs from the robot. They are sent as they are read. "
+        "In the json format, every record is a JSON object on its own line, "
+        "and its `__CURSOR` can be passed as `cursor` to get only newer "
+        "records, e.g. to follow the logs."
+    ),
+)
 async def get_logs(
     log_identifier: LogIdentifier,
     format: LogFormat = Query(LogFormat.text, title="Log format type"),
@@ -23,12 +33,23 @@ async def get_logs(
         gt=0,
         le=log_control.MAX_RECORDS,
     ),
-) -> Response:
+    cursor: Optional[str] = Query(
+        None, title="Only retrieve records after the one with this cursor"
+    ),
+    since: Optional[datetime] = Query(
+        None, title="Only retrieve records from this time on"
+    ),
+    until: Optional[datetime] = Query(
+        None, title="Only retrieve records up to this time"
+    ),
+) -> StreamingResponse:
     syslog_id = IDENTIFIER_TO_SYSLOG_ID[log_identifier]
     modes = {
-        LogFormat.json: ("json", "application/json"),
+        LogFormat.json: ("json", "application/x-ndjson"),
         LogFormat.text: ("short", "text/plain"),
     }
     format_type, media_type = modes[format]
-    output = await log_control.get_records_dumb(syslog_id, records, format_type)
-    return Response(content=output.decode("utf-8"), media_type=media_type)
+    output = log_control.stream_records(
+        syslog_id, records, format_type, cursor=cursor, since=since, until=until
+    )
+    return StreamingResponse(output, media_type=media_type)
@@ -1,5 +1,6 @@
 import asyncio
 import functools
+import json
 import logging
 import traceback
 import typing
@@ -38,6 +39,9 @@ class RPCServer(object):
         self.loop = loop or asyncio.get_event_loop()
         self.objects: typing.Dict[typing.Any, typing.Any] = {}
         self.system = SystemCalls(self.objects)
+        # Keeps serialized subtrees around, since the same objects are sent
+        # over and over again
+        self.serializer = serialize.ObjectTreeSerializer()
 
         self.root = root
 
@@ -77,8 +81,8 @@ class RPCServer(object):
 
     def send_worker(self, socket: WebSocket) -> ClientWriterTask:
         """
-        Create a send queue and task to read from said queue and send objects
-        over socket.
+        Create a send queue and task to read from said queue and send encoded
+        messages over socket.
 
         :param socket: Web socket
         :return: The client object.
@@ -93,12 +97,12 @@ class RPCServer(object):
 
         async def send_task(socket_: WebSocket, queue_: asyncio.Queue):
             while True:
-                payload = await queue_.get()
+                text = await queue_.get()
                 if socket_.client_state == WebSocketState.DISCONNECTED:
                     log.debug(f"Websocket {_id} closed")
                     break
 
-                await socket_.send_json(payload)
+                await socket_.send_text(text)
 
         queue: asyncio.Queue = asyncio.Queue(loop=self.loop)
         task = self.loop.create_task(send_task(socket, queue))
@@ -251,7 +255,9 @@ class RPCServer(object):
         # XXXX: This should really only be called in a new thread (as in
         #       the normal case where it is called in a threadpool)
         call_result = func()
-        serialized, refs = serialize.get_object_tree(call_result, max_depth=max_depth)
+        serialized, refs = self.serializer.get_object_tree(
+            call_result, max_depth=max_depth
+        )
         self.objects.update(refs)
         return serialized
 
@@ -310,8 +316,12 @@ class RPCServer(object):
         self.send({"$": {"type": PONG_MESSAGE}})
 
     def send(self, payload):
+        if not self.clients:
+            return
+        # Encode once, rather than once per client
+        text = json.dumps(payload)
         for writer in self.clients:
-            asyncio.run_coroutine_threadsafe(writer.queue.put(payload), self.loop)
+            asyncio.run_coroutine_threadsafe(writer.queue.put(text), self.loop)
 
 
 class SystemCalls(object):
@@ -1,62 +1,287 @@
-import functools
-from typing import Any, List, Dict
+import itertools
+import operator
+import sys
+import threading
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
 
+#: Number of serializations after which an unused cached subtree is dropped
+CACHE_IDLE_LIMIT = 16
 
-def _get_object_tree(max_depth, path, refs, depth, obj):  # noqa: C901
-    def object_container(value):
+# TODO: what's the better way to detect primitive types?
+_PRIMITIVES = (str, int, bool, float, complex, type(None))
+
+# Order of the earliest object referenced when there are no references
+_NO_REFERENCE = sys.maxsize
+
+
+def _contents(obj):
+    """
+    The keys and the values of everything an object's serialized form is
+    made of, to tell whether it changed
+    """
+    if isinstance(obj, (list, tuple)):
+        return (), tuple(obj)
+    if isinstance(obj, dict):
+        return tuple(obj), tuple(obj.values())
+    if hasattr(obj, "__dict__"):
+        # Filter out private attributes
+        attributes = [(k, v) for k, v in obj.__dict__.items() if not k.startswith("_")]
+        return tuple(k for k, _ in attributes), tuple(v for _, v in attributes)
+    return (), ()
+
+
+class _Subtree:
+    """The cached serialized form of an object and everything below it"""
+
+    __slots__ = (
+        "obj",
+        "type",
+        "keys",
+        "values",
+        "tree",
+        "refs",
+        "nodes",
+        "reached",
+        "used",
+        "checked",
+        "current",
+    )
+
+    def __init__(self, obj, tree, refs, children, generation):
+        # Holding on to the object and its values keeps their ids from
+        # being reused while they are cached
+        self.obj = obj
+        self.type = type(obj)
+        self.keys, self.values = _contents(obj)
+        self.tree = tree
+        # Everything added to refs when serializing the subtree
+        self.refs = refs
+        # This subtree and all of the ones below it, in the order reached
+        self.nodes = (self,) + tuple(
+            itertools.chain.from_iterable(child.nodes for child in children)
+        )
+        # The objects that are checked for circular references
+        self.reached = tuple(
+            node.obj for node in self.nodes if hasattr(node.obj, "__dict__")
+        )
+        self.used = generation
+        self.checked = generation
+        self.current = True
+
+    def is_unchanged(self):
+        """Whether the object itself still has the same keys and values"""
+        obj = self.obj
+        if type(obj) is not self.type:
+            return False
+        # Identity rather than equality: an equal but different object
+        # serializes with a different id
+        values: Collection[Any]
+        if isinstance(obj, (list, tuple)):
+            values = obj
+        elif isinstance(obj, dict):
+            if len(obj) != len(self.keys) or not all(map(operator.is_, obj, self.keys)):
+                return False
+            values = obj.values()
+        else:
+            keys, values = _contents(obj)
+            if keys != self.keys:
+                return False
+        return len(values) == len(self.values) and all(
+            map(operator.is_, values, self.values)
+        )
+
+
+class _Walk:
+    """A single traversal of an object tree"""
+
+    def __init__(self, max_depth, cache=None, generation=0):
+        self.max_depth = max_depth
+        self.refs: Dict[Any, Any] = {}
+        self._cache = cache
+        self._generation = generation
+        # Objects with attributes that were reached, in order. Reaching one
+        # again results in a light reference.
+        self._reached: Dict[int, int] = {}
+        # The earliest reached object light referenced in the current subtree
+        self._earliest_reference = _NO_REFERENCE
+
+    def tree(self, obj):
+        if isinstance(obj, _PRIMITIVES):
+            return obj
+        return self._node(obj, 0)[0]
+
+    def _container(self, obj, value):
         # Save id of instance of object's type as a reference too
         # We will need it to keep track of types the same we are
         # tracking objects
         t = type(obj)
-        refs[id(t)] = t
+        self.refs[id(t)] = t
         return {"i": id(obj), "t": id(t), "v": value}
 
-    # TODO: what's the better way to detect primitive types?
-    if isinstance(obj, (str, int, bool, float, complex)) or obj is None:
-        return obj
+    def _node(self, obj, depth) -> Tuple[Any, Optional[_Subtree]]:
+        """
+        Serialize a non-primitive object, along with its subtree if it can be
+        reused on its own later
+        """
+        has_attributes = hasattr(obj, "__dict__")
+        # If we have reached ourself already, it's a circular reference
+        # we are terminating it with a valid id but a value of None
+        if has_attributes and id(obj) in self._reached:
+            self._earliest_reference = min(
+                self._earliest_reference, self._reached[id(obj)]
+            )
+            return self._container(obj, None), None
 
-    # If we have ourself in path, it's a circular reference
-    # we are terminating it with a valid id but a value of None
-    if hasattr(obj, "__dict__") and id(obj) in path:
-        return object_container(None)
+        if self._cache is not None:
+            cached = self._cache.get(id(obj))
+            if cached is not None and cached.obj is obj and self._reuse(cached):
+                return cached.tree, cached
 
-    # Shorthand for calling ourselves recursively
-    object_tree = functools.partial(_get_object_tree, max_depth, path, refs, depth + 1)
+        start = len(self._reached)
+        if has_attributes:
+            self._reached[id(obj)] = start
 
-    path += [id(obj)]
+        # Cut-off at max_depth
+        # If max_depth == 0 (evaluates to False) — keep going
+        if self.max_depth and (depth >= self.max_depth):
+            return {}, None
 
-    # Cut-off at max_depth
-    # If max_depth == 0 (evaluates to False) — keep going
-    if max_depth and (depth >= max_depth):
-        return {}
+        if self._cache is None:
+            return self._build(obj, depth + 1)[0], None
 
-    if isinstance(obj, (list, tuple)):
-        return [object_tree(o) for o in obj]
+        # Collect the light references and refs of the subtree on their own
+        outer_reference, self._earliest_reference = (
+            self._earliest_reference,
+            _NO_REFERENCE,
+        )
+        outer_refs, self.refs = self.refs, {}
+        tree, children = self._build(obj, depth + 1)
+        own_reference, refs = self._earliest_reference, self.refs
+        self._earliest_reference = min(outer_reference, own_reference)
+        self.refs = outer_refs
+        self.refs.update(refs)
 
-    def iterate(kv):
-        return {str(k): object_tree(v) for k, v in kv.items()}
+        # Only subtrees that don't refer to objects outside of themselves
+        # can be reused in another serialization
+        if children is None or own_reference < start:
+            return tree, None
+        subtree = _Subtree(obj, tree, refs, children, self._generation)
+        self._cache[id(obj)] = subtree
+        return tree, subtree
 
-    if isinstance(obj, dict):
-        return object_container(iterate(obj))
-    elif hasattr(obj, "__dict__"):
-        refs[id(obj)] = obj
+    def _reuse(self, cached: _Subtree) -> bool:
+        """
+        Reuse a cached subtree if nothing in it changed and none of its
+        objects were reached yet, which would turn them into light references
+        """
+        for node in cached.nodes:
+            if node.checked != self._generation:
+                node.checked = self._generation
+                node.current = node.is_unchanged()
+            if not node.current:
+                return False
+        reached = self._reached
+        if any(id(obj) in reached for obj in cached.reached):
+            return False
+        for obj in cached.reached:
+            reached[id(obj)] = len(reached)
+        self.refs.update(cached.refs)
+        cached.used = self._generation
+        return True
+
+    def _children(self, values, depth) -> Tuple[List[Any], Optional[List[_Subtree]]]:
+        """
+        Serialize the values of an object, along with their subtrees, or
+        None if any of them can't be reused
+        """
+        trees = []
+        subtrees: Optional[List[_Subtree]] = []
+        for value in values:
+            if isinstance(value, _PRIMITIVES):
+                trees.append(value)
+                continue
+            tree, subtree = self._node(value, depth)
+            trees.append(tree)
+            if subtree is None:
+                subtrees = None
+            elif subtrees is not None:
+                subtrees.append(subtree)
+        return trees, subtrees
+
+    def _build(self, obj, depth) -> Tuple[Any, Optional[List[_Subtree]]]:
+        if isinstance(obj, (list, tuple)):
+            return self._children(obj, depth)
+
+        if isinstance(obj, dict):
+            trees, children = self._children(obj.values(), depth)
+            return self._container(obj, dict(zip(map(str, obj), trees))), children
+
+        if not hasattr(obj, "__dict__"):
+            return self._container(obj, {}), []
+
+        self.refs[id(obj)] = obj
         items: List[Any] = []
         # If Type is iterable we will iterate generating numeric keys and
         # and merge with the output
+        iterator: Optional[Iterator[Any]]
         try:
-            items = [object_tree(o) for o in obj]
+            iterator = iter(obj)
         except TypeError:
-            pass
+            iterator = None
+        else:
+            try:
+                items, _ = self._children(iterator, depth)
+            except TypeError:
+                pass
         tail = {i: v for i, v in enumerate(items)}
 
-        # Filter out private attributes
-        attributes = {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
-        return object_container({**iterate(attributes), **tail})
-    else:
-        return object_container({})
+        keys, values = _contents(obj)
+        trees, children = self._children(values, depth)
+        value = {**dict(zip(keys, trees)), **tail}
+        # What iterating yields isn't kept track of, so it can't be reused
+        return self._container(obj, value), None if iterator is not None else children
+
+
+class ObjectTreeSerializer:
+    """
+    Serializes object trees like :py:func:`get_object_tree`, but keeps the
+    serialized form of self-contained subtrees between calls. An unchanged
+    subtree is only compared against its objects by identity rather than
+    rebuilt, so serializing e.g. a session again mostly costs what changed
+    since the last time.
+    """
+
+    def __init__(self):
+        self._cache: Dict[int, _Subtree] = {}
+        self._generation = 0
+        # Calls are serialized both in the loop and in executor threads
+        self._lock = threading.Lock()
+
+    def get_object_tree(self, obj, max_depth=0):
+        # Trees cut off at a depth aren't cached
+        if max_depth:
+            return get_object_tree(obj, max_depth)
+        with self._lock:
+            self._generation += 1
+            walk = _Walk(0, self._cache, self._generation)
+            tree = walk.tree(obj)
+            if self._generation % CACHE_IDLE_LIMIT == 0:
+                self._prune()
+            return tree, walk.refs
+
+    def _prune(self):
+        # Keep what was used recently, along with everything below it
+        oldest = self._generation - CACHE_IDLE_LIMIT
+        kept = {
+            id(node)
+            for subtree in self._cache.values()
+            if subtree.used > oldest
+            for node in subtree.nodes
+        }
+        self._cache = {k: v for k, v in self._cache.items() if id(v) in kept}
 
 
 def get_object_tree(obj, max_depth=0):
-    refs: Dict[Any, Any] = {}
-    tree = _get_object_tree(max_depth, [], refs, 0, obj)
-    return (tree, refs)
+    walk = _Walk(max_depth)
+    tree = walk.tree(obj)
+    return (tree, walk.refs)
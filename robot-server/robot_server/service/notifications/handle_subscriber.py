@@ -6,7 +6,7 @@ from typing import List
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from notify_server.clients.serdes import TopicEvent
+from notify_server.clients.serdes import to_json
 from notify_server.clients.subscriber import Subscriber, create
 
 from robot_server.settings import get_settings
@@ -32,15 +32,19 @@ async def receive(websocket: WebSocket, subscriber: Subscriber) -> None:
         subscriber.close()
 
 
-async def send(websocket: WebSocket, entry: TopicEvent) -> None:
-    """Send entry to web socket."""
-    await websocket.send_text(entry.json())
+async def send(websocket: WebSocket, entry_json: str) -> None:
+    """Send a json serialized entry to web socket."""
+    await websocket.send_text(entry_json)
 
 
 async def route_events(websocket: WebSocket, subscriber: Subscriber) -> None:
-    """Route events from subscriber to websocket."""
+    """Route events from subscriber to websocket.
+
+    Events are passed along as the notify-server serialized them, rather than
+    parsed and serialized again for every websocket.
+    """
     try:
-        async for entry in subscriber:
-            await send(websocket, entry)
+        async for frames in subscriber.frames():
+            await send(websocket, to_json(frames))
     except CancelledError:
         log.exception("Connection to notify-server closed.")
@@ -2,7 +2,7 @@
 
 Contains routes dealing primarily with `Session` models.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from datetime import datetime
 from typing import Optional
 from typing_extensions import Literal
@@ -32,6 +32,12 @@ from ..dependencies import get_session_store, get_engine_store
 
 base_router = APIRouter()
 
+INCLUDE_COMMANDS_DESCRIPTION = (
+    "Whether to include a summary of every command in the response. Set to false"
+    " when polling, and use `GET /sessions/{sessionId}/commands` to get"
+    " the commands that changed."
+)
+
 
 class SessionNotFound(ErrorDetails):
     """An error if a given session is not found."""
@@ -131,6 +137,7 @@ async def create_session(
     response_model=MultiResponseModel[Session],
 )
 async def get_sessions(
+    includeCommands: bool = Query(True, description=INCLUDE_COMMANDS_DESCRIPTION),
     session_view: SessionView = Depends(SessionView),
     session_store: SessionStore = Depends(get_session_store),
     engine_store: EngineStore = Depends(get_engine_store),
@@ -138,6 +145,7 @@ async def get_sessions(
     """Get all sessions.
 
     Args:
+        includeCommands: Whether to include each session's command summaries.
         session_view: Session model construction interface.
         session_store: Session storage interface.
         engine_store: ProtocolEngine storage and control.
@@ -146,7 +154,11 @@ async def get_sessions(
 
     for session in session_store.get_all():
         # TODO(mc, 2021-06-23): add multi-engine support
-        commands = engine_store.engine.state_view.commands.get_all()
+        commands = (
+            engine_store.engine.state_view.commands.get_all()
+            if includeCommands
+            else None
+        )
         engine_status = engine_store.engine.state_view.commands.get_status()
         session_data = session_view.as_response(
             session=session,
@@ -170,6 +182,7 @@ async def get_sessions(
 )
 async def get_session(
     sessionId: str,
+    includeCommands: bool = Query(True, description=INCLUDE_COMMANDS_DESCRIPTION),
     session_view: SessionView = Depends(SessionView),
     session_store: SessionStore = Depends(get_session_store),
     engine_store: EngineStore = Depends(get_engine_store),
@@ -178,6 +191,7 @@ async def get_session(
 
     Args:
         sessionId: Session ID pulled from URL.
+        includeCommands: Whether to include the session's command summaries.
         session_view: Session model construction interface.
         session_store: Session storage interface.
         engine_store: ProtocolEngine storage and control.
@@ -187,7 +201,9 @@ async def get_session(
     except SessionNotFoundError as e:
         raise SessionNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
-    commands = engine_store.engine.state_view.commands.get_all()
+    commands = (
+        engine_store.engine.state_view.commands.get_all() if includeCommands else None
+    )
     engine_status = engine_store.engine.state_view.commands.get_status()
     data = session_view.as_response(
         session=session,
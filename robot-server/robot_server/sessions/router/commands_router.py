@@ -1,18 +1,20 @@
 """Router for /sessions commands endpoints."""
-from fastapi import APIRouter, Depends, status
-from typing import Union
+from fastapi import APIRouter, Depends, Query, status
+from typing import Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import commands as pe_commands, errors as pe_errors
 
 from robot_server.errors import ErrorDetails, ErrorResponse
-from robot_server.service.json_api import ResponseModel, MultiResponseModel
+from robot_server.service.json_api import ResponseModel
 
-from ..session_models import Session, SessionCommandSummary
-from ..schema_models import SessionCommandResponse
+from ..session_store import SessionStore, SessionNotFoundError
+from ..session_view import SessionView
+from ..session_models import SessionCommandCollectionMeta
+from ..schema_models import SessionCommandCollectionResponse, SessionCommandResponse
 from ..engine_store import EngineStore
-from ..dependencies import get_engine_store
-from .base_router import SessionNotFound, get_session
+from ..dependencies import get_session_store, get_engine_store
+from .base_router import SessionNotFound
 
 commands_router = APIRouter()
 
@@ -24,6 +26,13 @@ class CommandNotFound(ErrorDetails):
     title: str = "Session Command Not Found"
 
 
+def _check_session_exists(session_store: SessionStore, session_id: str) -> None:
+    try:
+        session_store.get(session_id=session_id)
+    except SessionNotFoundError as e:
+        raise SessionNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
+
+
 @commands_router.get(
     path="/sessions/{sessionId}/commands",
     summary="Get a list of all protocol commands in the session",
@@ -31,24 +40,68 @@ class CommandNotFound(ErrorDetails):
         "Get a list of all commands in the session and their statuses. "
         "This endpoint returns command summaries. Use "
         "`GET /sessions/{sessionId}/commands/{commandId}` to get all "
-        "information available for a given command."
+        "information available for a given command. "
+        "Use `cursor` and `pageLength` to get a page of the command log, and "
+        "`since` to only get the commands that changed since a previous "
+        "response, rather than all of them every time."
     ),
     status_code=status.HTTP_200_OK,
-    response_model=MultiResponseModel[SessionCommandSummary],
+    response_model=SessionCommandCollectionResponse,
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse[SessionNotFound]},
     },
 )
 async def get_session_commands(
-    session: ResponseModel[Session] = Depends(get_session),
-) -> MultiResponseModel[SessionCommandSummary]:
-    """Get a summary of all commands in a session.
+    sessionId: str,
+    cursor: int = Query(
+        0,
+        ge=0,
+        description="Index of the first command of the page in the command log.",
+    ),
+    pageLength: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Maximum number of commands to return. Defaults to all.",
+    ),
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "Only return the commands added or updated after this revision of"
+            " the command log, as given by `meta.revision` in a previous response."
+        ),
+    ),
+    session_view: SessionView = Depends(SessionView),
+    session_store: SessionStore = Depends(get_session_store),
+    engine_store: EngineStore = Depends(get_engine_store),
+) -> SessionCommandCollectionResponse:
+    """Get a summary of a page of the commands in a session.
 
     Arguments:
-        session: Session response model, provided by the route handler for
-            `GET /session/{sessionId}`
+        sessionId: Session ID pulled from the URL.
+        cursor: Index of the first command of the page, from the query.
+        pageLength: Maximum number of commands of the page, from the query.
+        since: Command log revision to get changes since, from the query.
+        session_view: Resource model builder.
+        session_store: Session storage interface.
+        engine_store: Protocol engine and runner storage.
     """
-    return MultiResponseModel(data=session.data.commands)
+    _check_session_exists(session_store, sessionId)
+
+    command_slice = engine_store.engine.state_view.commands.get_slice(
+        cursor=cursor,
+        length=pageLength,
+        since=since,
+    )
+
+    return SessionCommandCollectionResponse(
+        data=session_view.as_command_summaries(command_slice.commands),
+        meta=SessionCommandCollectionMeta(
+            cursor=command_slice.cursor,
+            totalLength=command_slice.total_length,
+            revision=command_slice.revision,
+        ),
+    )
 
 
 @commands_router.get(
@@ -72,19 +125,21 @@ async def get_session_commands(
     },
 )
 async def get_session_command(
+    sessionId: str,
     commandId: str,
+    session_store: SessionStore = Depends(get_session_store),
     engine_store: EngineStore = Depends(get_engine_store),
-    session: ResponseModel[Session] = Depends(get_session),
 ) -> ResponseModel[pe_commands.Command]:
     """Get a specific command from a session.
 
     Arguments:
+        sessionId: Session ID pulled from the URL.
         commandId: Command identifier, pulled from route parameter.
+        session_store: Session storage interface.
         engine_store: Protocol engine and runner storage.
-        session: Session response model, provided by the route handler for
-            `GET /session/{sessionId}`. Present to ensure 404 if session
-            not found.
     """
+    _check_session_exists(session_store, sessionId)
+
     try:
         command = engine_store.engine.state_view.commands.get(commandId)
     except pe_errors.CommandDoesNotExistError as e:
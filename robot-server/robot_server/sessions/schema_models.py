@@ -7,10 +7,14 @@ the request and response models need to be ordered carefully.
 Mostly, this involves making sure we have responses that are `Union`s
 of `ResponseModel`s rather than `ResponseModel`s of `Union`s.
 """
-from typing import Union
+from typing import List, Union
 
 from opentrons.protocol_engine import commands as pe_commands
-from robot_server.service.json_api import RequestModel, ResponseModel
+from robot_server.service.json_api import (
+    RequestModel,
+    ResponseModel,
+    MultiResponseModel,
+)
 
 
 from .session_models import (
@@ -18,6 +22,8 @@ from .session_models import (
     ProtocolSessionCreateData,
     BasicSession,
     ProtocolSession,
+    SessionCommandSummary,
+    SessionCommandCollectionMeta,
 )
 
 
@@ -31,6 +37,14 @@ SessionResponse = Union[
     ResponseModel[ProtocolSession],
 ]
 
+
+class SessionCommandCollectionResponse(MultiResponseModel[SessionCommandSummary]):
+    """A page of session command summaries."""
+
+    data: List[SessionCommandSummary]
+    meta: SessionCommandCollectionMeta
+
+
 SessionCommandResponse = Union[
     ResponseModel[pe_commands.AddLabwareDefinition],
     ResponseModel[pe_commands.Aspirate],
@@ -42,6 +42,26 @@ class SessionCommandSummary(ResourceModel):
     status: CommandStatus = Field(..., description="Execution status of the command.")
 
 
+class SessionCommandCollectionMeta(BaseModel):
+    """Where a list of session commands came from in the command log."""
+
+    cursor: int = Field(
+        ...,
+        description="Index of the first command of the requested page in the log.",
+    )
+    totalLength: int = Field(
+        ...,
+        description="Number of commands in the session's whole command log.",
+    )
+    revision: int = Field(
+        ...,
+        description=(
+            "Current revision of the command log. Pass it as `since` to only"
+            " get the commands added or updated after this response."
+        ),
+    )
+
+
 class AbstractSession(ResourceModel):
     """Base session resource model."""
 
@@ -58,9 +78,12 @@ class AbstractSession(ResourceModel):
         ...,
         description="Client-initiated session control actions.",
     )
-    commands: List[SessionCommandSummary] = Field(
-        ...,
-        description="Protocol commands queued, running, or executed for the session.",
+    commands: Optional[List[SessionCommandSummary]] = Field(
+        None,
+        description=(
+            "Protocol commands queued, running, or executed for the session."
+            " Omitted if the session was requested without its commands."
+        ),
     )
 
 
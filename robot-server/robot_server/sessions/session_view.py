@@ -84,22 +84,23 @@ class SessionView:
     @staticmethod
     def as_response(
         session: SessionResource,
-        commands: List[ProtocolEngineCommand],
+        commands: Optional[List[ProtocolEngineCommand]],
         engine_status: EngineStatus,
     ) -> Session:
         """Transform a session resource into its public response model.
 
         Arguments:
             session: Internal resource representation of the session.
+            commands: The session's commands, or None to leave them out.
+            engine_status: The execution status of the session's engine.
 
         Returns:
             Session response model representing the same resource.
         """
         create_data = session.create_data
-        command_summaries = [
-            SessionCommandSummary(id=c.id, commandType=c.commandType, status=c.status)
-            for c in commands
-        ]
+        command_summaries = (
+            SessionView.as_command_summaries(commands) if commands is not None else None
+        )
 
         if isinstance(create_data, BasicSessionCreateData):
             return BasicSession.construct(
@@ -120,3 +121,22 @@ class SessionView:
             )
 
         raise ValueError(f"Invalid session resource {session}")
+
+    @staticmethod
+    def as_command_summaries(
+        commands: List[ProtocolEngineCommand],
+    ) -> List[SessionCommandSummary]:
+        """Summarize engine commands for a session response.
+
+        Arguments:
+            commands: Commands from the session's protocol engine.
+
+        Returns:
+            A summary of each command, in the same order.
+        """
+        return [
+            SessionCommandSummary.construct(
+                id=c.id, commandType=c.commandType, status=c.status
+            )
+            for c in commands
+        ]
@@ -0,0 +1,152 @@
+"""Tests for the AnalysisPool."""
+import pytest
+from concurrent.futures import Executor, Future
+from datetime import datetime
+from decoy import Decoy
+from pathlib import Path
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_runner import ProtocolFile, ProtocolFileType
+
+from robot_server.protocols.analysis_pool import (
+    AnalysisPool,
+    AnalysisOutcome,
+    analyze_in_process,
+)
+
+
+@pytest.fixture
+def executor(decoy: Decoy) -> Executor:
+    """Get a mocked out process pool executor."""
+    return decoy.mock(cls=Executor)
+
+
+@pytest.fixture
+def subject(executor: Executor) -> AnalysisPool:
+    """Get an AnalysisPool test subject."""
+    return AnalysisPool(executor=executor)
+
+
+@pytest.fixture
+def outcome() -> AnalysisOutcome:
+    """Get the outcome of an analysis."""
+    return AnalysisOutcome(
+        commands=[
+            pe_commands.Pause(
+                id="command-id",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2022, month=2, day=2),
+                data=pe_commands.PauseData(message="hello world"),
+            )
+        ],
+        errors=[],
+    )
+
+
+def _save_protocol(directory: Path, contents: str) -> ProtocolFile:
+    directory.mkdir()
+    file_path = directory / "protocol.py"
+    file_path.write_text(contents, encoding="utf-8")
+
+    return ProtocolFile(protocol_type=ProtocolFileType.PYTHON, files=[file_path])
+
+
+def _done(result: AnalysisOutcome) -> "Future[AnalysisOutcome]":
+    future: "Future[AnalysisOutcome]" = Future()
+    future.set_result(result)
+    return future
+
+
+def _failed(error: Exception) -> "Future[AnalysisOutcome]":
+    future: "Future[AnalysisOutcome]" = Future()
+    future.set_exception(error)
+    return future
+
+
+async def test_analyze(
+    decoy: Decoy,
+    tmp_path: Path,
+    executor: Executor,
+    outcome: AnalysisOutcome,
+    subject: AnalysisPool,
+) -> None:
+    """It should analyze a protocol in the executor."""
+    protocol_file = _save_protocol(tmp_path / "protocol-id", "# my protocol\n")
+
+    decoy.when(executor.submit(analyze_in_process, protocol_file)).then_return(
+        _done(outcome)
+    )
+
+    result = await subject.analyze(protocol_file)
+
+    assert result == outcome
+
+
+async def test_analyze_identical_protocol(
+    decoy: Decoy,
+    tmp_path: Path,
+    executor: Executor,
+    outcome: AnalysisOutcome,
+    subject: AnalysisPool,
+) -> None:
+    """It should reuse the outcome of a protocol with the same contents."""
+    protocol_file = _save_protocol(tmp_path / "protocol-id-1", "# my protocol\n")
+    duplicate_file = _save_protocol(tmp_path / "protocol-id-2", "# my protocol\n")
+
+    decoy.when(executor.submit(analyze_in_process, protocol_file)).then_return(
+        _done(outcome)
+    )
+
+    await subject.analyze(protocol_file)
+    result = await subject.analyze(duplicate_file)
+
+    assert result == outcome
+    decoy.verify(executor.submit(analyze_in_process, duplicate_file), times=0)
+
+
+async def test_analyze_changed_protocol(
+    decoy: Decoy,
+    tmp_path: Path,
+    executor: Executor,
+    outcome: AnalysisOutcome,
+    subject: AnalysisPool,
+) -> None:
+    """It should analyze a protocol with different contents again."""
+    protocol_file = _save_protocol(tmp_path / "protocol-id-1", "# my protocol\n")
+    changed_file = _save_protocol(tmp_path / "protocol-id-2", "# changed\n")
+    changed_outcome = AnalysisOutcome(commands=[], errors=[])
+
+    decoy.when(executor.submit(analyze_in_process, protocol_file)).then_return(
+        _done(outcome)
+    )
+    decoy.when(executor.submit(analyze_in_process, changed_file)).then_return(
+        _done(changed_outcome)
+    )
+
+    await subject.analyze(protocol_file)
+    result = await subject.analyze(changed_file)
+
+    assert result == changed_outcome
+
+
+async def test_analyze_after_failure(
+    decoy: Decoy,
+    tmp_path: Path,
+    executor: Executor,
+    outcome: AnalysisOutcome,
+    subject: AnalysisPool,
+) -> None:
+    """It should not reuse an analysis that failed to run."""
+    protocol_file = _save_protocol(tmp_path / "protocol-id", "# my protocol\n")
+    error = RuntimeError("oh no")
+
+    decoy.when(executor.submit(analyze_in_process, protocol_file)).then_return(
+        _failed(error), _done(outcome)
+    )
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await subject.analyze(protocol_file)
+
+    result = await subject.analyze(protocol_file)
+
+    assert result == outcome
@@ -1,13 +1,17 @@
 """Tests for the AnalysisStore interface."""
 import pytest
 from datetime import datetime
+from pathlib import Path
 from typing import List, NamedTuple, Sequence, cast
 
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocol_engine import commands as pe_commands, types as pe_types
 
-from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_store import (
+    AnalysisStore,
+    INTERRUPTED_ANALYSIS_ERROR,
+)
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisPipette,
@@ -164,3 +168,89 @@ def test_add_parses_labware_commands(
             errors=[],
         )
     ]
+
+
+def test_add_sums_estimated_durations() -> None:
+    """It should estimate the run duration from the commands' estimates."""
+    commands = [
+        pe_commands.LoadPipette(
+            id=f"load-pipette-{mount.value}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            data=pe_commands.LoadPipetteData(
+                pipetteName=pe_types.PipetteName.P300_SINGLE,
+                mount=mount,
+            ),
+            estimatedDuration=duration,
+        )
+        for mount, duration in [(MountType.LEFT, 1.5), (MountType.RIGHT, 2.0)]
+    ]
+    subject = AnalysisStore()
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    subject.update(analysis_id="analysis-id", commands=commands, errors=[])
+    result = subject.get_by_protocol("protocol-id")
+
+    assert isinstance(result[0], CompletedAnalysis)
+    assert result[0].estimatedDuration == 3.5
+
+
+def test_load_analyses_from_database(tmp_path: Path) -> None:
+    """It should pick up completed analyses saved by a previous store."""
+    database = tmp_path / "analyses.db"
+    commands = command_analysis_specs[1].commands
+    subject = AnalysisStore(database=database)
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    subject.update(analysis_id="analysis-id-1", commands=commands, errors=[])
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+    expected_result = subject.get_by_protocol("protocol-id")[0]
+
+    result = AnalysisStore(database=database).get_by_protocol("protocol-id")
+
+    # an analysis that was still pending will never complete
+    assert result == [
+        expected_result,
+        CompletedAnalysis(
+            id="analysis-id-2",
+            result=AnalysisResult.ERROR,
+            commands=[],
+            errors=[INTERRUPTED_ANALYSIS_ERROR],
+            labware=[],
+            pipettes=[],
+        ),
+    ]
+    assert isinstance(result[0], CompletedAnalysis)
+    assert result[0].commands == list(commands)
+
+
+def test_remove_by_protocol(tmp_path: Path) -> None:
+    """It should remove every analysis of a protocol, and only those."""
+    database = tmp_path / "analyses.db"
+    subject = AnalysisStore(database=database)
+
+    subject.add_pending(protocol_id="protocol-id-1", analysis_id="analysis-id-1")
+    subject.update(analysis_id="analysis-id-1", commands=[], errors=[])
+    subject.add_pending(protocol_id="protocol-id-1", analysis_id="analysis-id-2")
+    subject.add_pending(protocol_id="protocol-id-2", analysis_id="analysis-id-3")
+    expected_result = subject.get_by_protocol("protocol-id-2")
+
+    subject.remove_by_protocol("protocol-id-1")
+
+    assert subject.get_by_protocol("protocol-id-1") == []
+    assert subject.get_by_protocol("protocol-id-2") == expected_result
+    assert AnalysisStore(database=database).get_by_protocol("protocol-id-1") == []
+
+
+def test_get_evicted_analysis() -> None:
+    """It should reload a completed analysis that is no longer cached."""
+    subject = AnalysisStore(max_cached=1)
+
+    subject.add_pending(protocol_id="protocol-id-1", analysis_id="analysis-id-1")
+    subject.update(analysis_id="analysis-id-1", commands=[], errors=[])
+    expected_result = subject.get_by_protocol("protocol-id-1")
+
+    subject.add_pending(protocol_id="protocol-id-2", analysis_id="analysis-id-2")
+    subject.update(analysis_id="analysis-id-2", commands=[], errors=[])
+
+    assert subject.get_by_protocol("protocol-id-1") == expected_result
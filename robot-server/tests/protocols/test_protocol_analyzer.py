@@ -4,18 +4,18 @@ from decoy import Decoy
 from datetime import datetime
 
 from opentrons.protocol_engine import commands as pe_commands
-from opentrons.protocol_runner import ProtocolRunner
 
 from robot_server.protocols import ProtocolFileType
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_pool import AnalysisPool, AnalysisOutcome
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def analysis_pool(decoy: Decoy) -> AnalysisPool:
+    """Get a mocked out AnalysisPool."""
+    return decoy.mock(cls=AnalysisPool)
 
 
 @pytest.fixture
@@ -26,19 +26,19 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    analysis_pool: AnalysisPool,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_pool=analysis_pool,
         analysis_store=analysis_store,
     )
 
 
 async def test_analyze(
     decoy: Decoy,
-    protocol_runner: ProtocolRunner,
+    analysis_pool: AnalysisPool,
     analysis_store: AnalysisStore,
     subject: ProtocolAnalyzer,
 ) -> None:
@@ -59,8 +59,8 @@ async def test_analyze(
         )
     ]
 
-    decoy.when(await protocol_runner.run(protocol_resource)).then_return(
-        analysis_commands
+    decoy.when(await analysis_pool.analyze(protocol_resource)).then_return(
+        AnalysisOutcome(commands=analysis_commands, errors=[])
     )
 
     await subject.analyze(
@@ -79,11 +79,11 @@ async def test_analyze(
 
 async def test_analyze_error(
     decoy: Decoy,
-    protocol_runner: ProtocolRunner,
+    analysis_pool: AnalysisPool,
     analysis_store: AnalysisStore,
     subject: ProtocolAnalyzer,
 ) -> None:
-    """It should handle errors raised by the runner."""
+    """It should handle errors raised by the analysis pool."""
     protocol_resource = ProtocolResource(
         protocol_id="protocol-id",
         protocol_type=ProtocolFileType.JSON,
@@ -93,7 +93,7 @@ async def test_analyze_error(
 
     error = RuntimeError("oh no")
 
-    decoy.when(await protocol_runner.run(protocol_resource)).then_raise(error)
+    decoy.when(await analysis_pool.analyze(protocol_resource)).then_raise(error)
 
     await subject.analyze(
         protocol_resource=protocol_resource,
@@ -217,3 +217,24 @@ async def test_remove_missing_protocol_raises(
     """It should raise an error when trying to remove non-existent protocol."""
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
         subject.remove("protocol-id")
+
+
+async def test_load_protocols_from_directory(
+    tmp_path: Path,
+    json_upload_file: UploadFile,
+    subject: ProtocolStore,
+) -> None:
+    """It should pick up protocols saved by a previous store."""
+    created_at = datetime.now()
+
+    expected_result = await subject.create(
+        protocol_id="protocol-id",
+        created_at=created_at,
+        files=[json_upload_file],
+    )
+
+    assert ProtocolStore(directory=tmp_path).get_all() == [expected_result]
+
+    subject.remove("protocol-id")
+
+    assert ProtocolStore(directory=tmp_path).get_all() == []
@@ -1,4 +1,5 @@
 import json
+from datetime import datetime, timezone
 
 import pytest
 from mock import patch
@@ -11,16 +12,23 @@ def test_get_serial_log_with_defaults(api_client):
     res_bytes = logs.encode("utf-8")
     expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get("/logs/serial.log")
         body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-api-serial", DEFAULT_RECORDS, "short")
+        m.assert_called_once_with(
+            "opentrons-api-serial",
+            DEFAULT_RECORDS,
+            "short",
+            cursor=None,
+            since=None,
+            until=None,
+        )
 
 
 @pytest.mark.parametrize(
@@ -42,11 +50,11 @@ def test_get_serial_log_with_params(
     else:
         expected = logs
 
-    async def mock_get_records_dumb(identifier, records, mode):
-        return res_bytes
+    async def mock_stream_records(identifier, records, mode, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get(
             f"/logs/serial.log?format={format_param}&records={records_param}"
         )
@@ -57,7 +65,14 @@ def test_get_serial_log_with_params(
         assert body == expected
         assert response.status_code == 200
 
-        m.assert_called_once_with("opentrons-api-serial", records_param, mode_param)
+        m.assert_called_once_with(
+            "opentrons-api-serial",
+            records_param,
+            mode_param,
+            cursor=None,
+            since=None,
+            until=None,
+        )
 
 
 @pytest.mark.parametrize(
@@ -68,11 +83,11 @@ def test_get_serial_log_with_invalid_params(api_client, format_param, records_pa
     logs = '{"serial": "serial logs"}'
     res_bytes = logs.encode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get(
             f"/logs/serial.log?format={format_param}&records={records_param}"
         )
@@ -85,16 +100,23 @@ def test_get_api_log_with_defaults(api_client):
     res_bytes = logs.encode("utf-8")
     expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get("/logs/api.log")
         body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-api", DEFAULT_RECORDS, "short")
+        m.assert_called_once_with(
+            "opentrons-api",
+            DEFAULT_RECORDS,
+            "short",
+            cursor=None,
+            since=None,
+            until=None,
+        )
 
 
 @pytest.mark.parametrize(
@@ -114,11 +136,11 @@ def test_get_api_log_with_params(api_client, format_param, records_param, mode_p
     else:
         expected = logs
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get(
             f"/logs/api.log?format={format_param}&records={records_param}"
         )
@@ -128,7 +150,14 @@ def test_get_api_log_with_params(api_client, format_param, records_param, mode_p
             body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-api", records_param, mode_param)
+        m.assert_called_once_with(
+            "opentrons-api",
+            records_param,
+            mode_param,
+            cursor=None,
+            since=None,
+            until=None,
+        )
 
 
 @pytest.mark.parametrize(
@@ -139,13 +168,39 @@ def test_get_api_log_with_invalid_params(api_client, format_param, records_param
     logs = '{"api": "application programing interface logs"}'
     res_bytes = logs.encode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
         response = api_client.get(
             f"/logs/api.log?format={format_param}&records={records_param}"
         )
         assert response.status_code == 422
         m.assert_not_called()
+
+
+def test_get_log_filtered(api_client):
+    logs = '{"__CURSOR": "s=abc;i=2", "MESSAGE": "newer"}\n'
+
+    async def mock_stream_records(identifier, records, format_type, **kwargs):
+        yield logs[:10].encode("utf-8")
+        yield logs[10:].encode("utf-8")
+
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = mock_stream_records
+        response = api_client.get(
+            "/logs/server.log?format=json&cursor=s%3Dabc%3Bi%3D1"
+            "&since=2021-03-04T05:06:07Z&until=2021-03-04T06:00:00Z"
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text == logs
+        m.assert_called_once_with(
+            "uvicorn",
+            DEFAULT_RECORDS,
+            "json",
+            cursor="s=abc;i=1",
+            since=datetime(2021, 3, 4, 5, 6, 7, tzinfo=timezone.utc),
+            until=datetime(2021, 3, 4, 6, 0, 0, tzinfo=timezone.utc),
+        )
@@ -102,3 +102,73 @@ def test_ordered_dict():
         "t": type_id(a),
         "v": {"a": {"i": id(b), "t": type_id(b), "v": {"b": 1}}},
     }
+
+
+class B:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+@pytest.fixture
+def serializer():
+    return serialize.ObjectTreeSerializer()
+
+
+def test_serializer_matches_get_object_tree(serializer, instance):
+    root, *_ = instance
+    shared = B(a=1)
+    other = {"x": [B(b=shared), shared], "y": B(c=root, d=(1, 2.5, None))}
+
+    for obj in (root, other, other, root, 1, None):
+        assert serializer.get_object_tree(obj) == serialize.get_object_tree(obj)
+    assert serializer.get_object_tree(root, max_depth=1) == (
+        serialize.get_object_tree(root, max_depth=1)
+    )
+
+
+def test_serializer_reuses_unchanged_subtrees(serializer):
+    leaf = B(value="leaf")
+    commands = [{"description": "one", "children": []}, {"description": "two"}]
+    root = B(commands=commands, leaf=leaf, state="loaded")
+
+    first, _ = serializer.get_object_tree(root)
+    root.state = "running"
+    second, refs = serializer.get_object_tree(root)
+
+    assert (second, refs) == serialize.get_object_tree(root)
+    assert second["v"]["state"] == "running"
+    assert second["v"]["commands"] is first["v"]["commands"]
+    assert second["v"]["leaf"] is first["v"]["leaf"]
+
+
+def test_serializer_picks_up_nested_changes(serializer):
+    leaf = B(value="leaf")
+    commands = [{"description": "one", "children": []}, {"description": "two"}]
+    root = B(commands=commands, leaf=leaf)
+    first, _ = serializer.get_object_tree(root)
+
+    commands[0]["children"].append({"description": "nested"})
+    leaf.value = "changed"
+    second, _ = serializer.get_object_tree(root)
+
+    assert second == serialize.get_object_tree(root)[0]
+    assert second["v"]["leaf"]["v"] == {"value": "changed"}
+    assert second["v"]["commands"][1] is first["v"]["commands"][1]
+
+    # An equal but different object has a different id
+    root.leaf = B(value="changed")
+    third, _ = serializer.get_object_tree(root)
+    assert third["v"]["leaf"]["i"] == id(root.leaf)
+
+
+def test_serializer_references_reached_objects(serializer):
+    shared = B(value=1)
+    holder = B(shared=shared)
+    serializer.get_object_tree(holder)
+
+    # Once the shared object was reached elsewhere first, the cached subtree
+    # would define it a second time rather than refer to it
+    root = [shared, holder]
+    tree, refs = serializer.get_object_tree(root)
+    assert (tree, refs) == serialize.get_object_tree(root)
+    assert tree[1]["v"]["shared"]["v"] is None
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import AsyncGenerator
 
 import pytest
-from notify_server.clients.serdes import TopicEvent
+from mock import MagicMock
+from notify_server.clients.serdes import TopicEvent, to_frames
+from notify_server.clients.subscriber import Subscriber
 from notify_server.models.event import Event
 from notify_server.models.sample_events import SampleTwo
 
@@ -20,10 +21,12 @@ def topic_event() -> TopicEvent:
 
 
 @pytest.fixture
-def mock_subscriber(topic_event) -> AsyncGenerator:
+def mock_subscriber(topic_event) -> MagicMock:
     """A mock subscriber."""
 
     async def _f():
-        yield topic_event
+        yield to_frames(topic=topic_event.topic, event=topic_event.event)
 
-    return _f()
+    subscriber = MagicMock(spec=Subscriber)
+    subscriber.frames.return_value = _f()
+    return subscriber
@@ -1,8 +1,7 @@
-from typing import AsyncGenerator
-
 import pytest
 from mock import MagicMock, patch, DEFAULT
 from starlette.websockets import WebSocket
+from notify_server.clients.serdes import MalformedFrames
 from robot_server.service.notifications import handle_subscriber
 from robot_server.settings import get_settings
 
@@ -29,15 +28,30 @@ async def test_create_subscriber(mock_socket: MagicMock) -> None:
 
 
 async def test_route_events(
-    mock_socket: MagicMock, mock_subscriber: AsyncGenerator, topic_event
+    mock_socket: MagicMock, mock_subscriber: MagicMock, topic_event
 ) -> None:
     """Test that an event is read from subscriber and sent to websocket."""
     with patch.object(handle_subscriber, "send") as mock_send:
         await handle_subscriber.route_events(mock_socket, mock_subscriber)
-        mock_send.assert_called_once_with(mock_socket, topic_event)
+        mock_send.assert_called_once_with(mock_socket, topic_event.json())
+
+
+async def test_route_events_malformed(
+    mock_socket: MagicMock, mock_subscriber: MagicMock
+) -> None:
+    """Test that a malformed event is not sent to the websocket."""
+
+    async def frames():
+        yield [b"some_topic", b'{"publisher": ']
+
+    mock_subscriber.frames.return_value = frames()
+    with patch.object(handle_subscriber, "send") as mock_send:
+        with pytest.raises(MalformedFrames):
+            await handle_subscriber.route_events(mock_socket, mock_subscriber)
+        mock_send.assert_not_called()
 
 
 async def test_send_entry(topic_event, mock_socket: MagicMock) -> None:
     """Test that entry is sent as json."""
-    await handle_subscriber.send(mock_socket, topic_event)
+    await handle_subscriber.send(mock_socket, topic_event.json())
     mock_socket.send_text.assert_called_once_with(topic_event.json())
@@ -1,6 +1,4 @@
-from typing import AsyncGenerator
-
-from mock import patch
+from mock import MagicMock, patch
 
 import pytest
 from starlette.testclient import TestClient
@@ -24,7 +22,7 @@ def test_subscribe_no_topic(api_client: TestClient):
 
 
 def test_integration(
-    api_client: TestClient, mock_subscriber: AsyncGenerator, topic_event
+    api_client: TestClient, mock_subscriber: MagicMock, topic_event
 ) -> None:
     """Test receiving a single event."""
     with patch.object(handle_subscriber, "create", return_value=mock_subscriber):
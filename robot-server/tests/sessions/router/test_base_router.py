@@ -302,6 +302,47 @@ def test_get_session(
     verify_response(response, expected_status=200, expected_data=expected_response)
 
 
+def test_get_session_without_commands(
+    decoy: Decoy,
+    session_view: SessionView,
+    session_store: SessionStore,
+    engine_store: EngineStore,
+    client: TestClient,
+) -> None:
+    """It should leave the commands out of a session if asked to."""
+    created_at = datetime.now()
+    session = SessionResource(
+        session_id="session-id",
+        create_data=BasicSessionCreateData(),
+        created_at=created_at,
+        actions=[],
+    )
+    expected_response = BasicSession(
+        id="session-id",
+        createdAt=created_at,
+        status=SessionStatus.RUNNING,
+        actions=[],
+        commands=None,
+    )
+
+    decoy.when(session_store.get(session_id="session-id")).then_return(session)
+    decoy.when(engine_store.engine.state_view.commands.get_status()).then_return(
+        SessionStatus.RUNNING
+    )
+    decoy.when(
+        session_view.as_response(
+            session=session,
+            commands=None,
+            engine_status=SessionStatus.RUNNING,
+        ),
+    ).then_return(expected_response)
+
+    response = client.get("/sessions/session-id?includeCommands=false")
+
+    verify_response(response, expected_status=200, expected_data=expected_response)
+    decoy.verify(engine_store.engine.state_view.commands.get_all(), times=0)
+
+
 def test_get_session_with_missing_id(
     decoy: Decoy,
     session_store: SessionStore,
@@ -2,54 +2,53 @@
 import pytest
 
 from datetime import datetime
-from decoy import Decoy, matchers
+from decoy import Decoy
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from typing import Callable, Awaitable
 
 from tests.helpers import verify_response
 
 from opentrons.protocol_engine import (
+    CommandSlice,
     CommandStatus,
     commands as pe_commands,
     errors as pe_errors,
 )
 
-from robot_server.service.json_api import ResponseModel
-from robot_server.sessions.session_models import (
-    BasicSession,
-    SessionStatus,
-    SessionCommandSummary,
-)
+from robot_server.sessions.session_models import SessionCommandSummary
+from robot_server.sessions.session_store import SessionStore, SessionNotFoundError
+from robot_server.sessions.session_view import SessionView
 from robot_server.sessions.engine_store import EngineStore
-from robot_server.sessions.router.base_router import get_session as real_get_session
+from robot_server.sessions.router.base_router import SessionNotFound
 from robot_server.sessions.router.commands_router import (
     commands_router,
     CommandNotFound,
 )
 
 
-@pytest.fixture
-def get_session(decoy: Decoy) -> Callable[..., Awaitable[ResponseModel]]:
-    """Get a mock version of the get_session route handler."""
-    return decoy.mock(func=real_get_session)
-
-
 @pytest.fixture(autouse=True)
-def setup_app(
-    get_session: Callable[..., Awaitable[ResponseModel]],
-    app: FastAPI,
-) -> None:
+def setup_app(app: FastAPI) -> None:
     """Setup the FastAPI app with commands routes and dependencies."""
-    app.dependency_overrides[real_get_session] = get_session
     app.include_router(commands_router)
 
 
-async def test_get_session_commands(
+@pytest.fixture
+def command() -> pe_commands.Command:
+    """Get a command to put in the session."""
+    return pe_commands.MoveToWell(
+        id="command-id",
+        status=CommandStatus.RUNNING,
+        createdAt=datetime(year=2022, month=2, day=2),
+        data=pe_commands.MoveToWellData(pipetteId="a", labwareId="b", wellName="c"),
+    )
+
+
+def test_get_session_commands(
     decoy: Decoy,
-    get_session: Callable[..., Awaitable[ResponseModel]],
-    async_client: AsyncClient,
+    session_view: SessionView,
+    engine_store: EngineStore,
+    command: pe_commands.Command,
+    client: TestClient,
 ) -> None:
     """It should return a list of all commands in a session."""
     command_summary = SessionCommandSummary(
@@ -58,41 +57,86 @@ async def test_get_session_commands(
         status=CommandStatus.RUNNING,
     )
 
-    session_response = BasicSession(
-        id="session-id",
-        createdAt=datetime(year=2021, month=1, day=1),
-        status=SessionStatus.RUNNING,
-        actions=[],
-        commands=[command_summary],
-    )
-
     decoy.when(
-        await get_session(
-            sessionId="session-id",
-            session_view=matchers.Anything(),
-            session_store=matchers.Anything(),
-            engine_store=matchers.Anything(),
-        ),
-    ).then_return(ResponseModel(data=session_response))
+        engine_store.engine.state_view.commands.get_slice(
+            cursor=0, length=None, since=None
+        )
+    ).then_return(
+        CommandSlice(commands=[command], cursor=0, total_length=1, revision=2)
+    )
+    decoy.when(session_view.as_command_summaries([command])).then_return(
+        [command_summary]
+    )
 
-    response = await async_client.get("/sessions/session-id/commands")
+    response = client.get("/sessions/session-id/commands")
 
     verify_response(response, expected_status=200, expected_data=[command_summary])
+    assert response.json()["meta"] == {"cursor": 0, "totalLength": 1, "revision": 2}
 
 
-def test_get_session_command_by_id(
+def test_get_session_commands_page_since(
     decoy: Decoy,
+    session_view: SessionView,
     engine_store: EngineStore,
+    command: pe_commands.Command,
     client: TestClient,
 ) -> None:
-    """It should return full details about a command by ID."""
-    command = pe_commands.MoveToWell(
+    """It should return a page of the commands that changed since a revision."""
+    command_summary = SessionCommandSummary(
         id="command-id",
+        commandType="moveToWell",
         status=CommandStatus.RUNNING,
-        createdAt=datetime(year=2022, month=2, day=2),
-        data=pe_commands.MoveToWellData(pipetteId="a", labwareId="b", wellName="c"),
     )
 
+    decoy.when(
+        engine_store.engine.state_view.commands.get_slice(
+            cursor=100, length=10, since=42
+        )
+    ).then_return(
+        CommandSlice(commands=[command], cursor=100, total_length=10000, revision=43)
+    )
+    decoy.when(session_view.as_command_summaries([command])).then_return(
+        [command_summary]
+    )
+
+    response = client.get(
+        "/sessions/session-id/commands?cursor=100&pageLength=10&since=42"
+    )
+
+    verify_response(response, expected_status=200, expected_data=[command_summary])
+    assert response.json()["meta"] == {
+        "cursor": 100,
+        "totalLength": 10000,
+        "revision": 43,
+    }
+
+
+def test_get_session_commands_missing_session(
+    decoy: Decoy,
+    session_store: SessionStore,
+    client: TestClient,
+) -> None:
+    """It should 404 if the session does not exist."""
+    not_found_error = SessionNotFoundError(session_id="session-id")
+
+    decoy.when(session_store.get(session_id="session-id")).then_raise(not_found_error)
+
+    response = client.get("/sessions/session-id/commands")
+
+    verify_response(
+        response,
+        expected_status=404,
+        expected_errors=SessionNotFound(detail=str(not_found_error)),
+    )
+
+
+def test_get_session_command_by_id(
+    decoy: Decoy,
+    engine_store: EngineStore,
+    command: pe_commands.Command,
+    client: TestClient,
+) -> None:
+    """It should return full details about a command by ID."""
     decoy.when(engine_store.engine.state_view.commands.get("command-id")).then_return(
         command
     )
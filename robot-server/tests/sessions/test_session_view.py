@@ -200,6 +200,31 @@ def test_to_response_maps_commands() -> None:
     )
 
 
+def test_to_response_without_commands() -> None:
+    """It should leave the commands out of the response if not given."""
+    session_resource = SessionResource(
+        session_id="session-id",
+        create_data=BasicSessionCreateData(),
+        created_at=datetime(year=2021, month=1, day=1),
+        actions=[],
+    )
+
+    subject = SessionView()
+    result = subject.as_response(
+        session=session_resource,
+        commands=None,
+        engine_status=EngineStatus.RUNNING,
+    )
+
+    assert result == BasicSession(
+        id="session-id",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=SessionStatus.RUNNING,
+        actions=[],
+        commands=None,
+    )
+
+
 def test_create_action(current_time: datetime) -> None:
     """It should create a control action and add it to the session."""
     session_created_at = datetime.now()
@@ -36,8 +36,11 @@ def test_api_versioning(api_client, headers, expected_version):
 
 @pytest.fixture
 def mock_log_control():
-    with patch("opentrons.system.log_control.get_records_dumb") as p:
-        p.return_value = b""
+    async def mock_stream_records(*args, **kwargs):
+        yield b""
+
+    with patch("opentrons.system.log_control.stream_records") as p:
+        p.side_effect = mock_stream_records
         yield p
 
 
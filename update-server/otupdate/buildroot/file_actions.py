@@ -11,9 +11,11 @@ import enum
 import hashlib
 import logging
 import os
+import queue
 import re
 import subprocess
 import tempfile
+import threading
 from typing import (Callable, Dict, List, Mapping, NamedTuple,
                     Optional, Sequence, Tuple)
 import zipfile
@@ -23,6 +25,10 @@ ROOTFS_SIG_NAME = 'rootfs.ext4.hash.sig'
 ROOTFS_HASH_NAME = 'rootfs.ext4.hash'
 ROOTFS_NAME = 'rootfs.ext4'
 UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
+#: The size of the chunks streamed from the update zip to the partition
+STREAM_CHUNK_SIZE = 1024 * 1024
+#: How many chunks may be waiting to be written to the partition
+STREAM_QUEUE_DEPTH = 8
 LOG = logging.getLogger(__name__)
 
 
@@ -36,6 +42,14 @@ class RootPartitions(enum.Enum):
     THREE: Partition = Partition(3, '/dev/mmcblk0p3')
 
 
+class CheckedUpdate(NamedTuple):
+    """ An update zip whose contents have been checked by
+    :py:meth:`check_update`, ready for :py:meth:`stream_update` """
+    filepath: str
+    rootfs_size: int
+    rootfs_hash: bytes
+
+
 class SignatureMismatch(ValueError):
     def __init__(self, message):
         self.message = message
@@ -115,28 +129,14 @@ def unzip_update(filepath: str,
     :raises FileMissing: If a mandatory file is missing
     """
     assert chunk_size
-    total_size = 0
     written_size = 0
-    to_unzip: List[zipfile.ZipInfo] = []
     file_paths: Dict[str, Optional[str]] = {fn: None
                                             for fn in acceptable_files}
     file_sizes: Dict[str, int] = {fn: 0 for fn in acceptable_files}
     LOG.info(f"Unzipping {filepath}")
     with zipfile.ZipFile(filepath, 'r') as zf:
-        files = zf.infolist()
-        remaining_filenames = [fn for fn in acceptable_files]
-        for fi in files:
-            if fi.filename in acceptable_files:
-                to_unzip.append(fi)
-                total_size += fi.file_size
-                remaining_filenames.remove(fi.filename)
-                LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
-            else:
-                LOG.debug(f"Ignoring {fi.filename}")
-
-        for name in remaining_filenames:
-            if name in mandatory_files:
-                raise FileMissing(f'File {name} missing from zip')
+        to_unzip = _find_update_files(zf, acceptable_files, mandatory_files)
+        total_size = sum(fi.file_size for fi in to_unzip)
 
         for fi in to_unzip:
             uncomp_path = os.path.join(os.path.dirname(filepath), fi.filename)
@@ -159,6 +159,29 @@ def unzip_update(filepath: str,
     return file_paths, file_sizes
 
 
+def _find_update_files(zf: zipfile.ZipFile,
+                       acceptable_files: Sequence[str],
+                       mandatory_files: Sequence[str]) -> List[zipfile.ZipInfo]:
+    """ Find the acceptable files in an update zip
+
+    :raises FileMissing: If a mandatory file is missing
+    """
+    found: List[zipfile.ZipInfo] = []
+    remaining_filenames = [fn for fn in acceptable_files]
+    for fi in zf.infolist():
+        if fi.filename in acceptable_files:
+            found.append(fi)
+            remaining_filenames.remove(fi.filename)
+            LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
+        else:
+            LOG.debug(f"Ignoring {fi.filename}")
+
+    for name in remaining_filenames:
+        if name in mandatory_files:
+            raise FileMissing(f'File {name} missing from zip')
+    return found
+
+
 def hash_file(path: str,
               progress_callback: Callable[[float], None],
               chunk_size: int = 1024,
@@ -355,6 +378,138 @@ def write_update(rootfs_filepath: str,
     return unused
 
 
+def check_update(filepath: str,
+                 progress_callback: Callable[[float], None],
+                 cert_path: Optional[str]) -> CheckedUpdate:
+    """ Worker for validation. Call in an executor (so it can return things)
+
+    Checks everything about an update zip that can be checked without reading
+    the rootfs, so that it can then be written with :py:meth:`stream_update`
+    in a single pass:
+
+    - The zip contains the rootfs and its hash
+    - If requested, the signature of the hash is valid
+
+    Unlike :py:meth:`validate_update`, nothing is unzipped to disk; only the
+    small hash and signature files are read.
+
+    :param filepath: The path to the update zip file
+    :param progress_callback: The function to call with progress between 0
+                              and 1.0
+    :param cert_path: Path to an x.509 certificate to check the signature
+                      against. If ``None``, signature checking is disabled
+    :returns: The checked update, to pass to :py:meth:`stream_update`
+
+    Will also raise an exception if validation fails
+    """
+    required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
+    if cert_path:
+        required.append(ROOTFS_SIG_NAME)
+
+    with zipfile.ZipFile(filepath, 'r') as zf:
+        files = {fi.filename: fi
+                 for fi in _find_update_files(zf, UPDATE_FILES, required)}
+        packaged_hash = zf.read(files[ROOTFS_HASH_NAME])
+        signature = zf.read(files[ROOTFS_SIG_NAME]) if cert_path else None
+
+    if cert_path:
+        assert signature is not None
+        with tempfile.TemporaryDirectory() as sig_dir:
+            hashfile = os.path.join(sig_dir, ROOTFS_HASH_NAME)
+            sigfile = os.path.join(sig_dir, ROOTFS_SIG_NAME)
+            with open(hashfile, 'wb') as hf, open(sigfile, 'wb') as sf:
+                hf.write(packaged_hash)
+                sf.write(signature)
+            verify_signature(hashfile, sigfile, cert_path)
+
+    progress_callback(1.0)
+    return CheckedUpdate(filepath=filepath,
+                         rootfs_size=files[ROOTFS_NAME].file_size,
+                         rootfs_hash=packaged_hash.strip())
+
+
+def _write_chunks(chunks: 'queue.Queue[Optional[bytes]]',
+                  outfile: str,
+                  errors: List[BaseException]):
+    """ Write chunks from a queue to a file until a ``None`` arrives """
+    try:
+        with open(outfile, 'wb') as part:
+            chunk = chunks.get()
+            while chunk is not None:
+                part.write(chunk)
+                chunk = chunks.get()
+    except BaseException as e:
+        errors.append(e)
+        # keep consuming so the producer never blocks on a full queue
+        while chunks.get() is not None:
+            pass
+
+
+def stream_update(update: CheckedUpdate,
+                  progress_callback: Callable[[float], None],
+                  chunk_size: int = STREAM_CHUNK_SIZE) -> RootPartitions:
+    """
+    Write the rootfs of a checked update to the next root partition, hashing
+    it on the way
+
+    The rootfs is read out of the zip once: each chunk is hashed and handed
+    to a writer thread, which writes it to the partition while the next
+    chunk is decompressed. This replaces unzipping, hashing and copying the
+    rootfs in three separate passes.
+
+    The hash is checked once the whole rootfs is written. If it doesn't
+    match, :py:class:`HashMismatch` is raised and the partition must not be
+    committed.
+
+    :param update: The update, as checked by :py:meth:`check_update`
+    :param progress_callback: A callback to call periodically with progress
+                              between 0 and 1.0. May never reach precisely
+                              1.0, best only for user information.
+    :param chunk_size: The size of the chunks to stream
+    :returns: The root partition that the rootfs image was written to, e.g.
+              ``RootPartitions.TWO`` or ``RootPartitions.THREE``.
+    """
+    unused = _find_unused_partition()
+    part_path = unused.value.path
+    hasher = hashlib.sha256()
+    have_read = 0
+    chunks: 'queue.Queue[Optional[bytes]]' = queue.Queue(STREAM_QUEUE_DEPTH)
+    errors: List[BaseException] = []
+    writer = threading.Thread(target=_write_chunks,
+                              args=(chunks, part_path, errors),
+                              name='update-partition-writer',
+                              daemon=True)
+    LOG.info(f'stream_update: writing {ROOTFS_NAME} from {update.filepath}'
+             f' ({update.rootfs_size}B) to {part_path}'
+             f' in {chunk_size}B chunks')
+    writer.start()
+    try:
+        with zipfile.ZipFile(update.filepath, 'r') as zf:
+            with zf.open(ROOTFS_NAME) as zipped:
+                while not errors:
+                    chunk = zipped.read(chunk_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    chunks.put(chunk)
+                    have_read += len(chunk)
+                    progress_callback(have_read / update.rootfs_size)
+    finally:
+        chunks.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+    rootfs_hash = binascii.hexlify(hasher.digest())
+    if rootfs_hash != update.rootfs_hash:
+        msg = f"Hash mismatch: calculated {rootfs_hash!r} != "\
+            f"packaged {update.rootfs_hash!r}"
+        LOG.error(msg)
+        raise HashMismatch(msg)
+    return unused
+
+
 def _mountpoint_root():
     """ provides mountpoint location for :py:meth:`mount_update`.
 
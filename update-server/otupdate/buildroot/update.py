@@ -10,7 +10,7 @@ import logging
 import os
 from subprocess import CalledProcessError
 
-from typing import Optional
+from typing import Awaitable, Optional
 
 
 from aiohttp import web, BodyPartReader
@@ -20,6 +20,7 @@ from . import config, file_actions
 from .update_session import UpdateSession, Stages
 
 SESSION_VARNAME = APP_VARIABLE_PREFIX + 'session'
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 LOG = logging.getLogger(__name__)
 
 
@@ -77,21 +78,36 @@ async def status(request: web.Request, session: UpdateSession) -> web.Response:
 
 
 async def _save_file(part: BodyPartReader, path: str):
+    """ Save an uploaded file, writing each chunk in an executor while the
+    next one is received """
+    loop = asyncio.get_event_loop()
+    pending: Optional[Awaitable[int]] = None
     with open(os.path.join(path, part.name), 'wb') as write:
-        while not part.at_eof():
-            chunk = await part.read_chunk()
-            decoded = part.decode(chunk)
-            write.write(decoded)
+        try:
+            while not part.at_eof():
+                chunk = await part.read_chunk(size=UPLOAD_CHUNK_SIZE)
+                decoded = part.decode(chunk)
+                if pending:
+                    await pending
+                pending = loop.run_in_executor(None, write.write, decoded)
+        finally:
+            # The file can't be closed while a chunk is being written to it
+            if pending:
+                await pending
 
 
 def _begin_write(session: UpdateSession,
                  loop: asyncio.AbstractEventLoop,
-                 rootfs_file_path: str):
-    """ Start the write process. """
+                 checked_update: file_actions.CheckedUpdate):
+    """ Start the write process.
+
+    The rootfs is hashed as it is written, so a hash mismatch shows up as an
+    error in this stage and the update can't be committed.
+    """
     session.set_progress(0)
     session.set_stage(Stages.WRITING)
     write_future = asyncio.ensure_future(loop.run_in_executor(
-        None, file_actions.write_update, rootfs_file_path,
+        None, file_actions.stream_update, checked_update,
         session.set_progress))
 
     def write_done(fut):
@@ -118,7 +134,7 @@ def _begin_validation(
 
     validation_future \
         = asyncio.ensure_future(loop.run_in_executor(
-            None, file_actions.validate_update,
+            None, file_actions.check_update,
             downloaded_update_path, session.set_progress, cert_path))
 
     def validation_done(fut):
@@ -127,11 +143,11 @@ def _begin_validation(
             session.set_error(getattr(exc, 'short', str(type(exc))),
                               str(exc))
         else:
-            rootfs_file = fut.result()
+            checked_update = fut.result()
             loop.call_soon_threadsafe(_begin_write,
                                       session,
                                       loop,
-                                      rootfs_file)
+                                      checked_update)
     validation_future.add_done_callback(validation_done)
     return validation_future
 
@@ -200,6 +200,85 @@ def test_write_update(extracted_update_file, testing_partition):
             'rb').read().strip()
 
 
+def test_check_update(downloaded_update_file, testing_cert):
+    cb = mock.Mock()
+    checked = file_actions.check_update(downloaded_update_file, cb,
+                                        testing_cert)
+    with zipfile.ZipFile(downloaded_update_file, 'r') as zf:
+        assert checked.rootfs_hash == zf.read('rootfs.ext4.hash').strip()
+        assert checked.rootfs_size == zf.getinfo('rootfs.ext4').file_size
+    assert checked.filepath == downloaded_update_file
+    cb.assert_called_once_with(1.0)
+    # nothing should have been unzipped
+    assert sorted(os.listdir(os.path.dirname(downloaded_update_file)))\
+        == ['ot2-system.zip']
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_check_update_hash_only(downloaded_update_file):
+    cb = mock.Mock()
+    checked = file_actions.check_update(downloaded_update_file, cb, None)
+    assert checked.rootfs_size == 100000
+
+
+@pytest.mark.bad_sig
+def test_check_update_catches_bad_sig(downloaded_update_file, testing_cert):
+    cb = mock.Mock()
+    with pytest.raises(file_actions.SignatureMismatch):
+        file_actions.check_update(downloaded_update_file, cb, testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_check_update_catches_missing_sig(downloaded_update_file,
+                                          testing_cert):
+    cb = mock.Mock()
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.check_update(downloaded_update_file, cb, testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_check_update_catches_missing_image(downloaded_update_file,
+                                            testing_cert):
+    cb = mock.Mock()
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.check_update(downloaded_update_file, cb, testing_cert)
+
+
+def test_stream_update(downloaded_update_file, testing_cert,
+                       testing_partition):
+    checked = file_actions.check_update(downloaded_update_file, mock.Mock(),
+                                        testing_cert)
+    cb = mock.Mock()
+    part = file_actions.stream_update(checked, cb, chunk_size=4096)
+    assert part.value.path == testing_partition
+
+    # one progress call per chunk
+    assert cb.call_count == (checked.rootfs_size + 4095) // 4096
+    assert cb.call_args == mock.call(1.0)
+
+    with zipfile.ZipFile(downloaded_update_file, 'r') as zf:
+        assert open(testing_partition, 'rb').read()\
+            == zf.read('rootfs.ext4')
+
+
+@pytest.mark.bad_hash
+def test_stream_update_catches_bad_hash(downloaded_update_file,
+                                        testing_partition):
+    checked = file_actions.check_update(downloaded_update_file, mock.Mock(),
+                                        None)
+    with pytest.raises(file_actions.HashMismatch):
+        file_actions.stream_update(checked, mock.Mock(), chunk_size=4096)
+
+
+def test_stream_update_catches_write_failure(downloaded_update_file,
+                                             testing_partition):
+    checked = file_actions.check_update(downloaded_update_file, mock.Mock(),
+                                        None)
+    os.mkdir(testing_partition)
+    with pytest.raises(IsADirectoryError):
+        file_actions.stream_update(checked, mock.Mock(), chunk_size=1024)
+
+
 def test_commit_update(monkeypatch):
     unused = file_actions.RootPartitions.TWO
     new = file_actions.RootPartitions.TWO
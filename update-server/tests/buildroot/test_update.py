@@ -3,6 +3,7 @@
 import asyncio
 import binascii
 import hashlib
+import time
 import zipfile
 
 import pytest
@@ -168,3 +169,59 @@ async def test_update_catches_validation_fail(test_cli, update_session,
         body = await resp.json()
     assert body['stage'] == 'error'
     assert body['error'] == 'File Missing'
+
+
+@pytest.mark.bad_hash
+@pytest.mark.no_signature_required
+async def test_update_catches_hash_mismatch(test_cli, update_session,
+                                            downloaded_update_file, loop,
+                                            testing_partition):
+    resp = await test_cli.post(
+        session_endpoint(update_session, 'file'),
+        data={'ot2-system.zip': open(downloaded_update_file, 'rb')})
+    assert resp.status == 201
+    body = await resp.json()
+    # the hash is only checked once the rootfs has been streamed out
+    while body['stage'] in ('validating', 'writing'):
+        resp = await test_cli.get(
+            session_endpoint(update_session, 'status'))
+        body = await resp.json()
+    assert body['stage'] == 'error'
+    assert body['error'] == 'Hash Mismatch'
+
+
+async def test_save_file_finishes_write_on_error(tmpdir, monkeypatch):
+    class FakePart:
+        name = 'ot2-system.zip'
+        reads = 0
+
+        def at_eof(self):
+            return False
+
+        async def read_chunk(self, size):
+            self.reads += 1
+            if self.reads > 1:
+                raise ConnectionResetError('upload interrupted')
+            return b'chunk'
+
+        def decode(self, chunk):
+            return chunk
+
+    class SlowFile:
+        def __init__(self, path, mode):
+            self._file = open(path, mode)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._file.close()
+
+        def write(self, data):
+            time.sleep(0.1)
+            return self._file.write(data)
+
+    monkeypatch.setattr(update, 'open', SlowFile, raising=False)
+    with pytest.raises(ConnectionResetError):
+        await update._save_file(FakePart(), str(tmpdir))
+    assert tmpdir.join('ot2-system.zip').read_binary() == b'chunk'